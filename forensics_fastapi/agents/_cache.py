@@ -0,0 +1,76 @@
+import hashlib
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+_WHITESPACE = re.compile(r"\s+")
+_MISSING = object()
+
+
+def _normalize(value: Any) -> Any:
+    # Collapse whitespace inside strings before json.dumps escapes \n / \t
+    if isinstance(value, str):
+        return _WHITESPACE.sub(" ", value).strip()
+    if isinstance(value, dict):
+        return {k: _normalize(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v) for v in value]
+    return value
+
+
+def canonical_key(*parts: Any) -> str:
+    """
+    Stable hash of the given parts. Dict keys are sorted and runs of whitespace
+    in string values collapsed so re-wrapped copies of the same template text
+    share one entry.
+    """
+    text = json.dumps(_normalize(parts), sort_keys=True, default=str)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class TTLCache:
+    """
+    Small thread-safe LRU cache with a per-entry time-to-live.
+    Entries are namespaced (e.g. by engagement id) so one engagement can be
+    invalidated without dropping the others.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Tuple[str, Hashable], Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, namespace: str, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get((namespace, key), _MISSING)
+            if entry is _MISSING:
+                return default
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[(namespace, key)]
+                return default
+            self._data.move_to_end((namespace, key))
+            return value
+
+    def set(self, namespace: str, key: Hashable, value: Any, ttl: Optional[float] = None):
+        with self._lock:
+            self._data[(namespace, key)] = (time.monotonic() + (ttl or self.ttl), value)
+            self._data.move_to_end((namespace, key))
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, namespace: Optional[str] = None):
+        """Drop every entry in `namespace`, or everything when omitted."""
+        with self._lock:
+            if namespace is None:
+                self._data.clear()
+                return
+            for k in [k for k in self._data if k[0] == namespace]:
+                del self._data[k]
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -1,21 +1,158 @@
-from ..forensics.remote_worker_api import RemoteWorkerClient
+import asyncio
+import os
+from collections import deque
+from typing import Deque, Dict, Optional, Set
+
+from ..core.worker_ai import SemanticCache, WorkerAI
+from ..forensics.remote_worker_api import RemoteWorkerClient, get_remote_worker_client
+from ._cache import TTLCache, canonical_key
+
+# Read-only actions whose results can be reused for identical payloads.
+# Anything not listed here (e.g. setStrategyMode) always goes to the Worker.
+INFORMATIONAL_ACTIONS = frozenset(
+    {
+        "analyzeContent",
+        "analyzeContentBatch",
+        "classifyBatch",
+        "draftReply",
+        "realityCheck",
+    }
+)
+
+# Informational actions whose free-text field is also matched by embedding
+# similarity, so re-worded copies of the same template share one response.
+# The other payload fields must still match exactly.
+SEMANTIC_FIELDS = {
+    "analyzeContent": "content",
+    "realityCheck": "draftText",
+}
+# bge-base reads ~512 tokens; longer texts could differ past the cut-off, so
+# they only get exact matches
+_SEMANTIC_MAX_CHARS = 2000
+
+# Map simplified names to Worker Bindings
+_AGENT_MAP = {
+    "classifier": "CLASSIFIER_AGENT",
+    "forensic": "FORENSICS_AGENT",
+    "rag": "RAG_AGENT",
+    "strategy": "STRATEGY_AGENT",  # If generic agent used
+}
+
+# Trace events are buffered and posted in batches instead of one POST each
+_LOG_FLUSH_INTERVAL = 0.5
+_LOG_FLUSH_SIZE = 50
+
+# "Agent Action Complete" traces carry no data; opt in with AGENT_TRACE_SUCCESS=1
+_TRACE_SUCCESS = os.getenv("AGENT_TRACE_SUCCESS", "").lower() in {"1", "true", "yes"}
+
+_RESPONSE_CACHE = TTLCache(
+    maxsize=int(os.getenv("AGENT_CACHE_SIZE", "2048")),
+    ttl=float(os.getenv("AGENT_CACHE_TTL", "3600")),
+)
+_SEMANTIC_CACHE = SemanticCache(ttl=float(os.getenv("AGENT_CACHE_TTL", "3600")))
+_EMBEDDER = WorkerAI()
 
 
 class BaseAgentClient:
+    _log_buffer: Deque[Dict] = deque()
+    _flush_task: Optional[asyncio.Task] = None
+    # Strong references to size-triggered flushes (the loop only keeps weak ones)
+    _flush_pending: Set[asyncio.Task] = set()
+
     def __init__(self, agent_type: str, engagement_id: str = "default"):
-        self.client = RemoteWorkerClient()
+        self.client = get_remote_worker_client()
         self.agent_type = agent_type
         self.engagement_id = engagement_id
+        self.worker_agent_name = _AGENT_MAP.get(agent_type, agent_type.upper())
+        self._step_prefix = f"{agent_type}."
+
+    @staticmethod
+    def invalidate_cache(engagement_id: Optional[str] = None):
+        """Forget cached agent responses for one engagement (or all of them)."""
+        _RESPONSE_CACHE.invalidate(engagement_id)
+        _SEMANTIC_CACHE.invalidate(engagement_id)
+
+    async def _semantic_key(self, action: str, payload: dict):
+        """(namespace, vector) for a similarity lookup, or None if the action/payload doesn't qualify."""
+        field = SEMANTIC_FIELDS.get(action)
+        text = payload.get(field) if field else None
+        if not isinstance(text, str) or not text.strip() or len(text) > _SEMANTIC_MAX_CHARS:
+            return None
+        rest = {k: v for k, v in payload.items() if k != field}
+        vectors = await asyncio.to_thread(_EMBEDDER.generate_embeddings, [text])
+        if not vectors:
+            return None
+        namespace = (self.engagement_id, self.agent_type, action, canonical_key(rest))
+        return namespace, vectors[0]
 
-    def _invoke(self, action: str, payload: dict) -> dict:
+    def _buffer_event(self, **fields):
+        """Queue a trace event; a background task posts the buffer periodically."""
+        BaseAgentClient._log_buffer.append(
+            RemoteWorkerClient.build_log_payload(workflow_id=self.engagement_id, **fields)
+        )
+        task = BaseAgentClient._flush_task
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            BaseAgentClient._flush_task = asyncio.create_task(BaseAgentClient._flush_loop())
+        if len(BaseAgentClient._log_buffer) >= _LOG_FLUSH_SIZE:
+            flush = asyncio.create_task(BaseAgentClient.flush_logs())
+            BaseAgentClient._flush_pending.add(flush)
+            flush.add_done_callback(BaseAgentClient._flush_pending.discard)
+
+    @staticmethod
+    async def _flush_loop():
+        # Exits once the buffer drains; the next _buffer_event starts a new loop
+        while True:
+            await asyncio.sleep(_LOG_FLUSH_INTERVAL)
+            await BaseAgentClient.flush_logs()
+            if not BaseAgentClient._log_buffer:
+                return
+
+    @staticmethod
+    async def flush_logs():
+        """Post every buffered trace event in a single batch request."""
+        buffer = BaseAgentClient._log_buffer
+        events = [buffer.popleft() for _ in range(len(buffer))]
+        if events:
+            await asyncio.to_thread(get_remote_worker_client().log_events, events)
+
+    @staticmethod
+    async def shutdown_logs():
+        """Stop the background flusher and send whatever is still buffered."""
+        task = BaseAgentClient._flush_task
+        if task is not None and not task.done():
+            task.cancel()
+        BaseAgentClient._flush_task = None
+        await BaseAgentClient.flush_logs()
+        if BaseAgentClient._flush_pending:
+            await asyncio.gather(*BaseAgentClient._flush_pending, return_exceptions=True)
+
+    async def _invoke(self, action: str, payload: dict) -> dict:
         """
         Invokes the remote Worker Agent and logs the attempt and result.
+        The blocking RemoteWorkerClient calls run in a worker thread so that
+        several agent actions can be awaited concurrently (asyncio.gather).
+        Informational actions are answered from the response cache when the
+        same payload was already sent for this engagement, or (for
+        SEMANTIC_FIELDS actions) a near-duplicate of its text was.
         """
+        cache_key = semantic = None
+        if action in INFORMATIONAL_ACTIONS:
+            cache_key = canonical_key(self.agent_type, action, payload)
+            cached = _RESPONSE_CACHE.get(self.engagement_id, cache_key)
+            if cached is not None:
+                return cached
+            semantic = await self._semantic_key(action, payload)
+            if semantic is not None:
+                cached = _SEMANTIC_CACHE.lookup(*semantic)
+                if cached is not None:
+                    return cached
+
+        step_name = self._step_prefix + action
+
         # 1. Trace Start
-        self.client.log_event(
+        self._buffer_event(
             type="INFO",
-            workflow_id=self.engagement_id,
-            step_name=f"{self.agent_type}.{action}",
+            step_name=step_name,
             message=f"Invoking Agent Action: {action}",
             action_type="AGENT_CALL",
             metadata={
@@ -27,44 +164,39 @@ class BaseAgentClient:
             # 2. Call Worker API (Matches the generic protocol in internal.ts)
             # internal.ts expects: agentName (Enum), agentId, action, payload
 
-            # Map simplified names to Worker Bindings
-            agent_map = {
-                "classifier": "CLASSIFIER_AGENT",
-                "forensic": "FORENSICS_AGENT",
-                "rag": "RAG_AGENT",
-                "strategy": "STRATEGY_AGENT",  # If generic agent used
-            }
-            worker_agent_name = agent_map.get(self.agent_type, self.agent_type.upper())
-
             # Use generic run_agent helper from RemoteWorkerClient
-            response = self.client.run_agent(
-                agent_name=worker_agent_name,
+            response = await asyncio.to_thread(
+                self.client.run_agent,
+                agent_name=self.worker_agent_name,
                 action=action,
                 payload=payload,
                 agent_id=self.engagement_id,
             )
 
             # 3. Trace Success
-            self.client.log_event(
-                type="INFO",
-                workflow_id=self.engagement_id,
-                step_name=f"{self.agent_type}.{action}",
-                message="Agent Action Complete",
-                action_type="AGENT_RESULT",
-                metadata={"status": "success"},
-            )
+            if _TRACE_SUCCESS:
+                self._buffer_event(
+                    type="INFO",
+                    step_name=step_name,
+                    message="Agent Action Complete",
+                    action_type="AGENT_RESULT",
+                    metadata={"status": "success"},
+                )
 
             # Result is already unpacked by run_agent usually, but check
             # internal.ts /agent/run returns { result: data }
             # RemoteWorkerClient.run_agent returns resp.get("result")
+            if cache_key is not None and response is not None:
+                _RESPONSE_CACHE.set(self.engagement_id, cache_key, response)
+                if semantic is not None:
+                    _SEMANTIC_CACHE.store(*semantic, response)
             return response
 
         except Exception as e:
             # 4. Trace Failure
-            self.client.log_event(
+            self._buffer_event(
                 type="ERROR",
-                workflow_id=self.engagement_id,
-                step_name=f"{self.agent_type}.{action}",
+                step_name=step_name,
                 message=str(e),
                 error_type="AGENT_FAILURE",
             )
@@ -1,17 +1,58 @@
+import asyncio
+import os
 from typing import Dict, List
 
 from .base import BaseAgentClient
 
+# Items per analyzeContentBatch RPC (matches the Worker's preferred batch size)
+ANALYZE_BATCH_SIZE = 64
+# The Worker's analyzeContentBatch action hasn't shipped yet; until it does,
+# analyze_content_batch falls back to one analyzeContent RPC per item.
+_BATCH_ANALYZE = os.getenv("AGENT_BATCH_ANALYZE", "").lower() in {"1", "true", "yes"}
+
 
 class ForensicAnalystAgent(BaseAgentClient):
     def __init__(self, engagement_id: str):
         super().__init__("forensic", engagement_id)
 
-    def analyze_content(self, content: str, context: str = "") -> Dict:
-        return self._invoke("analyzeContent", {"content": content, "context": context})
+    async def analyze_content(self, content: str, context: str = "") -> Dict:
+        return await self._invoke("analyzeContent", {"content": content, "context": context})
+
+    async def analyze_content_many(self, contents: List[str], context: str = "") -> List[Dict]:
+        """Analyze independent content strings concurrently (one RPC each)."""
+        return await asyncio.gather(*[self.analyze_content(c, context) for c in contents])
+
+    async def analyze_content_batch(self, items: List[Dict[str, str]]) -> List[Dict]:
+        """
+        Analyze many items with one round-trip per ANALYZE_BATCH_SIZE chunk
+        (requires AGENT_BATCH_ANALYZE; otherwise one analyzeContent RPC per item).
+        Input: [{'content': '...', 'context': '...'}]
+        Output: one analysis dict per item, in input order.
+        """
+        if not _BATCH_ANALYZE:
+            return await asyncio.gather(
+                *[self.analyze_content(i["content"], i.get("context", "")) for i in items]
+            )
+
+        chunks = [
+            items[i : i + ANALYZE_BATCH_SIZE] for i in range(0, len(items), ANALYZE_BATCH_SIZE)
+        ]
+        responses = await asyncio.gather(
+            *[self._invoke("analyzeContentBatch", {"items": chunk}) for chunk in chunks]
+        )
+        results: List[Dict] = []
+        for chunk, response in zip(chunks, responses):
+            # A short or missing response would pair later results with the wrong inputs
+            if not isinstance(response, list) or len(response) != len(chunk):
+                got = len(response) if isinstance(response, list) else type(response).__name__
+                raise ValueError(
+                    f"analyzeContentBatch returned {got} results for {len(chunk)} items"
+                )
+            results.extend(response)
+        return results
 
-    def enrich_timeline(self, messages: List[Dict]) -> Dict:
-        return self._invoke(
+    async def enrich_timeline(self, messages: List[Dict]) -> Dict:
+        return await self._invoke(
             "enrichTimeline",
             {"messages": messages, "metadata": {"engagementId": self.engagement_id}},
         )
@@ -1,16 +1,39 @@
+import functools
+import json
 from typing import Dict, Optional
 
 from ..forensics.remote_worker_api import RemoteWorkerClient
+from ._cache import TTLCache
+
+# Lookup results from the public SF/CA systems change slowly, so each tool
+# keeps its own bounded cache (one busy tool cannot evict another's entries).
+_TOOL_CACHE_SIZE = 256
+_TOOL_CACHE_TTL = 3600.0
 
 
 class RegulatoryAgentBase:
     """Base class for regulatory agent wrappers."""
 
+    AGENT_NAME = ""
+    _tool_caches: Dict[str, TTLCache] = {}
+
     def __init__(self, client: RemoteWorkerClient, engagement_id: str):
         self.client = client
         self.engagement_id = engagement_id
+        # Agent binding and instance id never change per wrapper, so bind them once
+        self._run = functools.partial(
+            client.run_agent,
+            agent_name=self.AGENT_NAME,
+            agent_id=engagement_id,  # Use engagement ID for stateful/specific agent instance
+        )
 
-    def _run_tool(self, agent_name: str, tool_name: str, args: Dict) -> str:
+    @classmethod
+    def engagement_refresh(cls, engagement_id: str):
+        """Drop one engagement's cached regulatory lookups (e.g. when it is re-run)."""
+        for cache in cls._tool_caches.values():
+            cache.invalidate(engagement_id)
+
+    def _run_tool(self, tool_name: str, args: Dict) -> str:
         """Helper to invoke a specific tool on the remote agent."""
         # Use the generic 'run_agent' which posts to /agent/run
         # The 'action' in 'run_agent' maps to the 'action' in 'internal.ts',
@@ -38,12 +61,22 @@ class RegulatoryAgentBase:
         # But let's assume the user knows what they are asking: "implement methods that map to... remote calls".
         # I will send the tool name as the "action".
 
-        return self.client.run_agent(
-            agent_name=agent_name,
-            action=tool_name,  # e.g. "lookup_contractor_history"
-            payload=args,
-            agent_id=self.engagement_id,  # Use engagement ID for stateful/specific agent instance
-        )
+        cache = RegulatoryAgentBase._tool_caches.get(tool_name)
+        if cache is None:
+            cache = RegulatoryAgentBase._tool_caches.setdefault(
+                tool_name, TTLCache(maxsize=_TOOL_CACHE_SIZE, ttl=_TOOL_CACHE_TTL)
+            )
+        # The call goes to the engagement's own agent instance, so its results
+        # are namespaced by engagement as well as by agent
+        cache_key = (self.AGENT_NAME, json.dumps(args, sort_keys=True))
+        cached = cache.get(self.engagement_id, cache_key)
+        if cached is not None:
+            return cached
+
+        result = self._run(action=tool_name, payload=args)  # e.g. "lookup_contractor_history"
+        if result is not None:
+            cache.set(self.engagement_id, cache_key, result)
+        return result
 
 
 class SfDbiAgent(RegulatoryAgentBase):
@@ -54,7 +87,6 @@ class SfDbiAgent(RegulatoryAgentBase):
     def lookup_contractor_history(self, license_number: str, limit: int = 10) -> str:
         """Look up a contractor's permit history."""
         return self._run_tool(
-            self.AGENT_NAME,
             "lookup_contractor_history",
             {"licenseNumber": license_number, "limit": limit},
         )
@@ -64,7 +96,6 @@ class SfDbiAgent(RegulatoryAgentBase):
     ) -> str:
         """Look up property history (permits/complaints)."""
         return self._run_tool(
-            self.AGENT_NAME,
             "lookup_property_history",
             {
                 "streetName": street_name,
@@ -81,7 +112,7 @@ class SfRegsAgent(RegulatoryAgentBase):
 
     def search_sf_code(self, query: str, limit: int = 5) -> str:
         """Search SF building/fire codes."""
-        return self._run_tool(self.AGENT_NAME, "search_sf_code", {"query": query, "limit": limit})
+        return self._run_tool("search_sf_code", {"query": query, "limit": limit})
 
 
 class CaRegsAgent(RegulatoryAgentBase):
@@ -91,4 +122,4 @@ class CaRegsAgent(RegulatoryAgentBase):
 
     def search_ca_code(self, query: str, limit: int = 5) -> str:
         """Search CA building standards (Title 24)."""
-        return self._run_tool(self.AGENT_NAME, "search_ca_code", {"query": query, "limit": limit})
+        return self._run_tool("search_ca_code", {"query": query, "limit": limit})
@@ -1,9 +1,14 @@
 
-import os
+import importlib.util
 import sys
 
-# Add the current directory to sys.path to mimic running as a module
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+def _check_module(module_name: str, label: str):
+    # find_spec locates the module without executing its body
+    if importlib.util.find_spec(module_name) is None:
+        raise ImportError(f"{label} module not found: {module_name}")
+    print(f"{label} found.")
+
 
 def check_imports():
     print("Checking imports...")
@@ -11,9 +16,8 @@ def check_imports():
         import forensics_fastapi.config as config
         print(f"Config loaded: API={config.HOST_API_URL}, R2_BUCKET={config.R2_EVIDENCE_BUCKET_NAME}")
         
-        print("AttachmentPipeline imported successfully.")
-        
-        print("ForensicAttachmentProcessor imported successfully.")
+        _check_module("forensics_fastapi.forensics.attachments.pipeline", "AttachmentPipeline")
+        _check_module("forensics_fastapi.forensics.attachments.extractor", "ForensicAttachmentProcessor")
         
         print("Imports check PASSED.")
         return True
@@ -1,46 +1,60 @@
 import asyncio
+import functools
 import os
 import platform
+import shlex
 import subprocess
 import sys
+import time
 from typing import Any, Dict, List
 
 import typer
 from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-
-# Core Imports
-ACREPipeline = None
-try:
-    from forensics_fastapi.forensics.pipeline import ACREPipeline
-except ImportError:
-    # Fallback for local dev if not installed as package
-    try:
-        from forensics.pipeline import ACREPipeline
-    except ImportError:
-        pass
 
 app = typer.Typer(help="ACRE Forensics Sandbox CLI")
 console = Console()
 
+# platform.platform() parses /etc/os-release; the answer never changes at runtime
+_PLATFORM = platform.platform()
+_PYTHON_VERSION = platform.python_version()
+_SYSINFO_TTL = 5
+_HEALTH_TTL = 10
+
+# sysinfo is sent to remote callers: never include secrets (API keys, tokens)
+_SAFE_ENV_KEYS = ("HOME", "PATH", "USER", "PYTHONPATH", "WORKSPACE_DIR", "HOST_API_URL")
+
 
 # --- Reusable Logic Functions ---
 
+def _load_pipeline():
+    """Import ACREPipeline on first use; it pulls in the whole forensics stack."""
+    try:
+        from forensics_fastapi.forensics.pipeline import ACREPipeline
+    except ImportError:
+        # Fallback for local dev if not installed as package
+        from forensics.pipeline import ACREPipeline
+    return ACREPipeline
+
+
 def get_health_status() -> List[Dict[str, str]]:
-    """Return health check results as a list of dictionaries."""
+    """Return health check results as a list of dictionaries (cached for ~10s)."""
+    return _health_snapshot(int(time.monotonic() // _HEALTH_TTL))
+
+
+@functools.lru_cache(maxsize=1)
+def _health_snapshot(_bucket: int) -> List[Dict[str, str]]:
     results = []
 
     # Check 1: Python Env
     results.append({
         "component": "Python Runtime",
         "status": "OK",
-        "details": platform.python_version()
+        "details": _PYTHON_VERSION
     })
 
     # Check 2: Imports
     try:
-        pass  # ACREPipeline is loaded earlier
+        _load_pipeline()
         results.append({
             "component": "Forensics Module",
             "status": "OK",
@@ -56,23 +70,30 @@ def get_health_status() -> List[Dict[str, str]]:
     # Check 3: R2 Mounts
     evidence_path = "/workspace/src/forensics/evidence"
     if os.path.exists(evidence_path):
-        # Check write access
-        try:
-            test_file = f"{evidence_path}/.health_check"
-            with open(test_file, 'w') as f:
-                f.write("ok")
-            os.remove(test_file)
-            results.append({
-                "component": "R2 Evidence Mount",
-                "status": "OK",
-                "details": f"Writable: {evidence_path}"
-            })
-        except Exception as e:
+        # Check write access (os.access is enough to rule out read-only mounts)
+        if not os.access(evidence_path, os.W_OK):
             results.append({
                 "component": "R2 Evidence Mount",
                 "status": "WARNING",
-                "details": f"Read-only or Error: {e}"
+                "details": f"Read-only: {evidence_path}"
             })
+        else:
+            try:
+                test_file = f"{evidence_path}/.health_check"
+                with open(test_file, 'w') as f:
+                    f.write("ok")
+                os.remove(test_file)
+                results.append({
+                    "component": "R2 Evidence Mount",
+                    "status": "OK",
+                    "details": f"Writable: {evidence_path}"
+                })
+            except Exception as e:
+                results.append({
+                    "component": "R2 Evidence Mount",
+                    "status": "WARNING",
+                    "details": f"Read-only or Error: {e}"
+                })
     else:
         results.append({
             "component": "R2 Evidence Mount",
@@ -84,19 +105,29 @@ def get_health_status() -> List[Dict[str, str]]:
 
 
 def get_system_info() -> Dict[str, Any]:
-    """Return system information."""
+    """Return system information (cached for a few seconds; polled by the Agent SDK)."""
+    return _system_info_snapshot(int(time.monotonic() // _SYSINFO_TTL))
+
+
+@functools.lru_cache(maxsize=1)
+def _system_info_snapshot(_bucket: int) -> Dict[str, Any]:
     return {
-        "platform": platform.platform(),
-        "python": platform.python_version(),
+        "platform": _PLATFORM,
+        "python": _PYTHON_VERSION,
         "cwd": os.getcwd(),
-        "env": dict(os.environ),
+        "env": {k: os.environ[k] for k in _SAFE_ENV_KEYS if k in os.environ},
     }
 
 
-def execute_command(cmd: str) -> Dict[str, Any]:
-    """Execute a shell command and return result dict."""
+def execute_command(cmd: str, use_shell: bool = False) -> Dict[str, Any]:
+    """
+    Execute a command and return result dict.
+    The command is split with shlex and run directly; pass use_shell=True for
+    pipes, globs or redirection (runs via `sh -c`).
+    """
     try:
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+        argv = ["sh", "-c", cmd] if use_shell else shlex.split(cmd)
+        result = subprocess.run(argv, shell=False, capture_output=True, text=True)
         return {
             "success": result.returncode == 0,
             "stdout": result.stdout,
@@ -113,8 +144,10 @@ def execute_command(cmd: str) -> Dict[str, Any]:
 
 async def run_scan_logic(target: str, auto_fix: bool = False):
     """Run the pipeline logic. (Wrapper for ACREPipeline)"""
-    if not ACREPipeline:
-        raise ImportError("ACREPipeline module could not be imported")
+    try:
+        ACREPipeline = _load_pipeline()
+    except ImportError as e:
+        raise ImportError("ACREPipeline module could not be imported") from e
     pipeline = ACREPipeline()
     real_target = target if target != "all" else "src/forensics/evidence"
     await pipeline.run_pipeline(real_target)
@@ -131,6 +164,8 @@ def scan(
     """
     Run the forensic investigation pipeline.
     """
+    from rich.panel import Panel
+
     console.print(Panel(f"[bold blue]ACRE Forensics Pipeline[/bold blue]\nTarget: [cyan]{target}[/cyan]"))
 
     with console.status("[bold green]Initializing Pipeline...[/bold green]") as status:
@@ -148,6 +183,8 @@ def health():
     """
     Perform a self-diagnostic health check.
     """
+    from rich.table import Table
+
     results = get_health_status()
     table = Table(title="System Health")
     table.add_column("Component", style="cyan")
@@ -174,11 +211,12 @@ def sysinfo():
 @app.command()
 def exec(
     cmd: str = typer.Argument(..., help="Command to execute via subprocess"),
+    shell: bool = typer.Option(False, "--shell", help="Run through `sh -c` for shell features"),
 ):
     """
     Execute a raw shell command and print output (wrapper).
     """
-    result = execute_command(cmd)
+    result = execute_command(cmd, use_shell=shell)
     if result.get("stdout"):
         console.print(result["stdout"], end="")
     if result.get("stderr"):
@@ -6,93 +6,142 @@ from dotenv import load_dotenv
 load_dotenv(".dev.vars", override=True)
 
 from pathlib import Path
+from typing import Optional
+
+from pydantic import AliasChoices, Field, field_validator, model_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+# Env names tried in order for one setting; an empty value falls through to the next
+_CF_TOKEN_ENV = ("CLOUDFLARE_AUTH_TOKEN", "CLOUDFLARE_API_TOKEN", "CLOUDFLARE_AI_SEARCH_TOKEN")
+_HOST_URL_ENV = ("HOST_API_URL", "WORKER_URL")
+
+
+class Settings(BaseSettings):
+    """Environment-driven configuration, parsed and validated once at import."""
+
+    model_config = SettingsConfigDict(frozen=True, extra="ignore")
+
+    # Filesystem
+    workspace_dir: Optional[str] = None
+    r2_evidence_path: str = "src/forensics/evidence"
+    r2_reports_path: str = "src/reports/output_final"
+    r2_doc_pages_path: str = "src/data/doc_pages"
+
+    # Cloudflare
+    cloudflare_account_id: str = ""
+    # Support both token names
+    cloudflare_auth_token: str = Field(
+        "",
+        validation_alias=AliasChoices(*_CF_TOKEN_ENV),
+    )
+    cloudflare_model: str = "@cf/meta/llama-3.3-70b-instruct-fp8-fast"
+    cloudflare_rag_name: str = "mr-roofing-artifacts-dec-2025"
+
+    # Worker Bridge (the Host injects WORKER_URL / WORKER_API_KEY into the container)
+    host_api_url: str = Field(
+        "https://acre-forensics-backend.hacolby.workers.dev",
+        validation_alias=AliasChoices(*_HOST_URL_ENV),
+    )
+    worker_api_key: str = "dev-secret"
+
+    # R2
+    r2_evidence_bucket_name: str = "acre-forensics-evidence"
+    r2_doc_pages_bucket_name: str = "acre-forensics-doc-pages"
+    aws_access_key_id: Optional[str] = None
+    aws_secret_access_key: Optional[str] = None
+    r2_endpoint_url: Optional[str] = None
+
+    @model_validator(mode="before")
+    @classmethod
+    def _skip_empty_aliases(cls, data):
+        # pydantic-settings stops at the first alias that is set, even to "";
+        # keep the old `os.getenv(A) or os.getenv(B)` fallthrough instead.
+        if not isinstance(data, dict):
+            return data
+        for names in (_CF_TOKEN_ENV, _HOST_URL_ENV):
+            value = next(
+                (v for v in (data.get(n) or os.environ.get(n) for n in names) if v), None
+            )
+            for name in names:
+                data.pop(name, None)
+            if value is not None:
+                data[names[0]] = value
+        return data
+
+    @field_validator("cloudflare_account_id", "cloudflare_auth_token", "cloudflare_model")
+    @classmethod
+    def _strip(cls, value: str) -> str:
+        return value.strip()
+
+
+settings = Settings()
+
+def _resolve_base_dir() -> Path:
+    """
+    Filesystem root for evidence/output.
+    Defaults to /workspace for Sandbox compatibility, but respects WORKSPACE_DIR;
+    if the default is missing or not writable, falls back to <tmp>/acre-forensics.
+    """
+    if settings.workspace_dir:
+        return Path(settings.workspace_dir)
+    # os.access is False for a nonexistent path too (in containers /workspace
+    # usually exists; if not, we surely can't create it at /)
+    if os.access("/workspace", os.W_OK):
+        return Path("/workspace")
+    import tempfile
+
+    return Path(tempfile.gettempdir()) / "acre-forensics"
+
 
 # Filesystem Configuration
-# Defaults to /workspace for Sandbox compatibility, but respects env var or falls back to /app or /tmp if read-only
-_explicit_workspace = os.getenv("WORKSPACE_DIR")
-BASE_DIR = Path(_explicit_workspace) if _explicit_workspace else Path("/workspace")
-
-# Safety Check: If strictly default /workspace and it's not writable, fallback to /tmp
-# We only do this if the user didn't explicitly ask for a specific dir.
-if not _explicit_workspace:
-    try:
-        # Check if exists and writable, or if parent is writable if it doesn't exist
-        if BASE_DIR.exists():
-            if not os.access(BASE_DIR, os.W_OK):
-                import tempfile
-
-                BASE_DIR = Path(tempfile.gettempdir()) / "acre-forensics"
-        else:
-            # If it doesn't exist, can we write to root? Unlikely.
-            # In containers, /workspace usually exists. If not, we surely can't create it at /
-            import tempfile
-
-            BASE_DIR = Path(tempfile.gettempdir()) / "acre-forensics"
-    except Exception:
-        # Fallback on any error
-        import tempfile
-
-        BASE_DIR = Path(tempfile.gettempdir()) / "acre-forensics"
+BASE_DIR = _resolve_base_dir()
 
 DATA_DIR = BASE_DIR / "src" / "data"
 
-def _clean_path(env_key, default):
+def _clean_path(val: str) -> str:
     """Strip leading slashes to ensure safe joining with BASE_DIR"""
-    val = os.getenv(env_key, default)
     # If the path is intended to be absolute (like /root for NLTK), we keep it,
     # but for workspace-relative paths, we strip.
     # However, controller.ts mounts them relative to workspace (usually).
     # R2_EVIDENCE_PATH is typically "/r2/evidence", so we strip leading / to append to /workspace
     return val.lstrip("/")
 
-DATA_DIR = BASE_DIR / "src" / "data"
-
 # Dynamic Paths based on Env Injection (matching controller.ts mounts)
-EVIDENCE_DIR = BASE_DIR / _clean_path("R2_EVIDENCE_PATH", "src/forensics/evidence")
-OUTPUT_DIR = BASE_DIR / _clean_path("R2_REPORTS_PATH", "src/reports/output_final")
-DOCS_DIR = BASE_DIR / _clean_path("R2_DOC_PAGES_PATH", "src/data/doc_pages")
+EVIDENCE_DIR = BASE_DIR / _clean_path(settings.r2_evidence_path)
+OUTPUT_DIR = BASE_DIR / _clean_path(settings.r2_reports_path)
+DOCS_DIR = BASE_DIR / _clean_path(settings.r2_doc_pages_path)
 
 DB_PATH = DATA_DIR / "forensics.db"
 CREDENTIALS_DIR = BASE_DIR / ".credentials"
 
 
 # Cloudflare Configuration
-CF_ACCOUNT_ID = os.getenv("CLOUDFLARE_ACCOUNT_ID", "").strip()
-# Support both token names
-CF_AUTH_TOKEN = (
-    os.getenv("CLOUDFLARE_AUTH_TOKEN")
-    or os.getenv("CLOUDFLARE_API_TOKEN")
-    or os.getenv("CLOUDFLARE_AI_SEARCH_TOKEN", "").strip()
-)
-CF_MODEL_STRUCTURED = os.getenv(
-    "CLOUDFLARE_MODEL", "@cf/meta/llama-3.3-70b-instruct-fp8-fast"
-).strip()
+CF_ACCOUNT_ID = settings.cloudflare_account_id
+CF_AUTH_TOKEN = settings.cloudflare_auth_token
+CF_MODEL_STRUCTURED = settings.cloudflare_model
 CF_MODEL_REASONING = "@cf/openai/gpt-oss-120b"
 CF_MODEL_EMBEDDING = "@cf/baai/bge-base-en-v1.5"
 CF_MODEL_RERANK = "@cf/baai/bge-reranker-base"
 
 # RAG Configuration
-RAG_NAME = os.getenv("CLOUDFLARE_RAG_NAME", "mr-roofing-artifacts-dec-2025")
+RAG_NAME = settings.cloudflare_rag_name
 
 # Database Configuration
 # DEPRECATED: Direct DB Access
 # DB_CONFIG = { ... }
 
 # Worker Bridge Configuration
-# We favor WORKER_URL which is injected by the Host into the container
-HOST_API_URL = os.environ.get("HOST_API_URL") or os.environ.get(
-    "WORKER_URL", "https://acre-forensics-backend.hacolby.workers.dev"
-)
-# The Host injects WORKER_API_KEY as the secret
-INTERNAL_SERVICE_KEY = os.environ.get("WORKER_API_KEY", "dev-secret")
+HOST_API_URL = settings.host_api_url
+INTERNAL_SERVICE_KEY = settings.worker_api_key
 
 
 # R2 Configuration
-R2_EVIDENCE_BUCKET_NAME = os.getenv("R2_EVIDENCE_BUCKET_NAME", "acre-forensics-evidence")
-R2_DOC_PAGES_BUCKET_NAME = os.getenv("R2_DOC_PAGES_BUCKET_NAME", "acre-forensics-doc-pages")
-AWS_ACCESS_KEY_ID = os.getenv("AWS_ACCESS_KEY_ID")
-AWS_SECRET_ACCESS_KEY = os.getenv("AWS_SECRET_ACCESS_KEY")
-R2_ENDPOINT_URL = os.getenv("R2_ENDPOINT_URL")
+R2_EVIDENCE_BUCKET_NAME = settings.r2_evidence_bucket_name
+R2_DOC_PAGES_BUCKET_NAME = settings.r2_doc_pages_bucket_name
+AWS_ACCESS_KEY_ID = settings.aws_access_key_id
+AWS_SECRET_ACCESS_KEY = settings.aws_secret_access_key
+R2_ENDPOINT_URL = settings.r2_endpoint_url
 
 
 # Contractor Details
@@ -1,9 +1,52 @@
+import os
+import zlib
 from typing import Any, Dict, List, Optional
 
 import httpx
+import orjson
 
 from forensics_fastapi.config import HOST_API_URL, INTERNAL_SERVICE_KEY
 
+# Request bodies at least this large are sent gzip-compressed (0 disables).
+# Only enable once the Worker route decodes Content-Encoding: gzip.
+_GZIP_MIN_BYTES = int(os.getenv("BRIDGE_GZIP_MIN_BYTES", "0"))
+
+
+def _gzip(body: bytes) -> bytes:
+    # Level 1: nearly all of the size win on JSON for a fraction of the CPU
+    compressor = zlib.compressobj(1, zlib.DEFLATED, 31)
+    return compressor.compress(body) + compressor.flush()
+
+
+# Process-wide pooled client shared by every bridge wrapper so that fan-out
+# calls reuse warm TCP/TLS connections instead of handshaking per instance.
+_shared_client: Optional[httpx.AsyncClient] = None
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """Return the shared AsyncClient, creating it on first use."""
+    global _shared_client
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(
+            headers={"X-Worker-Api-Key": INTERNAL_SERVICE_KEY},
+            timeout=30.0,
+            # HTTP/2 multiplexes concurrent bridge calls over one TLS connection,
+            # so few sockets are needed and all of them can stay warm.
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=50, max_keepalive_connections=50, keepalive_expiry=30
+            ),
+        )
+    return _shared_client
+
+
+async def close_shared_client():
+    """Close the shared AsyncClient (called once from the FastAPI lifespan)."""
+    global _shared_client
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
+
 
 class HostIntegrationClient:
     """
@@ -11,18 +54,36 @@ class HostIntegrationClient:
     Supports AI, raw SQL, internal storage, and universal CRUD for data tables.
     """
 
-    def __init__(self, base_url: str = HOST_API_URL, token: str = INTERNAL_SERVICE_KEY):
+    def __init__(
+        self,
+        base_url: str = HOST_API_URL,
+        token: str = INTERNAL_SERVICE_KEY,
+        client: Optional[httpx.AsyncClient] = None,
+    ):
         self.base_url = base_url.rstrip("/")
         self.headers = {"Content-Type": "application/json", "X-Worker-Api-Key": token}
-        self.client = httpx.AsyncClient(headers=self.headers, timeout=30.0)
+        # Injected client is owned by the caller; otherwise use the shared pool
+        self.client = client or get_shared_client()
+        self._crud_dispatch = {
+            "list": self._crud_list,
+            "create": self._crud_create,
+            "get": self._crud_get,
+            "update": self._crud_update,
+            "delete": self._crud_delete,
+        }
 
     async def _post(self, path: str, json: Optional[Dict] = None):
         """Internal helper for POST requests with error handling."""
         url = f"{self.base_url}{path}"
+        body = orjson.dumps(json or {})
+        headers = self.headers
+        if _GZIP_MIN_BYTES and len(body) >= _GZIP_MIN_BYTES:
+            body = _gzip(body)
+            headers = {**self.headers, "Content-Encoding": "gzip"}
         try:
-            response = await self.client.post(url, json=json or {})
+            response = await self.client.post(url, content=body, headers=headers)
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except httpx.HTTPError as e:
             print(f"Bridge POST Error [{path}]: {e}")
             raise
@@ -31,9 +92,9 @@ class HostIntegrationClient:
         """Internal helper for GET requests."""
         url = f"{self.base_url}{path}"
         try:
-            response = await self.client.get(url, params=params)
+            response = await self.client.get(url, params=params, headers=self.headers)
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except httpx.HTTPError as e:
             print(f"Bridge GET Error [{path}]: {e}")
             raise
@@ -103,48 +164,49 @@ class HostIntegrationClient:
             id: Required for get/update/delete
             payload: Required for create/update
         """
-        base_path = f"/api/data/{resource}"
-
-        if action == "list":
-            return await self._get(base_path)
-
-        elif action == "create":
-            if not payload:
-                raise ValueError("Payload required for create")
-            return await self._post(base_path, payload)
-
-        elif action == "get":
-            if not id:
-                raise ValueError("ID required for get")
-            return await self._get(f"{base_path}/{id}")
-
-        elif action == "update":
-            if not id or not payload:
-                raise ValueError("ID and Payload required for update")
-            # Using PUT explicitly here
-            url = f"{self.base_url}{base_path}/{id}"
-            try:
-                response = await self.client.put(url, json=payload)
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPError as e:
-                print(f"Bridge PUT Error [{base_path}]: {e}")
-                raise
-
-        elif action == "delete":
-            if not id:
-                raise ValueError("ID required for delete")
-            # Using DELETE explicitly here
-            url = f"{self.base_url}{base_path}/{id}"
-            try:
-                response = await self.client.delete(url)
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPError as e:
-                print(f"Bridge DELETE Error [{base_path}]: {e}")
-                raise
-        else:
+        handler = self._crud_dispatch.get(action)
+        if handler is None:
             raise ValueError(f"Unknown action: {action}")
+        return await handler(f"/api/data/{resource}", id, payload)
+
+    async def _crud_list(self, base_path: str, id: Optional[str], payload: Optional[Dict]):
+        return await self._get(base_path)
+
+    async def _crud_create(self, base_path: str, id: Optional[str], payload: Optional[Dict]):
+        if not payload:
+            raise ValueError("Payload required for create")
+        return await self._post(base_path, payload)
+
+    async def _crud_get(self, base_path: str, id: Optional[str], payload: Optional[Dict]):
+        if not id:
+            raise ValueError("ID required for get")
+        return await self._get(f"{base_path}/{id}")
+
+    async def _crud_update(self, base_path: str, id: Optional[str], payload: Optional[Dict]):
+        if not id or not payload:
+            raise ValueError("ID and Payload required for update")
+        # Using PUT explicitly here
+        url = f"{self.base_url}{base_path}/{id}"
+        try:
+            response = await self.client.put(url, content=orjson.dumps(payload), headers=self.headers)
+            response.raise_for_status()
+            return orjson.loads(response.content)
+        except httpx.HTTPError as e:
+            print(f"Bridge PUT Error [{base_path}]: {e}")
+            raise
+
+    async def _crud_delete(self, base_path: str, id: Optional[str], payload: Optional[Dict]):
+        if not id:
+            raise ValueError("ID required for delete")
+        # Using DELETE explicitly here
+        url = f"{self.base_url}{base_path}/{id}"
+        try:
+            response = await self.client.delete(url, headers=self.headers)
+            response.raise_for_status()
+            return orjson.loads(response.content)
+        except httpx.HTTPError as e:
+            print(f"Bridge DELETE Error [{base_path}]: {e}")
+            raise
 
     # ------------------------------------------------------------------
     # 4. AGENTS & AI (Existing)
@@ -173,4 +235,7 @@ class HostIntegrationClient:
         return await self._post("/internal/workflow/trigger/forensic", message_data)
 
     async def close(self):
-        await self.client.aclose()
\ No newline at end of file
+        # The shared pool belongs to the process and is closed once on app shutdown via
+        # close_shared_client(); only a client injected for this instance is closed here.
+        if self.client is not _shared_client:
+            await self.client.aclose()
\ No newline at end of file
@@ -1,7 +1,329 @@
+import asyncio
+import hashlib
 import json
-from typing import Any
+import os
+import random
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, List, Optional
+
+import httpx
+import numpy as np
+import orjson
+
+try:
+    from blake3 import blake3 as _blake3
+except ImportError:  # optional speedup; blake2b is still faster than sha256
+    _blake3 = None
+
+try:
+    import fastjsonschema
+except ImportError:  # optional: only needed for schema_validator()
+    fastjsonschema = None
+
+from ..forensics.cloudflare_ops import CloudflareAPIError, fetch_cloudflare
+
+_RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+# Cloudflare sometimes reports throttling with a 4xx other than 429
+_RATE_LIMIT_TEXT = re.compile(r"rate.?limit|quota", re.IGNORECASE)
+
+# Global ceiling on in-flight Cloudflare calls across request threads
+_CF_CONCURRENCY = threading.BoundedSemaphore(int(os.getenv("CF_MAX_CONCURRENCY", 16)))
+# Longest Retry-After we wait out; a longer one is raised to the caller
+_MAX_RETRY_DELAY = 30.0
+
+
+class CircuitOpenError(Exception):
+    """Raised without calling Cloudflare while the circuit breaker is open."""
+
+
+class StreamInterruptedError(Exception):
+    """A reasoning stream broke after the response had started; its text is incomplete."""
+
+
+class _CircuitBreaker:
+    """
+    Opens after `fail_max` consecutive retryable failures and fast-fails
+    calls for `reset_timeout` seconds, then lets a single trial call through;
+    other callers keep failing fast until that call is recorded.
+    """
+
+    def __init__(self, fail_max: int = 10, reset_timeout: float = 30.0):
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._half_open = False
+        self._lock = threading.Lock()
+
+    def before_call(self):
+        with self._lock:
+            if self._opened_at is None:
+                return
+            if self._half_open or time.monotonic() - self._opened_at < self.reset_timeout:
+                raise CircuitOpenError("Cloudflare AI circuit open; skipping request")
+            self._half_open = True  # this caller is the trial call
+
+    def record(self, ok: bool):
+        with self._lock:
+            self._half_open = False
+            if ok:
+                self._failures = 0
+                self._opened_at = None
+                return
+            self._failures += 1
+            if self._failures >= self.fail_max:
+                self._opened_at = time.monotonic()
+
+
+_CF_BREAKER = _CircuitBreaker()
+
+
+def _is_retryable(exc: Exception) -> bool:
+    if isinstance(exc, CloudflareAPIError):
+        return exc.status_code in _RETRYABLE_STATUS or bool(_RATE_LIMIT_TEXT.search(str(exc)))
+    if not isinstance(exc, ConnectionError):
+        return False
+    # fetch_cloudflare wraps every transport error in ConnectionError. Only
+    # retry when the request never left (connect/pool phase): a read timeout
+    # on a POST may already have been billed for the inference.
+    cause = exc.__cause__ or exc.__context__
+    return cause is None or isinstance(cause, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout))
+
+
+def _retry_cf(fn, *args, max_attempts: int = 4, jitter: bool = True, **kwargs):
+    """
+    Call fn with exponential backoff on 429/5xx and connect errors,
+    honouring Retry-After up to _MAX_RETRY_DELAY (a longer one is raised).
+    Non-retryable errors are raised immediately.
+    Backoff sleeps happen outside the concurrency ceiling.
+    """
+    for attempt in range(max_attempts):
+        _CF_BREAKER.before_call()
+        try:
+            with _CF_CONCURRENCY:
+                result = fn(*args, **kwargs)
+        except Exception as e:
+            if not _is_retryable(e):
+                # A 4xx means Cloudflare is up; a read-phase transport error
+                # counts against the breaker but is not re-sent
+                _CF_BREAKER.record(ok=isinstance(e, CloudflareAPIError))
+                raise
+            _CF_BREAKER.record(ok=False)
+            if attempt == max_attempts - 1:
+                raise
+            delay = getattr(e, "retry_after", None)
+            if delay is None:
+                delay = 0.25 * 2**attempt + (random.uniform(0, 0.25) if jitter else 0)
+            elif delay > _MAX_RETRY_DELAY:
+                raise
+            time.sleep(delay)
+        else:
+            _CF_BREAKER.record(ok=True)
+            return result
 
-from ..forensics.cloudflare_ops import fetch_cloudflare
+
+# Table names are interpolated into SQL, so only plain identifiers are allowed
+_SQL_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+# Reasoning models that accept a JSON schema themselves, so structured
+# output needs one call instead of reasoning + a Llama restructuring pass
+_REASONING_MODELS_WITH_SCHEMA = {"@cf/openai/gpt-oss-120b": True}
+
+# Serialized response_format blobs (and compiled validators) per schema
+# object, keyed by id(). The schema is kept in the entry so its id can't be
+# recycled while cached; schemas are treated as immutable once passed in.
+_SCHEMA_CACHE: "OrderedDict[int, list]" = OrderedDict()
+_SCHEMA_CACHE_SIZE = 64
+_SCHEMA_LOCK = threading.Lock()
+
+
+def _schema_entry(json_schema) -> list:
+    key = id(json_schema)
+    with _SCHEMA_LOCK:
+        entry = _SCHEMA_CACHE.get(key)
+        if entry is not None and entry[0] is json_schema:
+            _SCHEMA_CACHE.move_to_end(key)
+            return entry
+        response_format = b'{"type":"json_schema","json_schema":' + orjson.dumps(json_schema) + b"}"
+        entry = [json_schema, response_format, None]
+        _SCHEMA_CACHE[key] = entry
+        while len(_SCHEMA_CACHE) > _SCHEMA_CACHE_SIZE:
+            _SCHEMA_CACHE.popitem(last=False)
+        return entry
+
+
+def schema_validator(json_schema):
+    """
+    Compiled fastjsonschema validator for `json_schema` (compiled once per
+    schema object), or None when fastjsonschema isn't installed.
+    """
+    if fastjsonschema is None:
+        return None
+    entry = _schema_entry(json_schema)
+    if entry[2] is None:
+        entry[2] = fastjsonschema.compile(json_schema)
+    return entry[2]
+
+
+# Texts per embedding request (bge-base-en-v1.5 accepts a text[] batch)
+MAX_EMBED_BATCH = 96
+
+
+# Bump when the persisted embedding cache layout changes
+_EMBED_CACHE_FORMAT = "2-int8"
+
+
+class _EmbeddingCache:
+    """
+    LRU cache of embedding vectors keyed by a 32-byte hash of model + text
+    (BLAKE3 when installed, otherwise BLAKE2b).
+    Optionally mirrored to a local sqlite file (EMBED_CACHE_PATH, vectors
+    stored as int8) so a restarted process starts warm; the Worker remains
+    the source of truth.
+    """
+
+    def __init__(self, capacity: int, path: Optional[str] = None):
+        self.capacity = capacity
+        self._data: "OrderedDict[bytes, List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        if path:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._prepare_db()
+
+    def _prepare_db(self):
+        """Create the persisted cache tables, discarding files in an older format."""
+        self._db.execute("CREATE TABLE IF NOT EXISTS cache_meta (name TEXT PRIMARY KEY, value TEXT)")
+        row = self._db.execute(
+            "SELECT value FROM cache_meta WHERE name = 'format_version'"
+        ).fetchone()
+        if row is None or row[0] != _EMBED_CACHE_FORMAT:
+            # It's only a cache: rebuilding is cheaper than migrating vectors
+            self._db.execute("DROP TABLE IF EXISTS embeddings")
+            self._db.execute(
+                "INSERT OR REPLACE INTO cache_meta (name, value) VALUES ('format_version', ?)",
+                (_EMBED_CACHE_FORMAT,),
+            )
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (key BLOB PRIMARY KEY, scale REAL, vector BLOB)"
+        )
+        self._db.commit()
+
+    @staticmethod
+    def _quantize(vector: List[float]) -> tuple:
+        """int8 with one scale per vector: 4x smaller on disk, ~1e-3 cosine error."""
+        v = np.asarray(vector, dtype=np.float32)
+        peak = float(np.max(np.abs(v))) if v.size else 0.0
+        scale = peak / 127.0 if peak else 1.0
+        return scale, np.round(v / scale).astype(np.int8).tobytes()
+
+    @staticmethod
+    def _dequantize(scale: float, blob: bytes) -> List[float]:
+        return (np.frombuffer(blob, dtype=np.int8).astype(np.float32) * scale).tolist()
+
+    @staticmethod
+    def key(model: str, text: str) -> bytes:
+        data = f"{model}\0{text}".encode("utf-8")
+        if _blake3 is not None:
+            return _blake3(data).digest()
+        return hashlib.blake2b(data, digest_size=32).digest()
+
+    def get_many(self, keys: List[bytes]) -> List[Optional[List[float]]]:
+        with self._lock:
+            found = []
+            for key in keys:
+                vector = self._data.get(key)
+                if vector is None and self._db is not None:
+                    row = self._db.execute(
+                        "SELECT scale, vector FROM embeddings WHERE key = ?", (key,)
+                    ).fetchone()
+                    if row:
+                        vector = self._dequantize(*row)
+                        self._store(key, vector)
+                elif vector is not None:
+                    self._data.move_to_end(key)
+                found.append(vector)
+            return found
+
+    def put_many(self, items: List[tuple]):
+        with self._lock:
+            for key, vector in items:
+                self._store(key, vector)
+            if self._db is not None:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, scale, vector) VALUES (?, ?, ?)",
+                    [(key, *self._quantize(vector)) for key, vector in items],
+                )
+                self._db.commit()
+
+    def _store(self, key: bytes, vector: List[float]):
+        self._data[key] = vector
+        self._data.move_to_end(key)
+        while len(self._data) > self.capacity:
+            self._data.popitem(last=False)
+
+
+_EMBED_CACHE = _EmbeddingCache(
+    capacity=int(os.getenv("EMBED_CACHE_SIZE", "10000")),
+    path=os.getenv("EMBED_CACHE_PATH"),
+)
+
+
+class SemanticCache:
+    """
+    In-memory cache of responses matched by embedding cosine similarity, so
+    near-duplicate requests reuse the previous answer. Entries are namespaced
+    by tuples (for AutoRAG: rag path, engagement, search options) and expire.
+    """
+
+    def __init__(self, threshold: float = 0.95, ttl: float = 24 * 3600, per_namespace: int = 256):
+        self.threshold = threshold
+        self.ttl = ttl
+        self.per_namespace = per_namespace
+        self._entries: dict = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _normalize(vector) -> np.ndarray:
+        v = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(v)
+        return v / norm if norm else v
+
+    def lookup(self, namespace, vector):
+        with self._lock:
+            entries = self._entries.get(namespace)
+            if not entries:
+                return None
+            now = time.time()
+            entries[:] = [e for e in entries if now - e[1] < self.ttl]
+            if not entries:
+                return None
+            scores = np.stack([e[0] for e in entries]) @ self._normalize(vector)
+            best = int(np.argmax(scores))
+            return entries[best][2] if scores[best] > self.threshold else None
+
+    def store(self, namespace, vector, response):
+        with self._lock:
+            entries = self._entries.setdefault(namespace, [])
+            entries.append((self._normalize(vector), time.time(), response))
+            del entries[: -self.per_namespace]
+
+    def invalidate(self, head=None):
+        """Drop the namespaces whose first element is `head`, or everything when omitted."""
+        with self._lock:
+            if head is None:
+                self._entries.clear()
+                return
+            for namespace in [n for n in self._entries if n[0] == head]:
+                del self._entries[namespace]
+
+
+_RAG_CACHE = SemanticCache()
 
 
 class WorkerAI:
@@ -17,14 +339,35 @@ class WorkerAI:
         """
         Generates embeddings for a list of texts.
         Returns a list of vectors (arrays of floats).
+        Previously seen texts come from the embedding cache; only the misses
+        are sent to Workers AI, in one request.
         """
+        if isinstance(texts, str):
+            texts = [texts]
+        keys = [_EmbeddingCache.key(model, text) for text in texts]
+        vectors = _EMBED_CACHE.get_many(keys)
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        if not missing:
+            return vectors
+
+        fresh = self._fetch_embeddings([texts[i] for i in missing], model)
+        if not fresh or len(fresh) != len(missing):
+            return None
+        _EMBED_CACHE.put_many([(keys[i], vector) for i, vector in zip(missing, fresh)])
+        for i, vector in zip(missing, fresh):
+            vectors[i] = vector
+        return vectors
+
+    def _fetch_embeddings(self, texts, model):
+        """Uncached Workers AI embedding request."""
         # Path: /ai/run/{model} -> cloudflare_ops checks /ai/run and uses AI_GATEWAY_TOKEN
         path = f"/ai/run/{model}"
         payload = {"text": texts}
 
         try:
             # fetch_cloudflare returns 'result' key by default if expects_json=True
-            data = fetch_cloudflare(
+            data = _retry_cf(
+                fetch_cloudflare,
                 path=path,
                 method="POST",
                 body=payload,
@@ -50,6 +393,23 @@ class WorkerAI:
             print(f"Worker AI Request Failed: {e}")
             return None
 
+    def generate_embeddings_batched(
+        self, texts, batch_size=MAX_EMBED_BATCH, model="@cf/baai/bge-base-en-v1.5"
+    ):
+        """
+        Embeds any number of texts with one request per `batch_size` chunk
+        instead of one per text. Vectors are returned in input order, or None
+        if any chunk fails. Callers embedding very large corpora are
+        responsible for pacing themselves against Workers AI limits.
+        """
+        vectors = []
+        for start in range(0, len(texts), batch_size):
+            chunk = self.generate_embeddings(texts[start : start + batch_size], model=model)
+            if not chunk:
+                return None
+            vectors.extend(chunk)
+        return vectors
+
     def rag_search(
         self,
         rag_name,
@@ -59,9 +419,12 @@ class WorkerAI:
         max_results=10,
         score_threshold=0.4,
         rerank=True,
+        engagement_id=None,
     ):
         """
         Performs a full AI Search (AutoRAG) query.
+        Near-duplicate queries within the same engagement are served from
+        the semantic RAG cache; without an engagement_id nothing is cached.
         """
         # Path: /autorag/rags/{rag_name}/ai-search
         # Not mapped in cloudflare_ops?
@@ -97,9 +460,11 @@ class WorkerAI:
         # If not set, cloudflare_ops might fail.
         # Actually, AutoRAG usually needs Vectorize access.
 
-        return self._post_rag(path, payload)
+        return self._cached_rag(path, payload, engagement_id)
 
-    def rag_search_only(self, rag_name, query, max_results=10, score_threshold=0.4, rerank=True):
+    def rag_search_only(
+        self, rag_name, query, max_results=10, score_threshold=0.4, rerank=True, engagement_id=None
+    ):
         """
         Performs a search-only query (retrieval without generation).
         """
@@ -113,14 +478,36 @@ class WorkerAI:
             "reranking": {"enabled": rerank, "model": "@cf/baai/bge-reranker-base"},
         }
 
-        return self._post_rag(path, payload)
+        return self._cached_rag(path, payload, engagement_id)
+
+    def _cached_rag(self, path, payload, engagement_id):
+        """
+        _post_rag behind the semantic cache. Uncached without an engagement_id
+        (answers must never cross engagements) or if the query can't be embedded.
+        The query vector lands in the embedding cache, so callers that embed the
+        same query afterwards (e.g. for a local vector search) don't pay for it again.
+        """
+        if engagement_id is None:
+            return self._post_rag(path, payload)
+        options = {k: v for k, v in payload.items() if k != "query"}
+        namespace = (path, engagement_id, json.dumps(options, sort_keys=True))
+        vectors = self.generate_embeddings([payload["query"]])
+        if vectors:
+            cached = _RAG_CACHE.lookup(namespace, vectors[0])
+            if cached is not None:
+                return cached
+
+        result = self._post_rag(path, payload)
+        if vectors and result is not None:
+            _RAG_CACHE.store(namespace, vectors[0], result)
+        return result
 
     def _post_rag(self, path, payload):
         try:
             # explicit token fallback to standard AI token if not provided
             # But AutoRAG probably uses Vectorize index token
 
-            result = fetch_cloudflare(path=path, method="POST", body=payload, token=self.api_token)
+            result = _retry_cf(fetch_cloudflare, path=path, method="POST", body=payload, token=self.api_token)
             return result
         except Exception as e:
             print(f"AutoRAG Request Failed: {e}")
@@ -154,7 +541,8 @@ class WorkerAI:
 
             # Actually, I can update cloudflare_ops.py to be smarter.
 
-            result = fetch_cloudflare(
+            result = _retry_cf(
+                fetch_cloudflare,
                 path=path, method="POST", body=payload, token=self.api_token, timeout=120
             )
             return result
@@ -162,33 +550,100 @@ class WorkerAI:
             print(f"Reasoning Model Request Failed: {e}")
             return None
 
+    def run_reasoning_oss120b_stream(self, prompt, model="@cf/openai/gpt-oss-120b"):
+        """
+        Streaming variant of run_reasoning_oss120b: returns an iterator over
+        each server-sent event (parsed JSON) as it arrives instead of waiting
+        for the whole generation. The request is sent here, so a request that
+        fails its retries raises from this call; a transport error after the
+        stream has started is raised from the iterator as
+        StreamInterruptedError, since the text received so far is incomplete.
+        """
+        payload = {"model": model, "input": prompt, "stream": True}
+        res = _retry_cf(
+            fetch_cloudflare,
+            path="/ai/v1/responses", method="POST", body=payload, token=self.api_token,
+            timeout=120, stream=True, expects_json=False,
+        )
+        return self._iter_events(res)
+
+    @staticmethod
+    def _iter_events(res):
+        try:
+            for line in res.iter_lines():
+                if not line.startswith("data: "):
+                    continue
+                data = line[6:]
+                if data == "[DONE]":
+                    break
+                try:
+                    yield orjson.loads(data)
+                except orjson.JSONDecodeError:
+                    continue
+        except httpx.HTTPError as e:
+            raise StreamInterruptedError(str(e)) from e
+        finally:
+            res.close()
+
+    def stream_reasoning_text(self, prompt, model="@cf/openai/gpt-oss-120b"):
+        """
+        Answer text deltas from run_reasoning_oss120b_stream (same error
+        behaviour: the request is sent, and may raise, when this is called).
+        """
+        return self._text_deltas(self.run_reasoning_oss120b_stream(prompt, model=model))
+
+    @staticmethod
+    def _text_deltas(events):
+        for event in events:
+            if not isinstance(event, dict):
+                continue
+            event_type = event.get("type")
+            if event_type == "response.output_text.delta":
+                delta = event.get("delta")
+            elif event_type is None:
+                # Workers AI native stream shape: {"response": "<token>"}
+                delta = event.get("response")
+            elif event_type in ("error", "response.failed"):
+                raise StreamInterruptedError(f"Reasoning stream failed: {event}")
+            else:
+                # Lifecycle events (response.created / response.completed carry
+                # the whole response object), reasoning deltas, etc.
+                continue
+            if isinstance(delta, str) and delta:
+                yield delta
+
     def run_structured_llama(
         self,
         prompt,
         json_schema=None,
         system_prompt="You are a helpful assistant.",
         model="@cf/meta/llama-3.3-70b-instruct-fp8-fast",
+        messages=None,
     ):
         """
         Runs Llama 3.3 (or similar) with optional JSON schema enforcement.
+        Callers that reuse a conversation can pass a prebuilt `messages` list,
+        in which case `prompt` and `system_prompt` are ignored.
         """
         path = f"/ai/run/{model}"
 
-        messages = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": prompt},
-        ]
-
-        if not json_schema:
-            payload: dict[str, Any] = {"messages": messages}
-        else:
-            payload: dict[str, Any] = {"messages": messages}
+        if messages is None:
+            messages = [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt},
+            ]
 
+        payload: Any = {"messages": messages}
         if json_schema:
-            payload["response_format"] = {"type": "json_schema", "json_schema": json_schema}
+            # Splice in the cached schema bytes rather than re-encoding it per call
+            payload = (
+                b'{"messages":' + orjson.dumps(messages)
+                + b',"response_format":' + _schema_entry(json_schema)[1] + b"}"
+            )
 
         try:
-            result = fetch_cloudflare(
+            result = _retry_cf(
+                fetch_cloudflare,
                 path=path, method="POST", body=payload, token=self.api_token, timeout=60
             )
             return result
@@ -207,22 +662,45 @@ class WorkerAI:
         Chain of Thought + Structure:
         1. Runs the reasoning model first to get a detailed specific answer.
         2. Passes the reasoning output to the structured model to extract/format it according to json_schema.
+        Models in _REASONING_MODELS_WITH_SCHEMA do both in a single call; the
+        two-step chain is the fallback.
         """
-        print(f"Step 1: Running Reasoning Model ({reasoning_model})...")
-        reasoning_result = self.run_reasoning_oss120b(prompt, model=reasoning_model)
-
-        if not reasoning_result:
-            print("Reasoning step failed.")
-            return None
-
-        reasoning_text = reasoning_result.get("response")  # Direct text from 'result' object
-        if not reasoning_text and isinstance(reasoning_result, dict):
-            # sometimes nested
-            if "response" in reasoning_result:
-                reasoning_text = reasoning_result["response"]
+        reasoning_text = None
+        if _REASONING_MODELS_WITH_SCHEMA.get(reasoning_model):
+            try:
+                structured, reasoning_text = self._run_schema_reasoning(prompt, json_schema, reasoning_model)
+            except Exception as e:
+                print(f"Structured Reasoning Request Failed: {e}")
+                if _is_retryable(e) or not isinstance(e, CloudflareAPIError):
+                    # Outage or transport error, already retried: another
+                    # generation on the same endpoint won't fare better
+                    return None
+                print("Falling back to two-step chain.")
+            else:
+                if structured is not None:
+                    return structured
+                # The generation succeeded but its text isn't valid JSON:
+                # restructure that text rather than generating again
+                print("Structured reasoning returned invalid JSON, restructuring its answer.")
 
         if not reasoning_text:
-            reasoning_text = json.dumps(reasoning_result)
+            print(f"Step 1: Running Reasoning Model ({reasoning_model})...")
+            # Streamed so the connection is never idle for the whole generation;
+            # the structuring step starts as soon as the stream completes.
+            try:
+                reasoning_text = "".join(self.stream_reasoning_text(prompt, model=reasoning_model))
+            except StreamInterruptedError as e:
+                # Dropped mid-flight: discard the partial text and retry unstreamed
+                print(f"Reasoning Stream Interrupted: {e}")
+                reasoning_text = self._reasoning_text(prompt, reasoning_model)
+            except Exception as e:
+                # The request already failed its retries; don't send it again
+                print(f"Reasoning Stream Request Failed: {e}")
+                reasoning_text = None
+
+            if not reasoning_text:
+                print("Reasoning step failed.")
+                return None
 
         print(f"Step 2: Structuring Output ({struct_model})...")
         extraction_prompt = f"""
@@ -242,21 +720,95 @@ class WorkerAI:
             system_prompt="You are an expert data extractor.",
         )
 
+    def _reasoning_text(self, prompt, model):
+        """Answer text from one unstreamed run_reasoning_oss120b call, or None."""
+        reasoning_result = self.run_reasoning_oss120b(prompt, model=model)
+        if not reasoning_result:
+            return None
+
+        reasoning_text = reasoning_result.get("response")  # Direct text from 'result' object
+        if not reasoning_text and isinstance(reasoning_result, dict):
+            # sometimes nested
+            if "response" in reasoning_result:
+                reasoning_text = reasoning_result["response"]
+
+        return reasoning_text or orjson.dumps(reasoning_result).decode()
+
+    def _run_schema_reasoning(self, prompt, json_schema, model):
+        """
+        One /ai/v1/responses call constrained to json_schema. Returns
+        (parsed, text): parsed is None when the answer isn't valid JSON, and
+        text is what the model produced. Request failures are raised.
+        """
+        payload = {
+            "model": model,
+            "input": prompt,
+            "response_format": {"type": "json_schema", "json_schema": json_schema},
+        }
+        result = _retry_cf(
+            fetch_cloudflare,
+            path="/ai/v1/responses", method="POST", body=payload, token=self.api_token, timeout=120
+        )
+
+        # Responses API: output is a list of items; the answer is the text
+        # content of the message item (reasoning items come first).
+        texts = []
+        for item in (result or {}).get("output") or []:
+            for content in item.get("content") or []:
+                text = content.get("text") if isinstance(content, dict) else None
+                if not text:
+                    continue
+                try:
+                    return json.loads(text), text
+                except ValueError:
+                    texts.append(text)
+        return None, "\n".join(texts) or orjson.dumps(result).decode()
+
+    # ------------------------------------------------------------------
+    # Async twins: run the blocking calls in worker threads so independent
+    # requests can be overlapped with asyncio.gather, e.g.
+    #   emb, rag = await asyncio.gather(ai.agenerate_embeddings([q]), ai.arag_search(name, q))
+    # ------------------------------------------------------------------
+
+    async def agenerate_embeddings(self, texts, model="@cf/baai/bge-base-en-v1.5"):
+        return await asyncio.to_thread(self.generate_embeddings, texts, model)
+
+    async def arag_search(self, rag_name, query, **kwargs):
+        return await asyncio.to_thread(self.rag_search, rag_name, query, **kwargs)
+
+    async def arag_search_only(self, rag_name, query, **kwargs):
+        return await asyncio.to_thread(self.rag_search_only, rag_name, query, **kwargs)
+
+    async def arun_structured_llama(self, prompt, **kwargs):
+        return await asyncio.to_thread(self.run_structured_llama, prompt, **kwargs)
+
+    async def arun_structured_reasoning(self, prompt, json_schema, **kwargs):
+        return await asyncio.to_thread(self.run_structured_reasoning, prompt, json_schema, **kwargs)
+
     def search_sql(self, query_text, table_name, limit=5, model="@cf/baai/bge-base-en-v1.5"):
         """
-        Helper to generate the SQL query for a vector search.
+        Helper to generate a parameterized pgvector search: returns (sql, params)
+        for `cursor.execute(sql, params)` (psycopg2 pyformat placeholders).
+        `query_text` may also be a list of queries: all of them are embedded in
+        one batched call and a list of (sql, params) pairs is returned.
         """
-        title_vectors = self.generate_embeddings([query_text], model=model)  # returns list of lists
+        if not _SQL_IDENTIFIER.match(table_name):
+            raise ValueError(f"Invalid table name: {table_name!r}")
+
+        queries = [query_text] if isinstance(query_text, str) else list(query_text)
+        title_vectors = self.generate_embeddings_batched(queries, model=model)  # returns list of lists
         if not title_vectors:
             return None
 
-        query_vector = title_vectors[0]
-        vector_str = str(query_vector)
-
         sql = f"""
-        SELECT id, subject, 1 - (embedding <=> '{vector_str}') as similarity
+        SELECT id, subject, 1 - (embedding <=> %(embedding)s::vector) as similarity
         FROM {table_name}
-        ORDER BY embedding <=> '{vector_str}'
-        LIMIT {limit};
+        ORDER BY embedding <=> %(embedding)s::vector
+        LIMIT %(limit)s;
         """
-        return sql
+        statements = [
+            # repr() keeps full float precision and is locale-independent
+            (sql, {"embedding": "[" + ",".join(map(repr, map(float, vector))) + "]", "limit": limit})
+            for vector in title_vectors
+        ]
+        return statements[0] if isinstance(query_text, str) else statements
@@ -1,22 +1,180 @@
-from typing import Any
+import asyncio
+import atexit
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Set, Tuple
 
-from ..forensics.remote_worker_api import RemoteWorkerClient
+from ..forensics.remote_worker_api import RemoteWorkerClient, get_remote_worker_client
+
+# Map local alias to Worker Binding Name (Manifest ID or Binding)
+_AGENT_MAP: Mapping[str, str] = MappingProxyType({
+    # Workflow Agents
+    "engagement_orchestrator": "ENGAGEMENT_ORCHESTRATOR",
+    "verification": "VERIFICATION_AGENT",
+    "strategy": "STRATEGY_AGENT",
+    "classifier": "CLASSIFIER_AGENT",
+    "forensic": "FORENSICS_AGENT",
+
+    # Team Agents
+    "forensic_team": "FORENSIC_ORCHESTRATOR",
+    "judge": "AGENT_JUDGE",
+    "profiler": "AGENT_PROFILER",
+    "timeline": "AGENT_TIMELINE",
+
+    # IT & Tools
+    "geeksquad": "IT_AGENT", # Note: Check binding in manifest, usually inferred or custom
+    "rag": "RAG_AGENT",
+    "terminal": "TERMINAL_AGENT"
+})
+
+# Upper bound on concurrent agent RPCs per fan-out
+_FANOUT_WORKERS = 5
+
+
+# Trace events are fire-and-forget: they are posted from a small background
+# pool so the agent RPC itself never waits on the logging round-trips.
+_LOG_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="agent-log")
+_pending_logs: Set[Future] = set()
+_pending_lock = threading.Lock()
+
+
+def _discard_pending(future: Future):
+    with _pending_lock:
+        _pending_logs.discard(future)
+
+
+def _submit_log(fn, *args, **kwargs):
+    future = _LOG_POOL.submit(fn, *args, **kwargs)
+    with _pending_lock:
+        _pending_logs.add(future)
+    future.add_done_callback(_discard_pending)
+
+
+class _LogBatcher:
+    """
+    Collects trace events and posts them as one batch once `max_size` are
+    queued or `delay` seconds after the first one, so an invoke's start and
+    end events usually share a single request.
+    """
+
+    def __init__(self, delay: float = 0.05, max_size: int = 10):
+        self.delay = delay
+        self.max_size = max_size
+        self._events: List[Tuple[RemoteWorkerClient, Dict]] = []
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+
+    def add(self, client: RemoteWorkerClient, event: Dict):
+        with self._lock:
+            self._events.append((client, event))
+            full = len(self._events) >= self.max_size
+            if not full and self._timer is None:
+                self._timer = threading.Timer(self.delay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        if full:
+            self.flush()
+
+    def _take(self) -> List[Tuple[RemoteWorkerClient, List[Dict]]]:
+        with self._lock:
+            events, self._events = self._events, []
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        by_client: Dict[int, Tuple[RemoteWorkerClient, List[Dict]]] = {}
+        for client, event in events:
+            by_client.setdefault(id(client), (client, []))[1].append(event)
+        return list(by_client.values())
+
+    def flush(self):
+        for client, batch in self._take():
+            try:
+                _submit_log(client.log_events, batch)
+            except RuntimeError:
+                # Pool already shut down (interpreter exit): post on this thread
+                client.log_events(batch)
+
+    def flush_now(self):
+        """Post buffered events on the calling thread and wait for them."""
+        for client, batch in self._take():
+            client.log_events(batch)
+
+
+_LOG_BATCHER = _LogBatcher()
+
+
+def flush_background_logs(timeout: float = 10.0):
+    """Send buffered trace events and wait for them (app shutdown)."""
+    _LOG_BATCHER.flush()
+    with _pending_lock:
+        pending = list(_pending_logs)
+    if pending:
+        wait(pending, timeout=timeout)
+
+
+# By the time atexit handlers run the executors are shut down (submit raises),
+# so whatever is still buffered is drained synchronously instead.
+atexit.register(_LOG_BATCHER.flush_now)
+
+
+def invoke_parallel(
+    calls: Sequence[Tuple["BaseAgentClient", str, dict]], max_workers: int = _FANOUT_WORKERS
+) -> List[Any]:
+    """
+    Run independent (client, action, payload) invocations concurrently and
+    return their results in input order. The first failure is re-raised.
+    """
+    def run(client: "BaseAgentClient", action: str, payload: dict) -> Any:
+        # Small jitter so a burst of calls doesn't hit the Worker in lockstep;
+        # slept on the pool thread, not serially before each submit
+        time.sleep(random.uniform(0, 0.05))
+        return client._invoke(action, payload)
+
+    results: Dict[int, Any] = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {}
+        for index, (client, action, payload) in enumerate(calls):
+            futures[pool.submit(run, client, action, payload)] = index
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    return [results[i] for i in range(len(calls))]
 
 
 class BaseAgentClient:
     def __init__(self, agent_type: str, engagement_id: str = "default"):
-        self.client = RemoteWorkerClient()
+        self.client = get_remote_worker_client()
         self.agent_type = agent_type
         self.engagement_id = engagement_id
+        # Default to uppercase if not found in map
+        self._worker_agent_name = _AGENT_MAP.get(agent_type) or agent_type.upper()
+
+    def invoke_many(self, calls: Sequence[Tuple[str, dict]]) -> List[Any]:
+        """Run several (action, payload) calls on this agent concurrently."""
+        return invoke_parallel([(self, action, payload) for action, payload in calls])
+
+    async def _invoke_async(self, action: str, payload: dict) -> Any:
+        """
+        Awaitable _invoke for async handlers: the blocking RemoteWorkerClient
+        calls run in a worker thread so the event loop stays free.
+        """
+        return await asyncio.to_thread(self._invoke, action, payload)
+
+    def _trace(self, **fields):
+        _LOG_BATCHER.add(
+            self.client,
+            RemoteWorkerClient.build_log_payload(workflow_id=self.engagement_id, **fields),
+        )
 
     def _invoke(self, action: str, payload: dict) -> Any:
         """
         Invokes the remote Worker Agent and logs the attempt and result.
         """
         # 1. Trace Start
-        self.client.log_event(
+        self._trace(
             type="INFO",
-            workflow_id=self.engagement_id,
             step_name=f"{self.agent_type}.{action}",
             message=f"Invoking Agent Action: {action}",
             action_type="AGENT_CALL",
@@ -24,42 +182,17 @@ class BaseAgentClient:
         )
 
         try:
-            # 2. Map local alias to Worker Binding Name (Manifest ID or Binding)
-            agent_map = {
-                # Workflow Agents
-                "engagement_orchestrator": "ENGAGEMENT_ORCHESTRATOR",
-                "verification": "VERIFICATION_AGENT",
-                "strategy": "STRATEGY_AGENT",
-                "classifier": "CLASSIFIER_AGENT",
-                "forensic": "FORENSICS_AGENT",
-                
-                # Team Agents
-                "forensic_team": "FORENSIC_ORCHESTRATOR",
-                "judge": "AGENT_JUDGE",
-                "profiler": "AGENT_PROFILER",
-                "timeline": "AGENT_TIMELINE",
-
-                # IT & Tools
-                "geeksquad": "IT_AGENT", # Note: Check binding in manifest, usually inferred or custom
-                "rag": "RAG_AGENT",
-                "terminal": "TERMINAL_AGENT"
-            }
-            
-            # Default to uppercase if not found in map
-            worker_agent_name = agent_map.get(self.agent_type, self.agent_type.upper())
-
-            # 3. Call Generic RPC
+            # 2. Call Generic RPC
             response = self.client.run_agent(
-                agent_name=worker_agent_name,
+                agent_name=self._worker_agent_name,
                 action=action,
                 payload=payload,
                 agent_id=self.engagement_id,
             )
 
-            # 4. Trace Success
-            self.client.log_event(
+            # 3. Trace Success
+            self._trace(
                 type="INFO",
-                workflow_id=self.engagement_id,
                 step_name=f"{self.agent_type}.{action}",
                 message="Agent Action Complete",
                 action_type="AGENT_RESULT",
@@ -68,9 +201,8 @@ class BaseAgentClient:
             return response
 
         except Exception as e:
-            self.client.log_event(
+            self._trace(
                 type="ERROR",
-                workflow_id=self.engagement_id,
                 step_name=f"{self.agent_type}.{action}",
                 message=str(e),
                 error_type="AGENT_FAILURE",
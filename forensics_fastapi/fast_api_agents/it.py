@@ -1,5 +1,6 @@
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+from ..core.host_client import get_shared_client
 from .base import BaseAgentClient
 
 
@@ -10,6 +11,8 @@ class ItAgentClient(BaseAgentClient):
     """
     def __init__(self, engagement_id: str = "global"):
         super().__init__("geeksquad", engagement_id)
+        # Last (ETag, body) per audit-log window, for conditional polling
+        self._etags: Dict[Tuple, Tuple[str, Dict]] = {}
 
     def spinup_container(self, container_id: str, task_name: str, config: Optional[Dict] = None) -> Dict:
         """
@@ -45,8 +48,8 @@ class ItAgentClient(BaseAgentClient):
         # we need a raw call.
         
         url = f"{self.client.base_url}/api/agent/error/investigate"
-        import requests
-        resp = requests.post(url, json={"errorId": error_id, "containerId": container_id}, headers=self.client.headers)
+        # Reuse the RemoteWorkerClient's pooled session instead of a one-off connection
+        resp = self.client.session.post(url, json={"errorId": error_id, "containerId": container_id}, headers=self.client.headers)
         resp.raise_for_status()
         return resp.text
 
@@ -61,6 +64,24 @@ class ItAgentClient(BaseAgentClient):
         """
         GET /agent/audit/logs
         """
+        params = self._audit_params(container_id, start, end)
+        key = (container_id, start, end)
+        cached = self._etags.get(key)
+        headers = self.client.headers
+        if cached:
+            headers = {**headers, "If-None-Match": cached[0]}
+
+        # Conditional GET: unchanged windows come back as an empty 304
+        resp = self.client.session.get(
+            f"{self.client.base_url}/api/agent/audit/logs", params=params, headers=headers, timeout=30
+        )
+        if resp.status_code == 304 and cached:
+            return cached[1]
+        resp.raise_for_status()
+        return self._remember_audit_logs(key, resp.headers.get("ETag"), resp.json())
+
+    @staticmethod
+    def _audit_params(container_id: Optional[str], start: Optional[str], end: Optional[str]) -> Dict:
         params = {}
         if container_id:
             params['containerId'] = container_id
@@ -68,5 +89,65 @@ class ItAgentClient(BaseAgentClient):
             params['start'] = start
         if end:
             params['end'] = end
-        
-        return self.client._get("/api/agent/audit/logs", params=params)
+        return params
+
+    def _remember_audit_logs(self, key: Tuple, etag: Optional[str], body: Dict) -> Dict:
+        # Requires the Worker to send a stable (content-hash) ETag; otherwise nothing is cached
+        if etag:
+            self._etags[key] = (etag, body)
+        else:
+            self._etags.pop(key, None)
+        return body
+
+    # ------------------------------------------------------------------
+    # Async variants (for FastAPI handlers; share the pooled httpx client)
+    # ------------------------------------------------------------------
+
+    async def _arequest(self, method: str, path: str, **kwargs) -> Any:
+        resp = await get_shared_client().request(
+            method, f"{self.client.base_url}{path}", headers=self.client.headers, **kwargs
+        )
+        resp.raise_for_status()
+        return resp
+
+    async def aspinup_container(self, container_id: str, task_name: str, config: Optional[Dict] = None) -> Dict:
+        resp = await self._arequest("POST", "/api/agent/container/spinup", json={
+            "containerId": container_id,
+            "taskName": task_name,
+            "config": config or {}
+        })
+        return resp.json()
+
+    async def aexecute_task(self, container_id: str, task_name: str, command: str) -> Dict:
+        resp = await self._arequest("POST", "/api/agent/task/execute", json={
+            "containerId": container_id,
+            "taskName": task_name,
+            "command": command
+        })
+        return resp.json()
+
+    async def ainvestigate_error(self, error_id: str, container_id: str) -> str:
+        resp = await self._arequest(
+            "POST", "/api/agent/error/investigate", json={"errorId": error_id, "containerId": container_id}
+        )
+        return resp.text
+
+    async def achat(self, messages: List[Dict]) -> Dict:
+        resp = await self._arequest("POST", "/api/agent/chat", json={"messages": messages})
+        return resp.json()
+
+    async def aget_audit_logs(self, container_id: Optional[str] = None, start: Optional[str] = None, end: Optional[str] = None) -> Dict:
+        params = self._audit_params(container_id, start, end)
+        key = (container_id, start, end)
+        cached = self._etags.get(key)
+        headers = self.client.headers
+        if cached:
+            headers = {**headers, "If-None-Match": cached[0]}
+
+        resp = await get_shared_client().get(
+            f"{self.client.base_url}/api/agent/audit/logs", params=params, headers=headers
+        )
+        if resp.status_code == 304 and cached:
+            return cached[1]
+        resp.raise_for_status()
+        return self._remember_audit_logs(key, resp.headers.get("ETag"), resp.json())
@@ -36,3 +36,4 @@ class TimelineAgentClient(BaseAgentClient):
         Trigger timeline generation.
         """
         return self._invoke("generate", {"engagementId": self.engagement_id})
+
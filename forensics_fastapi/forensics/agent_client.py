@@ -1,7 +1,12 @@
 import os
 from typing import Any, Dict, Optional
 
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ..core.host_client import get_shared_client
 
 
 class AgentBrainClient:
@@ -10,6 +15,32 @@ class AgentBrainClient:
         self.secret = secret or os.environ.get("WORKER_API_KEY")
         self.headers = {"Content-Type": "application/json", "X-Worker-Api-Key": self.secret}
 
+        # Keep-alive pool so repeated asks skip the TCP/TLS handshake
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 502, 503, 504],
+                # ask is a read-only query, so retrying the POST is safe
+                allowed_methods=frozenset({"GET", "POST"}),
+            ),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
     def ask_agent(
         self, engagement_id: str, prompt: str, task: str = "analyze_evidence"
     ) -> Optional[Dict[str, Any]]:
@@ -27,7 +58,45 @@ class AgentBrainClient:
         }
 
         try:
-            resp = requests.post(url, json=payload, headers=self.headers, timeout=60)
+            resp = self.session.post(url, json=payload, timeout=60)
+            resp.raise_for_status()
+            return resp.json()
+        except Exception as e:
+            print(f"Failed to consult Agent Brain: {e}")
+            return None
+
+
+class AsyncAgentBrainClient:
+    """
+    Non-blocking twin of AgentBrainClient for FastAPI handlers.
+    Uses the process-wide pooled httpx.AsyncClient (closed in the app lifespan).
+    """
+
+    def __init__(
+        self,
+        worker_url: Optional[str] = None,
+        secret: Optional[str] = None,
+        client: Optional[httpx.AsyncClient] = None,
+    ):
+        self.base_url = worker_url or os.environ.get("WORKER_URL")
+        self.secret = secret or os.environ.get("WORKER_API_KEY")
+        self.headers = {"Content-Type": "application/json", "X-Worker-Api-Key": self.secret}
+        self.client = client or get_shared_client()
+
+    async def ask_agent(
+        self, engagement_id: str, prompt: str, task: str = "analyze_evidence"
+    ) -> Optional[Dict[str, Any]]:
+        """Async version of AgentBrainClient.ask_agent."""
+        url = f"{self.base_url}/agents/forensic/{engagement_id}/ask"
+
+        payload = {
+            "prompt": prompt,
+            "task": task,
+            "context_request": ["rag", "history"],  # Tell agent to use its brain
+        }
+
+        try:
+            resp = await self.client.post(url, json=payload, headers=self.headers, timeout=60)
             resp.raise_for_status()
             return resp.json()
         except Exception as e:
@@ -1,5 +1,6 @@
+import asyncio
+import hashlib
 import os
-import traceback
 from contextlib import asynccontextmanager
 
 from dotenv import load_dotenv
@@ -14,25 +15,30 @@ from fastapi import (
     WebSocketDisconnect,
 )
 from fastapi.middleware.cors import CORSMiddleware  # [NEW]
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, RedirectResponse, Response
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel, ConfigDict, Field
 
 load_dotenv()
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Set
 
 # --- Lifespan ---
+from forensics_fastapi.agents.base import BaseAgentClient
 from forensics_fastapi.config import EVIDENCE_DIR, OUTPUT_DIR
-from forensics_fastapi.core.host_client import HostIntegrationClient
+from forensics_fastapi.core.host_client import HostIntegrationClient, close_shared_client
+from forensics_fastapi.fast_api_agents.base import flush_background_logs
+from forensics_fastapi.forensics.atomizer import shutdown_atomize_pool
+from forensics_fastapi.forensics.attachments.extractor import close_workflow_client
 from forensics_fastapi.forensics.attachments.pipeline import AttachmentPipeline
+from forensics_fastapi.forensics.cloudflare_ops import close_cloudflare_clients
 from forensics_fastapi.forensics.gmail_collector import GmailCollector
 
 # Import ACRE Modules
-from forensics_fastapi.forensics.ingestion import ArtifactRegistry
 from forensics_fastapi.forensics.logger import logger as app_logger
 from forensics_fastapi.forensics.pipeline import ACREPipeline
 from forensics_fastapi.forensics.remote_worker_api import RemoteWorkerClient
 from forensics_fastapi.forensics.reporter import ForensicReporter
+from forensics_fastapi.forensics.responses import ORJSONResponse
 
 # IMPORT ROUTERS (But include them later)
 from forensics_fastapi.forensics.routers import cli_router, container, engagements, sandbox, strategy, terminal
@@ -61,10 +67,31 @@ async def lifespan(app: FastAPI):
             step_name="Startup",
         )
 
+    app.state.secrets_status = _secrets_snapshot()
+
+    # 3. Gmail client, built once (auth + API discovery) and shared by
+    # /health and /ingest/gmail. No logger: GmailCollector._log calls
+    # logger.<level>(step, msg), not app_logger's (message, step_name).
+    app.state.gmail_error = None
+    try:
+        app.state.gmail = await asyncio.to_thread(
+            GmailCollector,
+            service_account_json=os.environ.get("GCP_SERVICE_ACCOUNT"),
+        )
+    except Exception as e:
+        app.state.gmail = None
+        app.state.gmail_error = str(e)
+        app_logger.warning(f"Gmail client init failed: {e}", step_name="Startup")
+
     yield
 
-    # Cleanup
-    await app.state.host_client.close()
+    # Cleanup (shared bridge pool is closed exactly once)
+    await BaseAgentClient.shutdown_logs()
+    await asyncio.to_thread(flush_background_logs)
+    await close_shared_client()
+    await close_workflow_client()
+    await close_cloudflare_clients()
+    shutdown_atomize_pool()
 
 
 # Initialize remote logger
@@ -86,6 +113,7 @@ app = FastAPI(
     version="1.0.0",
     openapi_tags=tags_metadata,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # --- Middleware (CORS is critical for WebSockets sometimes) ---
@@ -161,43 +189,129 @@ class ReportGenRequest(BaseModel):
     engagement_id: Optional[str] = None
     thread_id: Optional[str] = None
 
+class ReasoningStreamRequest(BaseModel):
+    prompt: str
+    model: str = "@cf/openai/gpt-oss-120b"
+
 
 # ==========================================
 # 📡 MONITOR LOGIC (Hardened)
 # ==========================================
-import json
+from collections import deque
+
+import orjson
+
+
+_SCALARS = (int, float, str, bool)
+
+
+class _VersionedStats(dict):
+    """Stats dict that bumps `version` on every item assignment that changes it."""
+
+    version = 0
+
+    def __setitem__(self, key, value):
+        # Re-assigning an equal scalar (e.g. in_process = 1 on every step_start)
+        # leaves the cached INIT_STATS frame valid. Containers always bump, as
+        # they may have been mutated in place before being re-assigned.
+        if type(value) in _SCALARS and key in self and self[key] == value:
+            return
+        super().__setitem__(key, value)
+        self.version += 1
 
 
 class PipelineMonitor:
+    # Frames buffered per client; the oldest is dropped when a client falls behind
+    OUTBOX_SIZE = 256
+    # Events arriving within this window are sent to clients as one BATCH frame
+    BATCH_WINDOW = 0.025
+
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        # Set: O(1) add/discard on connection churn (WebSocket hashes by identity)
+        self.active_connections: Set[WebSocket] = set()
+        # Encoded INIT_STATS frame, reused until the stats change
+        self._init_frame: Optional[str] = None
+        self._init_version = -1
+        # Events waiting for the current batch window, in arrival order
+        self._pending: List[dict] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
         # Base stats structure
         self.stats = {
             "queued": 0, 
             "in_process": 0, 
             "completed": 0, 
             "threats": 0, 
-            "recent_logs": []
         }
 
+    @property
+    def stats(self) -> Dict:
+        return self._stats
+
+    @stats.setter
+    def stats(self, value: Dict):
+        value = dict(value)
+        # Newest first; appendleft is O(1) and maxlen drops the oldest entry
+        self._recent_logs = deque(value.pop("recent_logs", ()), maxlen=50)
+        self._stats = _VersionedStats(value)
+        self._init_frame = None
+
+    def _init_stats_frame(self) -> str:
+        if self._init_frame is None or self._init_version != self._stats.version:
+            # default=str sanitizes anything non-serializable in a single encode pass
+            self._init_frame = orjson.dumps(
+                {"type": "INIT_STATS", "data": {**self._stats, "recent_logs": list(self._recent_logs)}},
+                default=str, option=orjson.OPT_NON_STR_KEYS
+            ).decode()
+            self._init_version = self._stats.version
+        return self._init_frame
+
+    @staticmethod
+    def enqueue(websocket: WebSocket, frame: str):
+        """Queue a frame for one client; a full outbox drops its oldest frame instead of blocking."""
+        outbox = websocket.state.outbox
+        try:
+            outbox.put_nowait(frame)
+        except asyncio.QueueFull:
+            # Slow client: drop its oldest frame rather than block everyone
+            outbox.get_nowait()
+            outbox.put_nowait(frame)
+
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
+        # Each client gets its own bounded outbox drained by a writer task, so
+        # broadcast never waits on a slow socket
+        websocket.state.outbox = asyncio.Queue(maxsize=self.OUTBOX_SIZE)
+        self.active_connections.add(websocket)
         print(f"[WS] Client connected. Total: {len(self.active_connections)}")
         
         # Safe Initial Send
         try:
-            # We strictly sanitize stats before sending to avoid serialization crashes
-            safe_stats = json.loads(json.dumps(self.stats, default=str))
-            await websocket.send_json({"type": "INIT_STATS", "data": safe_stats})
+            websocket.state.outbox.put_nowait(self._init_stats_frame())
         except Exception as e:
             print(f"[WS] Error sending init stats: {e}")
             # Do NOT raise here, or we kill the connection. 
             # Just log it; the client will get updates later.
+        websocket.state.writer = asyncio.create_task(self._writer_loop(websocket))
+
+    async def _writer_loop(self, websocket: WebSocket):
+        outbox = websocket.state.outbox
+        try:
+            while True:
+                frame = await outbox.get()
+                await websocket.send_text(frame)
+        except (RuntimeError, WebSocketDisconnect):
+            # Connection likely closed/dead
+            self.disconnect(websocket)
+        except Exception as e:
+            print(f"[WS] Broadcast error: {e}")
+            self.disconnect(websocket)
 
     def disconnect(self, websocket: WebSocket):
+        writer = getattr(websocket.state, "writer", None)
+        if writer is not None and writer is not asyncio.current_task():
+            writer.cancel()
         if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
+            self.active_connections.discard(websocket)
             print(f"[WS] Client disconnected. Total: {len(self.active_connections)}")
 
     async def broadcast(self, message: dict):
@@ -217,24 +331,34 @@ class PipelineMonitor:
             if "log" in message:
                 # CRITICAL: Force string conversion to prevent objects breaking JSON
                 log_msg = str(message["log"]) 
-                self.stats["recent_logs"].insert(0, log_msg)
-                self.stats["recent_logs"] = self.stats["recent_logs"][:50]
+                self._recent_logs.appendleft(log_msg)
+                self._stats.version += 1
         except Exception as e:
             print(f"[WS] Error updating stats: {e}")
 
-        # 2. Broadcast to clients safely
-        # We copy the list to avoid "set changed size during iteration" errors
-        for connection in list(self.active_connections):
-            try:
-                # Force sanitization of the outgoing message
-                safe_msg = json.loads(json.dumps(message, default=str))
-                await connection.send_json(safe_msg)
-            except RuntimeError:
-                # Connection likely closed/dead
-                self.disconnect(connection)
-            except Exception as e:
-                print(f"[WS] Broadcast error: {e}")
-                pass
+        # 2. Broadcast to clients on the next batch window
+        self._pending.append(message)
+        if self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(self.BATCH_WINDOW, self._flush)
+
+    def _flush(self):
+        self._flush_handle = None
+        events, self._pending = self._pending, []
+        if not events:
+            return
+        message = events[0] if len(events) == 1 else {"type": "BATCH", "events": events}
+
+        # Encode once for every client; default=str sanitizes odd values
+        try:
+            payload = orjson.dumps(message, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+        except Exception as e:
+            print(f"[WS] Error encoding broadcast: {e}")
+            return
+
+        # Queue for every client without awaiting any socket.
+        # Snapshot to avoid "set changed size during iteration" errors
+        for connection in tuple(self.active_connections):
+            self.enqueue(connection, payload)
 
 monitor = PipelineMonitor()
 
@@ -248,20 +372,22 @@ async def websocket_endpoint(websocket: WebSocket):
     try:
         await monitor.connect(websocket)
         while True:
-            # Keep connection alive. We expect simple pings or nothing.
-            # receive_text() waits for a message. If client disconnects, 
-            # it raises WebSocketDisconnect immediately.
-            data = await websocket.receive_text()
+            # Liveness is handled by protocol-level PING frames (uvicorn
+            # --ws-ping-interval), so this only wakes when the client actually
+            # sends something or disconnects.
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
             
-            # Optional: Heartbeat response
-            if data == "ping":
-                await websocket.send_text("pong")
+            # Optional: legacy app-level heartbeat (queued so it can't
+            # interleave with the writer task's sends)
+            if message.get("text") == "ping" or message.get("bytes") == b"ping":
+                monitor.enqueue(websocket, "pong")
                 
     except WebSocketDisconnect:
         monitor.disconnect(websocket)
     except Exception as e:
-        print(f"[WS] Critical Endpoint Error: {e}")
-        traceback.print_exc()
+        app_logger.exception(f"[WS] Critical Endpoint Error: {e}", step_name="Monitor")
         monitor.disconnect(websocket)
 
 
@@ -318,28 +444,33 @@ async def analyze_email(request: AnalysisRequest):
     pipeline = ACREPipeline(context_data=context, monitor=monitor)
     payload = request.dict(by_alias=True)
     try:
-        result = pipeline.process_message(payload)
+        result = await pipeline.process_message(payload)
         return {"status": "success", "analysisResults": result}
     except Exception as e:
-        traceback.print_exc()
+        app_logger.exception(f"Analyze failed: {e}", step_name="Analyze")
         return {"status": "error", "error": str(e)}
 
 @app.post("/ingest/eml")
 async def ingest_eml(file: UploadFile = File(...)):
-    raw_bytes = await file.read()
-    registry = ArtifactRegistry()
-    sha256 = registry.compute_string_hash(raw_bytes.decode("utf-8", errors="ignore"))
     # from .storage import R2Storage  <-- Removed
     # key = f"evidence/{file.filename}"
     file_location = os.path.join(EVIDENCE_DIR, file.filename or "unknown_file")
     try:
-        # We write directly to the mounted path
-        with open(file_location, "wb") as f:
-            f.write(raw_bytes)
+        # We write directly to the mounted path, streaming in 1 MiB chunks and
+        # hashing the raw bytes as they pass so the upload is never fully buffered
+        sha256_hash = hashlib.sha256()
+        # Disk writes go through worker threads so the event loop stays free
+        f = await asyncio.to_thread(open, file_location, "wb")
+        try:
+            while chunk := await file.read(1 << 20):
+                sha256_hash.update(chunk)
+                await asyncio.to_thread(f.write, chunk)
+        finally:
+            await asyncio.to_thread(f.close)
         
         # Determine relative key for downstream refs
         key = f"evidence/{file.filename}" 
-        return {"status": "stored", "key": key, "sha256": sha256}
+        return {"status": "stored", "key": key, "sha256": sha256_hash.hexdigest()}
     except Exception as e:
         app_logger.error(f"Failed to write evidence file: {e}")
         raise HTTPException(status_code=500, detail="Upload failed")
@@ -347,93 +478,118 @@ async def ingest_eml(file: UploadFile = File(...)):
 @app.post("/ingest/gmail")
 async def ingest_gmail(request: GmailSyncRequest, background_tasks: BackgroundTasks):
     # client = RemoteWorkerClient() 
-    logger = app_logger # Use main logger for now
-    service_account_json = os.environ.get("GCP_SERVICE_ACCOUNT")
-    collector = GmailCollector(service_account_json=service_account_json, logger=logger)
-    if not collector.service:
+    collector = getattr(app.state, "gmail", None)
+    if not collector or not collector.service:
         raise HTTPException(status_code=400, detail="Gmail Auth failed.")
     background_tasks.add_task(collector.sync, request.query, request.engagement_id or "default")
     return {"status": "accepted", "message": "Sync started"}
 
 @app.post("/ingest/attachment")
 async def ingest_attachment(request: AttachmentIngestionRequest, background_tasks: BackgroundTasks):
-    pipeline = AttachmentPipeline()
-    background_tasks.add_task(pipeline.process_file, request.file_path, request.attachment_id, request.session_id, request.engagement_id or "default")
+    # One pipeline per app so its concurrency bound (and S3 client) is shared
+    pipeline = getattr(app.state, "attachments", None)
+    if pipeline is None:
+        pipeline = app.state.attachments = AttachmentPipeline()
+    background_tasks.add_task(pipeline.process_file_bounded, request.file_path, request.attachment_id, request.session_id, request.engagement_id or "default")
     return {"status": "accepted"}
 
 # Health & Reporting
-@app.get("/health", operation_id="health_check")
-async def health_check():
-    """Report health status of container, secrets, and connections."""
-    results = {"secrets": {}, "google": {}, "worker": {}, "status": "ok"}
+REQUIRED_SECRETS = (
+    "GCP_SERVICE_ACCOUNT",
+    "GOOGLE_SCOPES",
+    "WORKER_API_KEY",
+    "CF_ACCESS_CLIENT_ID",
+    "CF_ACCESS_CLIENT_SECRET",
+)
 
-    # 1. Check Secrets
-    required_secrets = [
-        "GCP_SERVICE_ACCOUNT",
-        "GOOGLE_SCOPES",
-        "WORKER_API_KEY",
-        "CF_ACCESS_CLIENT_ID",
-        "CF_ACCESS_CLIENT_SECRET",
-    ]
-    missing = []
-    for s in required_secrets:
-        val = os.environ.get(s)
-        results["secrets"][s] = "present" if val else "missing"
-        if not val:
-            missing.append(s)
 
+def _secrets_snapshot() -> Dict:
+    status = {s: "present" if os.environ.get(s) else "missing" for s in REQUIRED_SECRETS}
+    missing = [s for s in REQUIRED_SECRETS if status[s] == "missing"]
     if missing:
-        results["status"] = "warning"
-        results["secrets"]["missing"] = missing
+        status["missing"] = missing
+    return status
+
 
-    # 2. Check Google Connectivity
+async def _check_google():
+    section, status = {}, None
     try:
         sa_json = os.environ.get("GCP_SERVICE_ACCOUNT")
         if sa_json:
-            # We use a try/except here because instantiating GmailCollector triggers auth
-            try:
-                collector = GmailCollector(service_account_json=sa_json)
-                if collector.service:
-                    results["google"]["status"] = "connected"
-                else:
-                    results["google"]["status"] = "auth_failed"
-                    results["status"] = "error"
-            except Exception as e:
+            # The collector (and its auth) is built once in the lifespan
+            collector = getattr(app.state, "gmail", None)
+            gmail_error = getattr(app.state, "gmail_error", None)
+            if collector is None and gmail_error is None:
+                # Lifespan didn't run (e.g. bare TestClient): build one off-loop
+                collector = await asyncio.to_thread(GmailCollector, service_account_json=sa_json)
+            if collector is not None and collector.service:
+                section["status"] = "connected"
+            elif gmail_error:
                 # If GmailCollector fails init (e.g. bad JSON)
-                results["google"]["status"] = "error" 
-                results["google"]["error"] = str(e)
+                section["status"] = "error" 
+                section["error"] = gmail_error
+            else:
+                section["status"] = "auth_failed"
+                status = "error"
         else:
-            results["google"]["status"] = "skipped_no_sa"
+            section["status"] = "skipped_no_sa"
     except Exception as e:
-        results["google"]["status"] = "error"
-        results["google"]["error"] = str(e)
-        results["status"] = "error"
+        section["status"] = "error"
+        section["error"] = str(e)
+        status = "error"
+    return section, status
 
-    # 3. Check Worker Bridge Connectivity
+
+async def _check_worker():
+    section, status = {}, None
     try:
         bridge_client = getattr(app.state, "host_client", None)
         if bridge_client:
-            results["worker"]["url"] = bridge_client.base_url
+            section["url"] = bridge_client.base_url
             try:
                 # Execute simple query via Bridge
                 _ = await bridge_client.execute_query("SELECT 1 as healthy")
-                results["worker"]["connection"] = "ok"
-                results["worker"]["d1_check"] = "pass"
+                section["connection"] = "ok"
+                section["d1_check"] = "pass"
             except Exception as e:
-                results["worker"]["connection"] = f"failed: {str(e)}"
-                results["worker"]["d1_check"] = "fail"
-                results["status"] = "warning"
-            results["worker"]["status"] = "configured"
+                section["connection"] = f"failed: {str(e)}"
+                section["d1_check"] = "fail"
+                status = "warning"
+            section["status"] = "configured"
         else:
-            results["worker"]["status"] = "client_not_initialized"
+            section["status"] = "client_not_initialized"
             # Not strictly an error if running in standalone mode, but warned
-            results["status"] = "warning"
+            status = "warning"
     except Exception as e:
-        results["worker"]["status"] = "error"
-        results["worker"]["error"] = str(e)
-        results["status"] = "error"
+        section["status"] = "error"
+        section["error"] = str(e)
+        status = "error"
+    return section, status
+
+
+@app.get("/health", operation_id="health_check")
+async def health_check():
+    """Report health status of container, secrets, and connections."""
+    results = {"secrets": {}, "google": {}, "worker": {}, "status": "ok"}
+
+    # 1. Check Secrets (snapshotted at startup; the environment doesn't change)
+    secrets_status = getattr(app.state, "secrets_status", None) or _secrets_snapshot()
+    results["secrets"] = dict(secrets_status)
+    if "missing" in secrets_status:
+        results["status"] = "warning"
+
+    # 2./3. Google and Worker checks are independent, so they run concurrently.
+    # Each returns (section, status override); overrides apply in the
+    # original check order.
+    for name, (section, status) in zip(
+        ("google", "worker"), await asyncio.gather(_check_google(), _check_worker())
+    ):
+        results[name] = section
+        if status:
+            results["status"] = status
 
-    return results
+    # Plain str/dict content: returning the response directly skips jsonable_encoder
+    return ORJSONResponse(results)
 
 @app.post("/reports/generate")
 def generate_report(request: ReportGenRequest):
@@ -442,41 +598,80 @@ def generate_report(request: ReportGenRequest):
     reporter.generate_report_markdown(data)
     return {"status": "generated"}
 
+# Last timeline file contents, keyed by (mtime_ns, size) so polling skips the disk read
+_timeline_cache: Dict = {"stamp": None, "data": b""}
+
 @app.get("/reports/timeline")
 def get_timeline():
+    # Sync handler, so the file read runs in the threadpool. The file is
+    # already JSON: send its bytes as-is instead of parsing and re-encoding.
     path = os.path.join(OUTPUT_DIR, "Reconstructed_Thread.json")
-    if os.path.exists(path):
-        import json
-        with open(path, "r") as f:
-            return json.load(f)
-    raise HTTPException(404, "Not found")
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        raise HTTPException(404, "Not found")
+    stamp = (st.st_mtime_ns, st.st_size)
+    if _timeline_cache["stamp"] != stamp:
+        with open(path, "rb") as f:
+            data = f.read()
+        _timeline_cache.update(stamp=stamp, data=data)
+    return Response(content=_timeline_cache["data"], media_type="application/json")
 
 @app.get("/reports/forensic")
 def get_forensic_report():
     path = os.path.join(OUTPUT_DIR, "Forensic_Report.md")
     if os.path.exists(path):
         with open(path, "r") as f:
-            return {"content": f.read()}
+            return ORJSONResponse({"content": f.read()})
     raise HTTPException(404, "Not found")
 
 @app.get("/api/tests/stream")
 async def stream_tests():
-    import subprocess
-
     from fastapi.responses import StreamingResponse
     async def generator():
-        process = subprocess.Popen(
-            ["uv", "run", "pytest", "-v", "forensics_fastapi/tests"],
-            stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
-            text=True, bufsize=1, cwd=os.getcwd()
+        # Async subprocess: reading pytest's output never blocks the event loop
+        process = await asyncio.create_subprocess_exec(
+            "uv", "run", "pytest", "-v", "forensics_fastapi/tests",
+            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT,
+            cwd=os.getcwd()
         )
         if process.stdout:
-            for line in process.stdout:
-                yield line
-            process.stdout.close()
-        process.wait()
+            async for line in process.stdout:
+                yield line.decode("utf-8", errors="replace")
+        await process.wait()
     return StreamingResponse(generator(), media_type="text/plain")
 
+@app.post("/ai/reasoning/stream")
+def stream_reasoning(request: ReasoningStreamRequest):
+    """
+    Relay reasoning-model text to the caller as server-sent events: one
+    `data: {"delta": ...}` event per chunk, then `event: done`, or
+    `event: error` if the upstream stream broke and the text is incomplete.
+    """
+    from fastapi.responses import StreamingResponse
+
+    from forensics_fastapi.core.worker_ai import WorkerAI
+
+    # The upstream request is sent here, before any headers go out, so a
+    # failed request is still reported as an HTTP error
+    try:
+        deltas = WorkerAI().stream_reasoning_text(request.prompt, model=request.model)
+    except Exception as e:
+        raise HTTPException(status_code=502, detail=f"Reasoning request failed: {e}")
+
+    def events():
+        # Sync generator: Starlette iterates it in a worker thread
+        try:
+            for delta in deltas:
+                yield b"data: " + orjson.dumps({"delta": delta}) + b"\n\n"
+        except Exception as e:
+            print(f"Reasoning stream ended early: {e}")
+            yield b"event: error\ndata: " + orjson.dumps({"error": str(e)}) + b"\n\n"
+        else:
+            yield b"event: done\ndata: {}\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
 
 # ==========================================
 # 🔌 ROUTER INCLUDES (MUST BE LAST)
@@ -493,4 +688,4 @@ app.include_router(cli_router.router)
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=3000)
\ No newline at end of file
+    uvicorn.run(app, host="0.0.0.0", port=3000, ws_ping_interval=20, ws_ping_timeout=20)
\ No newline at end of file
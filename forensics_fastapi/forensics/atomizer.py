@@ -1,11 +1,14 @@
 import hashlib
 import json
+import multiprocessing
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 
 import nltk
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 from bs4.element import NavigableString
+from nltk.tokenize import PunktTokenizer
 
 # Load NLTK model
 # Ensure NLTK_DATA path is respected/added if explicitly set
@@ -25,9 +28,28 @@ except LookupError:
     nltk.download("punkt_tab", download_dir=dl_dir)
 
 
+_COLOR_RE = re.compile(r'color\s*:\s*([^;"]+)')
+# Only <body> is atomized, so <head> (styles, scripts, meta) is never built
+_BODY_ONLY = SoupStrainer("body")
+
+
+def _atom_id(message_id, sequence_index) -> str:
+    # Deterministic, not security-sensitive: blake2b is faster than sha256 here
+    return hashlib.blake2b(f"{message_id}_{sequence_index}".encode(), digest_size=16).hexdigest()
+
+
 class Atomizer:
     def __init__(self):
-        pass
+        # Punkt model, loaded on first use and reused instead of being
+        # resolved through nltk.sent_tokenize on every text node
+        self._tok = None
+        # Serialized visualStyle per distinct style, shared by sibling sentences
+        self._style_cache = {}
+
+    def _sent_tokenize(self, text):
+        if self._tok is None:
+            self._tok = PunktTokenizer("english")
+        return self._tok.tokenize(text)
 
     def atomize(self, message_id, html_content, plain_content=None, sender_email=None):
         """
@@ -38,7 +60,7 @@ class Atomizer:
             # Fallback to plain text if no HTML (treat as depth 0, style none)
             return self._atomize_plain(message_id, plain_content, sender_email)
 
-        soup = BeautifulSoup(html_content, "lxml")  # Strict lxml usage per spec
+        soup = BeautifulSoup(html_content, "lxml", parse_only=_BODY_ONLY)  # Strict lxml usage per spec
 
         atoms = []
         sequence_index = 0
@@ -60,12 +82,13 @@ class Atomizer:
 
                 # 2. Visual Fingerprinting (Style extraction)
                 # Parse 'style' attribute
-                style_attr = str(node.get("style", "")).lower()
+                style_attr = node.get("style")
                 if style_attr:
+                    style_attr = str(style_attr).lower()
                     # Simple parser for color/font-weight
                     if "color" in style_attr:
                         # Extract color value (simplified)
-                        match = re.search(r'color\s*:\s*([^;"]+)', style_attr)
+                        match = _COLOR_RE.search(style_attr)
                         if match:
                             node_style["color"] = match.group(1).strip()
                     if "font-weight" in style_attr or node.name in ["b", "strong"]:
@@ -94,7 +117,7 @@ class Atomizer:
                     return
 
                 # 3. Sentence Segmentation
-                sentences = nltk.sent_tokenize(text)
+                sentences = self._sent_tokenize(text)
                 for sent_text in sentences:
                     sent_text = sent_text.strip()
                     if not sent_text:
@@ -105,13 +128,14 @@ class Atomizer:
 
                     # Serialize Style for Fingerprint
                     # Clean up default styles to reduce noise
-                    clean_style = {k: v for k, v in node_style.items() if v}
-                    visual_json = json.dumps(clean_style, sort_keys=True)
+                    style_key = tuple(sorted((k, v) for k, v in node_style.items() if v))
+                    visual_json = self._style_cache.get(style_key)
+                    if visual_json is None:
+                        visual_json = json.dumps(dict(style_key), sort_keys=True)
+                        self._style_cache[style_key] = visual_json
 
                     atom = {
-                        "id": hashlib.sha256(
-                            f"{message_id}_{sequence_index}".encode()
-                        ).hexdigest(),  # Deterministic ID
+                        "id": _atom_id(message_id, sequence_index),  # Deterministic ID
                         "messageId": message_id,
                         "content": sent_text,
                         "normalizedHash": atom_hash,
@@ -131,7 +155,7 @@ class Atomizer:
     def _atomize_plain(self, message_id, text, sender_email):
         # Plain text processor (fallback)
         atoms = []
-        sentences = nltk.sent_tokenize(text)
+        sentences = self._sent_tokenize(text)
         for i, sent_text in enumerate(sentences):
             sent_text = sent_text.strip()
             if not sent_text:
@@ -146,10 +170,10 @@ class Atomizer:
                 sent_text = sent_text.lstrip("> ").strip()
 
             atom = {
-                "id": hashlib.sha256(f"{message_id}_{i}".encode()).hexdigest(),
+                "id": _atom_id(message_id, i),
                 "messageId": message_id,
                 "content": sent_text,
-                "normalizedHash": hashlib.sha256(sent_text.lower().encode()).hexdigest(),
+                "normalizedHash": hashlib.sha256(sent_text.lower().encode("utf-8")).hexdigest(),
                 "sequenceIndex": i,
                 "quoteDepth": depth,
                 "visualStyle": "{}",
@@ -159,6 +183,39 @@ class Atomizer:
         return atoms
 
 
+# Atomizing is pure-Python CPU work (parse, regex, tokenize, hash), so async
+# callers run it in worker processes instead of on the event loop thread.
+_ATOMIZE_POOL = None
+_WORKER_ATOMIZER = None
+
+
+def get_atomize_pool() -> ProcessPoolExecutor:
+    global _ATOMIZE_POOL
+    if _ATOMIZE_POOL is None:
+        # spawn, not fork: the parent runs HTTP and logging threads whose locks
+        # a forked child could inherit mid-acquire
+        _ATOMIZE_POOL = ProcessPoolExecutor(
+            max_workers=os.cpu_count(), mp_context=multiprocessing.get_context("spawn")
+        )
+    return _ATOMIZE_POOL
+
+
+def shutdown_atomize_pool():
+    """Stop the worker processes (called from the FastAPI lifespan)."""
+    global _ATOMIZE_POOL
+    if _ATOMIZE_POOL is not None:
+        _ATOMIZE_POOL.shutdown(wait=False, cancel_futures=True)
+        _ATOMIZE_POOL = None
+
+
+def atomize_in_worker(message_id, html_content, plain_content=None, sender_email=None):
+    """Process-pool entry point; reuses one Atomizer per worker process."""
+    global _WORKER_ATOMIZER
+    if _WORKER_ATOMIZER is None:
+        _WORKER_ATOMIZER = Atomizer()
+    return _WORKER_ATOMIZER.atomize(message_id, html_content, plain_content, sender_email)
+
+
 if __name__ == "__main__":
     # Test "Franken-Thread"
     html_f = """
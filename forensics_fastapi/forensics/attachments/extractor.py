@@ -1,11 +1,45 @@
+import asyncio
+import atexit
+import io
 import json
 import logging
+import mimetypes
+import os
 import shutil
+import subprocess
 import tempfile
+import threading
 from pathlib import Path
+from typing import Any, Dict, List, Optional
 
 import boto3
 import httpx
+import numpy as np
+import pypdfium2 as pdfium
+import pypdfium2.raw as pdfium_c
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config as BotoConfig
+from pdf2image import convert_from_path, pdfinfo_from_path
+from PIL import Image
+from pypdf import PdfWriter
+
+try:
+    import exiftool
+except ImportError:  # optional speedup; falls back to one exiftool process per file
+    exiftool = None
+
+# Heavy (Ghostscript/PIL plugin) imports, resolved once at import time
+try:
+    import ocrmypdf
+    HAS_OCRMYPDF = True
+except ImportError:
+    HAS_OCRMYPDF = False
+
+try:
+    import img2pdf
+    HAS_IMG2PDF = True
+except ImportError:
+    HAS_IMG2PDF = False
 
 # Import Config for Credentials
 from ...config import (
@@ -20,15 +54,174 @@ from ...config import (
 
 logger = logging.getLogger(__name__)
 
+# Tesseract workers (and upload workers) per document.
+OCR_CONCURRENCY = int(os.getenv("OCR_CONCURRENCY", os.cpu_count() or 1))
+# Pages rendered and handed to one Tesseract process at a time.
+OCR_BATCH_PAGES = int(os.getenv("OCR_BATCH_PAGES", 8))
+# Average text-layer chars per page below which a PDF is treated as image-only and force-OCR'd.
+OCR_TEXT_PROBE_MIN_CHARS = int(os.getenv("OCR_TEXT_PROBE_MIN_CHARS", 32))
+# OCRmyPDF runs at once process-wide; each one is RAM-hungry and fans out its own jobs
+_OCR_MEM_SEM = asyncio.Semaphore(int(os.getenv("OCR_MEM_CONCURRENCY", 2)))
+
+# Page TIFF artifacts: "auto" picks CCITT Group 4 for bilevel (text-only) pages and
+# deflate otherwise; any Pillow TIFF compression name forces that codec.
+RENDER_DPI = 300
+TIFF_COMPRESSION = os.getenv("TIFF_COMPRESSION", "auto")
+# Resolution of the tiff_imgs/ artifact (vision agent); OCR always runs on the RENDER_DPI pages.
+# 200 dpi is enough for printed text and is ~2.25x fewer pixels than 300.
+TIFF_DPI = int(os.getenv("TIFF_DPI", 200))
+
+_workflow_client: Optional[httpx.AsyncClient] = None
+
+
+def get_workflow_client() -> httpx.AsyncClient:
+    """Return the shared AsyncClient for workflow triggers, creating it on first use."""
+    global _workflow_client
+    if _workflow_client is None or _workflow_client.is_closed:
+        _workflow_client = httpx.AsyncClient(
+            timeout=30.0,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        )
+    return _workflow_client
+
+
+async def close_workflow_client():
+    """Close the shared workflow AsyncClient (called once from the FastAPI lifespan)."""
+    global _workflow_client
+    if _workflow_client is not None:
+        await _workflow_client.aclose()
+        _workflow_client = None
+
+
+_s3_client = None
+_s3_lock = threading.Lock()
+
+
+def get_s3_client():
+    """Return the shared R2 client (boto3 clients are thread-safe), creating it on first use."""
+    global _s3_client
+    with _s3_lock:
+        if _s3_client is None:
+            _s3_client = boto3.client(
+                's3',
+                endpoint_url=R2_ENDPOINT_URL,
+                aws_access_key_id=AWS_ACCESS_KEY_ID,
+                aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
+                region_name='auto',  # R2 requires region, usually 'auto' or 'us-east-1'
+                # Throttling/5xx/connection errors back off exponentially with jitter
+                # instead of failing the whole attachment on one transient R2 error
+                config=BotoConfig(retries={"max_attempts": 3, "mode": "standard"}),
+            )
+        return _s3_client
+
+
+# Persistent `exiftool -stay_open` process; Perl startup costs more than a metadata read.
+# ExifToolHelper is not thread-safe, so calls are serialized.
+_exiftool = None
+_exiftool_lock = threading.Lock()
+
+
+def _exiftool_metadata(path: Path) -> Dict[str, Any]:
+    global _exiftool
+    with _exiftool_lock:
+        if _exiftool is None or not _exiftool.running:
+            _exiftool = exiftool.ExifToolHelper(common_args=["-n"])
+        data = _exiftool.execute_json(str(path))
+    return data[0] if data else {}
+
+
+def close_exiftool():
+    """Terminate the persistent exiftool process (registered with atexit)."""
+    global _exiftool
+    with _exiftool_lock:
+        if _exiftool is not None:
+            try:
+                _exiftool.terminate()
+            except Exception:
+                pass
+            _exiftool = None
+
+
+atexit.register(close_exiftool)
+
+
+# PDFium is not thread-safe, even across separate documents
+_PDFIUM_LOCK = threading.Lock()
+
+
+def _pdf_page_texts(pdf_path: Path) -> List[str]:
+    """Per-page text layer via PDFium (much faster than pypdf's pure-Python extractor)."""
+    with _PDFIUM_LOCK:
+        pdf = pdfium.PdfDocument(str(pdf_path))
+        try:
+            return _document_texts(pdf)
+        finally:
+            pdf.close()
+
+
+def _document_texts(pdf) -> List[str]:
+    texts = []
+    for page in pdf:
+        textpage = page.get_textpage()
+        texts.append(textpage.get_text_range().replace("\r\n", "\n"))
+        textpage.close()
+        page.close()
+    return texts
+
+
+def _first_page_is_scan(pdf) -> bool:
+    """A page-sized image on page 1 means a scan, even if it carries an OCR text layer."""
+    page = pdf[0]
+    try:
+        width, height = page.get_size()
+        for obj in page.get_objects(filter=(pdfium_c.FPDF_PAGEOBJ_IMAGE,)):
+            left, bottom, right, top = obj.get_bounds() if hasattr(obj, "get_bounds") else obj.get_pos()
+            if (right - left) * (top - bottom) >= 0.8 * width * height:
+                return True
+        return False
+    finally:
+        page.close()
+
+
+def _probe_pdf(pdf_path: Path):
+    """(per-page text layer, first page is a scan) in one PDFium pass."""
+    with _PDFIUM_LOCK:
+        pdf = pdfium.PdfDocument(str(pdf_path))
+        try:
+            if not len(pdf):
+                return [], False
+            return _document_texts(pdf), _first_page_is_scan(pdf)
+        finally:
+            pdf.close()
+
+
+def _is_bilevel(image) -> bool:
+    """
+    True for pages that are effectively black text on white: almost no
+    coloured pixels and almost no mid-grey tones beyond anti-aliased edges.
+    Sampled at quarter resolution.
+    """
+    sample = image.reduce(4)
+    if sample.mode not in ("1", "L"):
+        rgb = np.asarray(sample.convert("RGB"), dtype=np.int16)
+        if ((rgb.max(axis=2) - rgb.min(axis=2)) > 48).mean() > 0.01:
+            return False
+    gray = np.asarray(sample.convert("L"))
+    return ((gray > 64) & (gray < 192)).mean() < 0.05
+
+
 class ForensicAttachmentProcessor:
     def __init__(self):
-        # Initialize S3/R2 Client
-        self.s3 = boto3.client(
-            's3',
-            endpoint_url=R2_ENDPOINT_URL,
-            aws_access_key_id=AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
-            region_name='auto'  # R2 requires region, usually 'auto' or 'us-east-1'
+        # Shared S3/R2 Client (one connection pool for every processor)
+        self.s3 = get_s3_client()
+        # 64 MB parts keep large TIFFs/PDFs to few R2 segments while parts upload in parallel
+        self._transfer_config = TransferConfig(
+            multipart_threshold=64 * 1024 * 1024,
+            multipart_chunksize=64 * 1024 * 1024,
+            max_concurrency=10,
+            use_threads=True,
+            max_io_queue=100,
         )
         self.evidence_bucket = R2_EVIDENCE_BUCKET_NAME
         self.doc_pages_bucket = R2_DOC_PAGES_BUCKET_NAME
@@ -59,7 +252,7 @@ class ForensicAttachmentProcessor:
                 # 1. Upload ORIGINAL to Evidence Bucket
                 # Key: evidence/{session_id}/{attachment_id}/original/{filename}
                 original_key = f"evidence/{session_id}/{attachment_id}/original/{Path(file_path).name}"
-                self._upload_file(file_path, self.evidence_bucket, original_key)
+                await asyncio.to_thread(self._upload_file, file_path, self.evidence_bucket, original_key)
                 artifacts.append({
                     "type": "ORIGINAL",
                     "key": original_key,
@@ -69,7 +262,7 @@ class ForensicAttachmentProcessor:
                 })
 
                 # 2. Extract Metadata
-                extracted_metadata = self._extract_exif_metadata(file_path)
+                extracted_metadata = await asyncio.to_thread(self._extract_exif_metadata, file_path)
 
                 # 3. Content Processing (PDF/Image Pipeline)
                 mime_type = self._guess_mime(file_path)
@@ -78,20 +271,20 @@ class ForensicAttachmentProcessor:
                 if "pdf" in mime_type or "image" in mime_type:
                     # Rename input to safe name in temp
                     safe_input = temp_path / f"input_{Path(file_path).name}"
-                    shutil.copy(file_path, safe_input)
+                    await asyncio.to_thread(shutil.copy, file_path, safe_input)
 
                     if "image" in mime_type and "pdf" not in mime_type:
                         # Convert image to PDF first for consistent pipeline
-                        import img2pdf
+                        if not HAS_IMG2PDF:
+                            raise RuntimeError("img2pdf is not installed")
                         pdf_input = temp_path / f"{attachment_id}_converted.pdf"
-                        pdf_bytes = img2pdf.convert(str(safe_input))
+                        pdf_bytes = await asyncio.to_thread(img2pdf.convert, str(safe_input))
                         if pdf_bytes:
-                            with open(pdf_input, "wb") as f:
-                                f.write(pdf_bytes)
+                            await asyncio.to_thread(pdf_input.write_bytes, pdf_bytes)
                         safe_input = pdf_input
 
                     # Run strict forensic pipeline
-                    pipeline_results = self._process_forensic_pipeline(
+                    pipeline_results = await self._process_forensic_pipeline(
                         safe_input, 
                         temp_path, 
                         attachment_id, 
@@ -118,37 +311,137 @@ class ForensicAttachmentProcessor:
                 logger.error(f"Failed to process attachment {attachment_id}: {e}", exc_info=True)
                 return {"success": False, "error": str(e)}
 
-    def _process_forensic_pipeline(self, pdf_path: Path, work_dir: Path, attachment_id: str, original_filename: str):
-        """
-        Executes the Standard Forensic Pipeline:
-        - OCRmyPDF (Force OCR for clean text layer)
-        - PDF2Image (TIFF extraction)
-        - PyPDF (Text Extraction)
+    async def _process_forensic_pipeline(self, pdf_path: Path, work_dir: Path, attachment_id: str, original_filename: str):
         """
-        import ocrmypdf
-        from pdf2image import convert_from_path
-        from pypdf import PdfReader
+        Executes the Standard Forensic Pipeline as overlapping stages:
+        - Render: PDF2Image, OCR_BATCH_PAGES pages at a time, straight to disk
+        - OCR: one Tesseract process per rendered batch
+        - Upload: per-page OCR text and TIFF as soon as a batch is OCR'd
+        Then the searchable PDF and its per-page text layer: the input itself when
+        born-digital (no OCR at all), OCRmyPDF skip_text for scans that already carry
+        a text layer and for born-digital PDFs with textless (scanned) pages, otherwise
+        the merged Tesseract PDF output.
 
+        The returned page list keeps document order.
+        """
         results = {
             "artifacts": [],
             "pages": []
         }
 
-        # A. OCR Processing
+        # A. Rasterize once: the same page images feed the searchable PDF (for scans),
+        # the Tesseract 'vision' text and the TIFF artifacts.
         # Output: R2_DOC_PAGES/[converted_pdfs]/{id}/{name}.pdf
         searchable_pdf = work_dir / f"{attachment_id}_searchable.pdf"
+        pages_dir = work_dir / "pages"
+        pages_dir.mkdir(exist_ok=True)
         
         try:
-            logger.info("Running OCRmyPDF...")
-            ocrmypdf.ocr(
-                str(pdf_path),
-                str(searchable_pdf),
-                force_ocr=True,      # Force rasterization + OCR to ensure consistency
-                output_type='pdf',
-                sidecar=None,        # We'll extract text manually per page
-                # deskew=True,       # Optional: deskew
-                msg=False
-            )
+            page_count = (await asyncio.to_thread(pdfinfo_from_path, str(pdf_path)))["Pages"]
+            # Born-digital PDFs skip OCR entirely: the input is already searchable and its
+            # text layer stands in for the OCR text. Scans get a text layer from the rendered pages;
+            # "mixed" PDFs reuse the layer and OCR only the pages without one.
+            kind, layer_texts = await asyncio.to_thread(self._probe_text_layer, pdf_path)
+            born_digital = kind == "born_digital"
+            reuse_layer = kind in ("born_digital", "mixed")
+            force_ocr = kind == "image_only"
+            if born_digital:
+                searchable_pdf = pdf_path
+            renderers = ["txt", "pdf"] if force_ocr else ["txt"]
+            batches = [
+                (first, min(first + OCR_BATCH_PAGES - 1, page_count))
+                for first in range(1, page_count + 1, OCR_BATCH_PAGES)
+            ]
+
+            # Bounded queues cap how many rendered-but-unprocessed pages sit on disk
+            render_q: asyncio.Queue = asyncio.Queue(maxsize=OCR_CONCURRENCY)
+            upload_q: asyncio.Queue = asyncio.Queue(maxsize=OCR_CONCURRENCY * OCR_BATCH_PAGES)
+
+            async def render():
+                for index, (first, last) in enumerate(batches):
+                    paths = await asyncio.to_thread(
+                        convert_from_path,
+                        str(pdf_path),
+                        dpi=RENDER_DPI,
+                        fmt='png',
+                        first_page=first,
+                        last_page=last,
+                        thread_count=os.cpu_count() or 1,
+                        output_folder=str(pages_dir),
+                        paths_only=True,
+                    )
+                    await render_q.put((index, first, paths))
+                for _ in range(OCR_CONCURRENCY):
+                    await render_q.put(None)
+
+            async def ocr_worker():
+                while (batch := await render_q.get()) is not None:
+                    index, first, paths = batch
+                    if reuse_layer:
+                        texts = layer_texts[first - 1:first - 1 + len(paths)]
+                        textless = [i for i, text in enumerate(texts) if not text.strip()]
+                        if textless:
+                            ocr = await self._run_tesseract(
+                                [paths[i] for i in textless], work_dir / f"ocr_batch_{index}", renderers
+                            )
+                            for i, text in zip(textless, ocr):
+                                texts[i] = text
+                    else:
+                        texts = await self._run_tesseract(paths, work_dir / f"ocr_batch_{index}", renderers)
+                    for offset, (text, path) in enumerate(zip(texts, paths)):
+                        await upload_q.put((first + offset, text, path))
+
+            async def ocr_stage():
+                async with asyncio.TaskGroup() as workers:
+                    for _ in range(OCR_CONCURRENCY):
+                        workers.create_task(ocr_worker())
+                for _ in range(OCR_CONCURRENCY):
+                    await upload_q.put(None)
+
+            async def searchable_layer():
+                async with _OCR_MEM_SEM:
+                    await asyncio.to_thread(
+                        ocrmypdf.ocr,
+                        str(pdf_path),
+                        str(searchable_pdf),
+                        skip_text=True,
+                        optimize=0,          # Skip pngquant/jbig2 passes
+                        jobs=os.cpu_count(),
+                        output_type='pdf',   # Plain PDF avoids the slow PDF/A conversion
+                        sidecar=None,        # We'll extract text manually per page
+                        # deskew=True,       # Optional: deskew
+                        msg=False
+                    )
+
+            async def upload_worker():
+                while (item := await upload_q.get()) is not None:
+                    page_num, text, path = item
+                    keys = self._page_keys(attachment_id, page_num)
+                    await asyncio.gather(
+                        asyncio.to_thread(self._upload_text, text, self.doc_pages_bucket, keys["ocrTextKey"]),
+                        asyncio.to_thread(self._upload_tiff, path, self.doc_pages_bucket, keys["tiffKey"]),
+                    )
+
+            logger.info(f"Rendering/OCR of {page_count} pages ({kind})...")
+            async with asyncio.TaskGroup() as stages:
+                stages.create_task(render())
+                stages.create_task(ocr_stage())
+                for _ in range(OCR_CONCURRENCY):
+                    stages.create_task(upload_worker())
+                if kind in ("ocr_layer", "mixed"):
+                    if not HAS_OCRMYPDF:
+                        raise RuntimeError("ocrmypdf is not installed")
+                    stages.create_task(searchable_layer())
+
+            if force_ocr:
+                def _merge():
+                    writer = PdfWriter()
+                    for index in range(len(batches)):
+                        writer.append(str(work_dir / f"ocr_batch_{index}.pdf"))
+                    with open(searchable_pdf, "wb") as f:
+                        writer.write(f)
+
+                await asyncio.to_thread(_merge)
             
             # Upload Converted PDF
             pdf_key = f"converted_pdfs/{attachment_id}/{original_filename}.pdf" # Ensure extension?
@@ -156,11 +449,12 @@ class ForensicAttachmentProcessor:
             if not pdf_key.lower().endswith('.pdf'):
                 pdf_key += ".pdf"
 
-            self._upload_file(searchable_pdf, self.doc_pages_bucket, pdf_key)
+            await asyncio.to_thread(self._upload_file, searchable_pdf, self.doc_pages_bucket, pdf_key)
             results['artifacts'].append({ 
                 "type": "SEARCHABLE_PDF", 
                 "key": pdf_key,
-                "bucket": self.doc_pages_bucket 
+                "bucket": self.doc_pages_bucket,
+                "bornDigital": born_digital,
             })
 
         except Exception as e:
@@ -168,90 +462,95 @@ class ForensicAttachmentProcessor:
             # Fallback? If OCR fails, we might abort or try to continue with original
             return results 
 
-        # B. Page Processing Loop
+        # B. Extracted Text (the searchable PDF's text layer), concurrent and order-preserving
         try:
-            reader = PdfReader(str(searchable_pdf))
-            num_pages = len(reader.pages)
-            
-            # Render TIFFs
-            logger.info("Rendering TIFFs...")
-            # pdf2image returns PIL images
-            images = convert_from_path(str(searchable_pdf), dpi=300, fmt='tiff')
-
-            from typing import Any, Dict
-            for i in range(num_pages):
-                page_num = i + 1
-                page_data: Dict[str, Any] = {
-                   "pageNumber": page_num
-                }
+            texts = layer_texts if born_digital else await asyncio.to_thread(_pdf_page_texts, searchable_pdf)
 
-                # 1. Extracted Text (Python)
-                # Key: {id}/extracted_txt/pg_{num}.txt
-                # Note: pdf_reader.pages[i].extract_text() gives us the text layer from OCRmyPDF
-                text_content = reader.pages[i].extract_text() or ""
-                
-                txt_filename = f"pg_{page_num}.txt"
-                txt_path = work_dir / f"extracted_{txt_filename}"
-                with open(txt_path, "w") as f:
-                    f.write(text_content)
-                
-                extract_key = f"{attachment_id}/extracted_txt/{txt_filename}"
-                self._upload_file(txt_path, self.doc_pages_bucket, extract_key)
-                page_data["extractedTextKey"] = extract_key
-
-                # 2. OCR Text 
-                # Key: {id}/ocr_txt/pg_{num}.txt
-                # Since we forced OCR, the 'extracted text' IS the OCR text effectively.
-                # However, the requirements distinguish them.
-                # 'extracted_txt' = Standard python pipeline extraction from native file (before OCR?)
-                # 'ocr_txt' = From Tesseract/EasyOCR (or the OCR layer we just made)
-                # To be strictly compliant:
-                # We could run tesseract on the TIFF image separately to get 'ocr_txt'.
-                # Let's do that to have distinct 'vision' vs 'pdf' layers if needed.
-                # OR, we treat the OCRmyPDF output as the 'ocr_txt'.
-                # Let's use Tesseract on the image for 'ocr_txt' to be robust.
-                
-                import pytesseract
-                # image is the PIL image from pdf2image
-                ocr_text_content = pytesseract.image_to_string(images[i])
-                
-                ocr_filename = f"pg_{page_num}.txt"
-                ocr_path = work_dir / f"ocr_{ocr_filename}"
-                with open(ocr_path, "w") as f:
-                    f.write(ocr_text_content)
-
-                ocr_key = f"{attachment_id}/ocr_txt/{ocr_filename}"
-                self._upload_file(ocr_path, self.doc_pages_bucket, ocr_key)
-                page_data["ocrTextKey"] = ocr_key
-
-                # 3. TIFF Image
-                # Key: {id}/tiff_imgs/pg_{num}.tiff
-                tiff_filename = f"pg_{page_num}.tiff"
-                tiff_path = work_dir / tiff_filename
-                
-                # Save as TIFF
-                images[i].save(tiff_path, compression="tiff_deflate") # or uncompressed
-                
-                tiff_key = f"{attachment_id}/tiff_imgs/{tiff_filename}"
-                self._upload_file(tiff_path, self.doc_pages_bucket, tiff_key)
-                page_data["tiffKey"] = tiff_key
-                page_data["r2Key"] = tiff_key # Standard key for vision agent
+            sem = asyncio.Semaphore(OCR_CONCURRENCY)
 
-                results['pages'].append(page_data)
+            async def _upload_extracted(page_num, text_content):
+                keys = self._page_keys(attachment_id, page_num)
+                async with sem:
+                    await asyncio.to_thread(self._upload_text, text_content, self.doc_pages_bucket, keys["extractedTextKey"])
+                return {"pageNumber": page_num, **keys}
+
+            results['pages'] = list(await asyncio.gather(*(
+                _upload_extracted(i + 1, text) for i, text in enumerate(texts[:page_count])
+            )))
 
         except Exception as e:
             logger.error(f"Page processing failed: {e}", exc_info=True)
 
         return results
 
+    @staticmethod
+    def _page_keys(attachment_id: str, page_num: int) -> Dict[str, Any]:
+        """
+        R2 keys for the three per-page artifacts:
+        - extracted_txt: the searchable PDF's text layer
+        - ocr_txt: Tesseract run on the rendered page image ('vision' layer)
+        - tiff_imgs: the rendered page image (r2Key for the vision agent)
+        """
+        tiff_key = f"{attachment_id}/tiff_imgs/pg_{page_num}.tiff"
+        return {
+            "extractedTextKey": f"{attachment_id}/extracted_txt/pg_{page_num}.txt",
+            "ocrTextKey": f"{attachment_id}/ocr_txt/pg_{page_num}.txt",
+            "tiffKey": tiff_key,
+            "r2Key": tiff_key, # Standard key for vision agent
+        }
+
+    async def _run_tesseract(self, page_paths, out_base: Path, renderers):
+        """Single Tesseract invocation over a file list; returns the text split per page."""
+        list_file = Path(f"{out_base}_files.txt")
+        list_file.write_text("".join(f"{path}\n" for path in page_paths))
+
+        proc = await asyncio.create_subprocess_exec(
+            "tesseract", str(list_file), str(out_base), "-c", "page_separator=\f", *renderers,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        _, stderr = await proc.communicate()
+        if proc.returncode != 0:
+            raise RuntimeError(f"tesseract exited {proc.returncode}: {stderr.decode(errors='replace').strip()}")
+
+        # Every page (including the last) is terminated by the separator
+        pages = Path(f"{out_base}.txt").read_text().split("\f")[:len(page_paths)]
+        return pages + [""] * (len(page_paths) - len(pages))
+
+    def _probe_text_layer(self, pdf_path: Path):
+        """
+        Classifies the input by its existing text layer, returning (kind, texts):
+        - "born_digital": real text layer on every page, no page-sized scan image; no OCR needed
+        - "mixed": born-digital, but some pages have no text layer at all (e.g. appended
+          signature scans); only those pages are OCR'd
+        - "ocr_layer": scanned pages that already carry a usable text layer
+        - "image_only": text layer too thin to trust; every page is OCR'd
+        """
+        try:
+            texts, scanned = _probe_pdf(pdf_path)
+        except Exception as e:
+            logger.warning(f"Text layer probe failed, forcing OCR: {e}")
+            return "image_only", []
+        if not texts or sum(len(text.strip()) for text in texts) / len(texts) < OCR_TEXT_PROBE_MIN_CHARS:
+            return "image_only", texts
+        if scanned:
+            return "ocr_layer", texts
+        if not all(text.strip() for text in texts):
+            return "mixed", texts
+        return "born_digital", texts
+
     def _guess_mime(self, path: Path):
-        import mimetypes
         type, _ = mimetypes.guess_type(path)
         return type or "application/octet-stream"
 
     def _extract_exif_metadata(self, path: Path):
+        if exiftool is not None:
+            try:
+                return _exiftool_metadata(path)
+            except Exception as e:
+                logger.warning(f"Persistent exiftool failed, falling back to a one-shot run: {e}")
+                close_exiftool()
         try:
-            import subprocess
             # Use -json for proper parsing, -g for group names if needed (but -j handles flat fine usually)
             # -n for numerical values where appropriate
             result = subprocess.run(
@@ -267,7 +566,35 @@ class ForensicAttachmentProcessor:
         return {}
 
     def _upload_file(self, path: Path, bucket: str, key: str):
-        self.s3.upload_file(str(path), bucket, key)
+        self.s3.upload_file(str(path), bucket, key, Config=self._transfer_config)
+        logger.info(f"Uploaded {key} to {bucket}")
+
+    def _upload_text(self, text: str, bucket: str, key: str):
+        # Small objects: single PUT, no temp file and no multipart overhead
+        self.s3.put_object(Bucket=bucket, Key=key, Body=text.encode("utf-8"), ContentType="text/plain; charset=utf-8")
+        logger.info(f"Uploaded {key} to {bucket}")
+
+    def _upload_tiff(self, image_path, bucket: str, key: str):
+        buf = io.BytesIO()
+        with Image.open(image_path) as image:
+            compression = TIFF_COMPRESSION
+            if compression == "auto":
+                compression = "group4" if _is_bilevel(image) else "tiff_deflate"
+
+            if compression == "group4":
+                image = image.convert("L")
+            # Tesseract reads the full-resolution render from disk; the artifact is downsampled
+            dpi = min(TIFF_DPI, RENDER_DPI)
+            if dpi < RENDER_DPI:
+                scale = dpi / RENDER_DPI
+                image = image.resize(
+                    (round(image.width * scale), round(image.height * scale)), Image.Resampling.LANCZOS
+                )
+            if compression == "group4":
+                image = image.convert("1", dither=Image.Dither.NONE)
+            image.save(buf, format="TIFF", compression=compression, dpi=(dpi, dpi))
+        buf.seek(0)
+        self.s3.upload_fileobj(buf, bucket, key, Config=self._transfer_config)
         logger.info(f"Uploaded {key} to {bucket}")
 
     async def _trigger_workflow(self, payload: dict):
@@ -280,14 +607,14 @@ class ForensicAttachmentProcessor:
             "Content-Type": "application/json"
         }
 
-        async with httpx.AsyncClient() as client:
-            # Increase timeout for large payloads if necessary, though payload is mostly keys now
-            response = await client.post(url, json=payload, headers=headers, timeout=30.0)
-            try:
-                response.raise_for_status()
-                logger.info(f"Triggered workflow: {response.json()}")
-                return response.json()
-            except httpx.HTTPStatusError as e:
-                logger.error(f"Workflow trigger failed: {e.response.text}")
-                raise e
+        # Pooled client: repeated triggers reuse the warm connection to the Worker
+        # Increase timeout for large payloads if necessary, though payload is mostly keys now
+        response = await get_workflow_client().post(url, json=payload, headers=headers, timeout=30.0)
+        try:
+            response.raise_for_status()
+            logger.info(f"Triggered workflow: {response.json()}")
+            return response.json()
+        except httpx.HTTPStatusError as e:
+            logger.error(f"Workflow trigger failed: {e.response.text}")
+            raise e
 
@@ -1,15 +1,21 @@
 
+import asyncio
 import logging
+import os
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Sequence, Tuple, Union
 
 from .extractor import ForensicAttachmentProcessor
 
 logger = logging.getLogger(__name__)
 
+# Attachments processed at once per pipeline instance
+ATTACHMENT_CONCURRENCY = int(os.getenv("ATTACHMENT_CONCURRENCY", os.cpu_count() or 1))
+
 class AttachmentPipeline:
     def __init__(self):
         self.processor = ForensicAttachmentProcessor()
+        self._sem = asyncio.Semaphore(ATTACHMENT_CONCURRENCY)
 
     async def process_file(self, file_path: str, attachment_id: str, session_id: str, engagement_id: Optional[str] = None) -> dict:
         """
@@ -45,3 +51,20 @@ class AttachmentPipeline:
         except Exception as e:
             logger.error(f"Attachment pipeline failed for {attachment_id}: {e}", exc_info=True)
             raise e
+
+    async def process_file_bounded(self, file_path: str, attachment_id: str, session_id: str, engagement_id: Optional[str] = None) -> dict:
+        """process_file, waiting for a slot so at most ATTACHMENT_CONCURRENCY run at once."""
+        async with self._sem:
+            return await self.process_file(file_path, attachment_id, session_id, engagement_id)
+
+    async def process_batch(self, items: Sequence[Tuple]) -> List[Union[dict, BaseException]]:
+        """
+        Processes several attachments concurrently, bounded by ATTACHMENT_CONCURRENCY.
+
+        Args:
+            items: (file_path, attachment_id, session_id[, engagement_id]) tuples.
+
+        Returns:
+            One result per item, in input order; failures are returned as the exception.
+        """
+        return await asyncio.gather(*(self.process_file_bounded(*item) for item in items), return_exceptions=True)
@@ -1,4 +1,23 @@
-import json
+from functools import lru_cache
+
+import orjson
+
+# (property, value) pairs that mark an in-quote interjection; colour is matched by substring
+_AGGRESSIVE_STYLE = frozenset({("font_weight", "bold"), ("text_transform", "uppercase")})
+
+
+@lru_cache(maxsize=1024)
+def _is_aggressive_style(visual_style_str: str) -> bool:
+    """Parsed once per distinct visualStyle string; atoms in a thread share a handful of styles."""
+    visual_style = orjson.loads(visual_style_str)
+    if not visual_style:
+        return False
+    color = visual_style.get("color")
+    if isinstance(color, str) and "red" in color:
+        return True
+    return not _AGGRESSIVE_STYLE.isdisjoint(
+        (k, v) for k, v in visual_style.items() if isinstance(v, str)
+    )
 
 
 class AttributionEngine:
@@ -18,8 +37,6 @@ class AttributionEngine:
 
         for atom in atoms:
             quote_depth = atom.get("quoteDepth", 0)
-            visual_style_str = atom.get("visualStyle", "{}")
-            visual_style = json.loads(visual_style_str)
 
             # Heuristic 1: Depth 0 = Sender
             if quote_depth == 0:
@@ -32,18 +49,8 @@ class AttributionEngine:
                 # Heuristic 2: Inline Reply Detection (The "Franken-Thread" Logic)
                 # If highly styled (color/bold) inside a quote, it's likely the Sender interrupting
 
-                is_aggressive_style = False
-                if visual_style:
-                    # Check for Red or Bold
-                    if "color" in visual_style and "red" in visual_style["color"]:
-                        is_aggressive_style = True
-                    if "font_weight" in visual_style and visual_style["font_weight"] == "bold":
-                        is_aggressive_style = True
-                    if (
-                        "text_transform" in visual_style
-                        and visual_style["text_transform"] == "uppercase"
-                    ):
-                        is_aggressive_style = True
+                # Check for Red or Bold (or shouting)
+                is_aggressive_style = _is_aggressive_style(atom.get("visualStyle") or "{}")
 
                 if is_aggressive_style:
                     # Flag as Interjection
@@ -1,16 +1,104 @@
 import logging
 import os
-from typing import Any, Dict, List, Optional
+import threading
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import httpx
 
 # Configure simple logging to match console.log behavior
 logging.basicConfig(level=logging.INFO, format="%(message)s")
 logger = logging.getLogger(__name__)
 
 
+class CloudflareAPIError(Exception):
+    """Non-2xx response from the Cloudflare API (keeps the status for retry logic)."""
+
+    def __init__(self, message: str, status_code: int, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+# Module-wide HTTP/2 clients: calls to api.cloudflare.com multiplex over warm connections
+_CLIENT_OPTIONS = dict(
+    http2=True,
+    timeout=30.0,
+    follow_redirects=True,
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+)
+_client: Optional[httpx.Client] = None
+_async_client: Optional[httpx.AsyncClient] = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> httpx.Client:
+    global _client
+    with _client_lock:
+        if _client is None or _client.is_closed:
+            _client = httpx.Client(**_CLIENT_OPTIONS)
+        return _client
+
+
+def _get_async_client() -> httpx.AsyncClient:
+    global _async_client
+    if _async_client is None or _async_client.is_closed:
+        _async_client = httpx.AsyncClient(**_CLIENT_OPTIONS)
+    return _async_client
+
+
+async def close_cloudflare_clients():
+    """Close the shared Cloudflare API clients (called once from the FastAPI lifespan)."""
+    global _client, _async_client
+    if _async_client is not None:
+        await _async_client.aclose()
+        _async_client = None
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None  # HTTP-date form; callers fall back to their own backoff
+
+
+# (config key, env var) pairs read by get_cloudflare_config, in resolution order
+_CONFIG_SOURCES = (
+    ("cloudflare_account_id", "CLOUDFLARE_ACCOUNT_ID"),
+    ("cloudflare_d1_database_id", "CLOUDFLARE_D1_DATABASE_ID"),
+    ("cloudflare_vectorize_index", "CLOUDFLARE_VECTORIZE_INDEX_NAME"),
+    ("cloudflare_vectorize_index", "CLOUDFLARE_VECTORIZE_INDEX"),
+    ("cloudflare_vectorize_embedding_model", "CLOUDFLARE_VECTORIZE_EMBEDDING_MODEL"),
+    ("cloudflare_d1_kv_token", "CLOUDFLARE_D1_KV_TOKEN"),
+    ("cloudflare_kv_namespace_id", "CLOUDFLARE_KV_NAMESPACE_ID"),
+    ("cloudflare_kv_namespace_id", "CLOUDFLARE_KV_NAMESPACE"),
+    ("cloudflare_agent_memory_kv_namespace_id", "CLOUDFLARE_AGENT_MEMORY_KV_NAMESPACE_ID"),
+    ("cloudflare_agent_memory_kv_namespace_id", "CLOUDFLARE_KV_NAMESPACE_AGENT_MEMORY"),
+    ("cloudflare_ai_gateway_token", "CLOUDFLARE_AI_GATEWAY_TOKEN"),
+    ("cloudflare_ai_search_token", "CLOUDFLARE_AI_SEARCH_TOKEN"),
+    ("cloudflare_browser_render_token", "CLOUDFLARE_BROWSER_RENDER_TOKEN"),
+    ("cloudflare_worker_admin_token", "CLOUDFLARE_WORKER_ADMIN_TOKEN"),
+    ("cloudflare_account_token_admin_token", "CLOUDFLARE_ACCOUNT_TOKEN_ADMIN_TOKEN"),
+    ("cloudflare_user_token_admin", "CLOUDFLARE_USER_TOKEN_ADMIN"),
+    ("cloudflare_zone_dns_routes_token", "CLOUDFLARE_ZONE_DNS_ROUTES_TOKEN"),
+    ("cloudflare_vectorize_gh_templates_index_name", "CLOUDFLARE_VECTORIZE_GH_TEMPLATES_INDEX_NAME"),
+    ("worker_script_name", "WORKER_SCRIPT_NAME"),
+    ("worker_url", "WORKER_URL"),
+)
+
+
 def get_cloudflare_config(config_or_env: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     Retrieves Cloudflare configuration from a passed dictionary or environment variables.
     Callers MUST pass the config object or rely on os.environ.
+
+    Only the raw lookups run per call; the derived config is memoized on their values,
+    so env changes (e.g. secrets set at runtime, monkeypatched tests) are still seen.
     """
 
     # Helper to resolve keys from the config dict or os.environ
@@ -24,58 +112,22 @@ def get_cloudflare_config(config_or_env: Optional[Dict[str, Any]] = None) -> Dic
 
         return val
 
-    account_id = get("cloudflare_account_id", "CLOUDFLARE_ACCOUNT_ID")
-    # api_token = None  # disabled generic token
-
-    # Map fields
-    d1_id = get("cloudflare_d1_database_id", "CLOUDFLARE_D1_DATABASE_ID")
-
-    vectorize_index = get("cloudflare_vectorize_index", "CLOUDFLARE_VECTORIZE_INDEX_NAME") or get(
-        "cloudflare_vectorize_index", "CLOUDFLARE_VECTORIZE_INDEX"
-    )
-
-    embedding_model = get(
-        "cloudflare_vectorize_embedding_model", "CLOUDFLARE_VECTORIZE_EMBEDDING_MODEL"
-    )
-    d1_kv_token = get("cloudflare_d1_kv_token", "CLOUDFLARE_D1_KV_TOKEN")
-
-    kv_namespace_id = get("cloudflare_kv_namespace_id", "CLOUDFLARE_KV_NAMESPACE_ID") or get(
-        "cloudflare_kv_namespace_id", "CLOUDFLARE_KV_NAMESPACE"
-    )
-
-    kv_namespace_agent_memory_id = get(
-        "cloudflare_agent_memory_kv_namespace_id", "CLOUDFLARE_AGENT_MEMORY_KV_NAMESPACE_ID"
-    ) or get("cloudflare_agent_memory_kv_namespace_id", "CLOUDFLARE_KV_NAMESPACE_AGENT_MEMORY")
-
-    ai_gateway_token = get("cloudflare_ai_gateway_token", "CLOUDFLARE_AI_GATEWAY_TOKEN")
-    ai_search_token = get("cloudflare_ai_search_token", "CLOUDFLARE_AI_SEARCH_TOKEN")
-    browser_render_token = get("cloudflare_browser_render_token", "CLOUDFLARE_BROWSER_RENDER_TOKEN")
-    worker_admin_token = get("cloudflare_worker_admin_token", "CLOUDFLARE_WORKER_ADMIN_TOKEN")
+    return dict(_build_cloudflare_config(tuple(get(key, env_key) for key, env_key in _CONFIG_SOURCES)))
 
-    account_token_admin_token = get(
-        "cloudflare_account_token_admin_token", "CLOUDFLARE_ACCOUNT_TOKEN_ADMIN_TOKEN"
-    )
-    user_token_admin = get("cloudflare_user_token_admin", "CLOUDFLARE_USER_TOKEN_ADMIN")
-    zone_dns_routes_token = get(
-        "cloudflare_zone_dns_routes_token", "CLOUDFLARE_ZONE_DNS_ROUTES_TOKEN"
-    )
 
-    gh_templates_index = get(
-        "cloudflare_vectorize_gh_templates_index_name",
-        "CLOUDFLARE_VECTORIZE_GH_TEMPLATES_INDEX_NAME",
-    )
+@lru_cache(maxsize=8)
+def _build_cloudflare_config(raw: tuple) -> Dict[str, Any]:
+    v = dict(zip((env_key for _, env_key in _CONFIG_SOURCES), raw))
 
     # Logic to resolve Worker Script Name
     # 1. Env Var `WORKER_SCRIPT_NAME`
     # 2. Parse from `WORKER_URL` (e.g. https://script-name.subdomain.workers.dev)
     # 3. Default to "acre-forensics-backend"
-    worker_script_name = get("worker_script_name", "WORKER_SCRIPT_NAME")
-    worker_url = get("worker_url", "WORKER_URL")
+    worker_script_name = v["WORKER_SCRIPT_NAME"]
+    worker_url = v["WORKER_URL"]
 
     if not worker_script_name:
         if worker_url:
-            from urllib.parse import urlparse
-
             try:
                 hostname = urlparse(worker_url).hostname
                 if hostname:
@@ -87,96 +139,79 @@ def get_cloudflare_config(config_or_env: Optional[Dict[str, Any]] = None) -> Dic
     if not worker_script_name:
         worker_script_name = "acre-forensics-backend"
 
+    embedding_model = v["CLOUDFLARE_VECTORIZE_EMBEDDING_MODEL"]
+
     return {
-        "accountId": account_id,
+        "accountId": v["CLOUDFLARE_ACCOUNT_ID"],
         "apiToken": None,  # Explicitly disabled
         "workerScriptName": worker_script_name,
         "workerUrl": worker_url,
-        "d1Id": d1_id,
-        "vectorizeIndex": vectorize_index,
+        "d1Id": v["CLOUDFLARE_D1_DATABASE_ID"],
+        "vectorizeIndex": v["CLOUDFLARE_VECTORIZE_INDEX_NAME"] or v["CLOUDFLARE_VECTORIZE_INDEX"],
         "embeddingModel": embedding_model,
-        "d1KvToken": d1_kv_token,
-        "kvNamespaceId": kv_namespace_id,
-        "kvNamespaceAgentMemoryId": kv_namespace_agent_memory_id,
-        "aiGatewayToken": ai_gateway_token,
-        "aiSearchToken": ai_search_token,
-        "browserRenderToken": browser_render_token,
-        "workerAdminToken": worker_admin_token,
-        "accountTokenAdminToken": account_token_admin_token,
-        "userTokenAdmin": user_token_admin,
-        "zoneDnsRoutesToken": zone_dns_routes_token,
-        "ghTemplatesIndex": gh_templates_index,
+        "d1KvToken": v["CLOUDFLARE_D1_KV_TOKEN"],
+        "kvNamespaceId": v["CLOUDFLARE_KV_NAMESPACE_ID"] or v["CLOUDFLARE_KV_NAMESPACE"],
+        "kvNamespaceAgentMemoryId": (
+            v["CLOUDFLARE_AGENT_MEMORY_KV_NAMESPACE_ID"] or v["CLOUDFLARE_KV_NAMESPACE_AGENT_MEMORY"]
+        ),
+        "aiGatewayToken": v["CLOUDFLARE_AI_GATEWAY_TOKEN"],
+        "aiSearchToken": v["CLOUDFLARE_AI_SEARCH_TOKEN"],
+        "browserRenderToken": v["CLOUDFLARE_BROWSER_RENDER_TOKEN"],
+        "workerAdminToken": v["CLOUDFLARE_WORKER_ADMIN_TOKEN"],
+        "accountTokenAdminToken": v["CLOUDFLARE_ACCOUNT_TOKEN_ADMIN_TOKEN"],
+        "userTokenAdmin": v["CLOUDFLARE_USER_TOKEN_ADMIN"],
+        "zoneDnsRoutesToken": v["CLOUDFLARE_ZONE_DNS_ROUTES_TOKEN"],
+        "ghTemplatesIndex": v["CLOUDFLARE_VECTORIZE_GH_TEMPLATES_INDEX_NAME"],
         "vectorizeEmbeddingModel": embedding_model,
     }
 
 
-def fetch_cloudflare(
-    path: str,
-    method: str = "GET",
-    body: Any = None,
-    headers: Optional[Dict[str, str]] = None,
-    token: Optional[str] = None,
-    token_name: Optional[str] = None,
-    ignore_errors: Optional[List[int]] = None,
-    silent: bool = False,
-    env: Optional[Dict[str, Any]] = None,
-    expects_json: bool = True,
-    **kwargs,
-) -> Any:
-    """
-    Executes a request against the Cloudflare API with intelligent token selection.
+# Token inference: first row whose path fragment matches wins
+# (path fragments, config key, token name)
+_TOKEN_ROUTES = (
+    (("/browser-rendering",), "browserRenderToken", "CLOUDFLARE_BROWSER_RENDER_TOKEN"),
+    (("/d1/", "/storage/kv"), "d1KvToken", "CLOUDFLARE_D1_KV_TOKEN"),
+    (("/ai/run", "/vectorize", "/ai/v1", "/autorag"), "aiGatewayToken", "CLOUDFLARE_AI_GATEWAY_TOKEN"),
+    (("/user/tokens",), "userTokenAdmin", "CLOUDFLARE_USER_TOKEN_ADMIN"),
+    # Matches /accounts/:id/tokens
+    (("/tokens",), "accountTokenAdminToken", "CLOUDFLARE_ACCOUNT_TOKEN_ADMIN_TOKEN"),
+    (("/zones",), "zoneDnsRoutesToken", "CLOUDFLARE_ZONE_DNS_ROUTES_TOKEN"),
+    (("/workers/", "/pages", "/queues", "/r2/", "/builds"), "workerAdminToken", "CLOUDFLARE_WORKER_ADMIN_TOKEN"),
+)
 
-    Args:
-        path: API path (e.g., '/workers/scripts')
-        method: HTTP method (default GET)
-        body: Request body (dict for JSON, or raw bytes/files)
-        headers: Optional extra headers
-        token: Explicit token override
-        token_name: Explicit token name override
-        ignore_errors: List of status codes to suppress logging for
-        silent: If True, suppresses all logs
-        env: Optional config dictionary to override environment variables
-        expects_json: If True, returns config['result'], else returns the response object
-        **kwargs: Passed directly to requests.request (e.g. files, timeout)
-    """
-    import requests  # Imported locally to keep module clean if unused
 
+@lru_cache(maxsize=256)
+def _infer_token_route(path: str) -> Optional[Tuple[str, str]]:
+    """(config key, token name) for a path; callers hit the same few paths repeatedly."""
+    for fragments, config_key, name in _TOKEN_ROUTES:
+        if any(fragment in path for fragment in fragments):
+            return config_key, name
+    return None
+
+
+def _prepare_request(
+    client,
+    path: str,
+    method: str,
+    body: Any,
+    headers: Optional[Dict[str, str]],
+    token: Optional[str],
+    token_name: Optional[str],
+    silent: bool,
+    env: Optional[Dict[str, Any]],
+    kwargs: Dict[str, Any],
+):
+    """Resolves token/URL/body and builds the httpx request (shared by the sync and async paths)."""
     config = get_cloudflare_config(env)
 
-    # Extract config values
     account_id = config.get("accountId")
-    browser_render_token = config.get("browserRenderToken")
-    d1_kv_token = config.get("d1KvToken")
-    ai_gateway_token = config.get("aiGatewayToken")
-    user_token_admin = config.get("userTokenAdmin")
-    account_token_admin_token = config.get("accountTokenAdminToken")
-    zone_dns_routes_token = config.get("zoneDnsRoutesToken")
-    worker_admin_token = config.get("workerAdminToken")
 
     # Token Inference Logic
     if not token:
-        if "/browser-rendering" in path:
-            token = browser_render_token
-            token_name = "CLOUDFLARE_BROWSER_RENDER_TOKEN"
-        elif "/d1/" in path or "/storage/kv" in path:
-            token = d1_kv_token
-            token_name = "CLOUDFLARE_D1_KV_TOKEN"
-        elif any(x in path for x in ["/ai/run", "/vectorize", "/ai/v1", "/autorag"]):
-            token = ai_gateway_token
-            token_name = "CLOUDFLARE_AI_GATEWAY_TOKEN"
-        elif "/user/tokens" in path:
-            token = user_token_admin
-            token_name = "CLOUDFLARE_USER_TOKEN_ADMIN"
-        elif "/tokens" in path:
-            # Matches /accounts/:id/tokens
-            token = account_token_admin_token
-            token_name = "CLOUDFLARE_ACCOUNT_TOKEN_ADMIN_TOKEN"
-        elif "/zones" in path:
-            token = zone_dns_routes_token
-            token_name = "CLOUDFLARE_ZONE_DNS_ROUTES_TOKEN"
-        elif any(x in path for x in ["/workers/", "/pages", "/queues", "/r2/", "/builds"]):
-            token = worker_admin_token
-            token_name = "CLOUDFLARE_WORKER_ADMIN_TOKEN"
+        route = _infer_token_route(path)
+        if route:
+            config_key, token_name = route
+            token = config.get(config_key)
 
     token_name = token_name or "UNKNOWN_TOKEN"
 
@@ -225,39 +260,32 @@ def fetch_cloudflare(
 
     # Handle Body / JSON
     # If body is a dict and 'files' is not in kwargs, assume JSON
-    json_data = None
-    data_payload = None
+    body_kwargs: Dict[str, Any] = {}
 
     if body is not None:
-        # Check if this looks like a file upload (requests uses 'files' kwarg)
+        # Check if this looks like a file upload (httpx uses 'files' kwarg)
         if "files" in kwargs:
-            # If sending files, requests handles Content-Type boundary automatically
+            # If sending files, httpx handles Content-Type boundary automatically
             if "Content-Type" in final_headers:
                 del final_headers["Content-Type"]
-            data_payload = body  # Pass body as 'data' for form fields if needed
+            body_kwargs["data"] = body  # Pass body as form fields if needed
         elif isinstance(body, dict):
-            json_data = body
+            body_kwargs["json"] = body
         else:
-            data_payload = body
+            body_kwargs["content"] = body
 
-    # Execute Request
-    try:
-        res = requests.request(
-            method=method,
-            url=url,
-            headers=final_headers,
-            json=json_data,
-            data=data_payload,
-            **kwargs,
-        )
-    except Exception as e:
-        raise ConnectionError(f"Failed to connect to Cloudflare API: {str(e)}")
+    kwargs = dict(kwargs)
+    stream = kwargs.pop("stream", False)
+    request = client.build_request(method, url, headers=final_headers, **body_kwargs, **kwargs)
+    return request, stream, token_name, masked_token
 
+
+def _handle_response(res, ignore_errors, silent, token_name, masked_token, expects_json):
     if not silent:
-        logger.info(f"[CF API] Response: {res.status_code} {res.reason}")
+        logger.info(f"[CF API] Response: {res.status_code} {res.reason_phrase}")
 
     # Error Handling
-    if not res.ok:
+    if not res.is_success:
         error_text = res.text
         should_log = not (ignore_errors and res.status_code in ignore_errors)
 
@@ -266,7 +294,7 @@ def fetch_cloudflare(
         elif not silent:
             logger.info(f"[CF API] (Ignored Error {res.status_code}): {error_text}")
 
-        error_msg = f"Cloudflare API Error: {res.status_code} {res.reason} - {error_text}"
+        error_msg = f"Cloudflare API Error: {res.status_code} {res.reason_phrase} - {error_text}"
 
         if res.status_code in [401, 403]:
             error_msg += f" (Used Token: {token_name})"
@@ -274,7 +302,11 @@ def fetch_cloudflare(
                 f"[Auth Error] 401/403 with Token: {token_name} (Masked: {masked_token})"
             )
 
-        raise Exception(error_msg)
+        raise CloudflareAPIError(
+            error_msg,
+            status_code=res.status_code,
+            retry_after=_parse_retry_after(res.headers.get("Retry-After")),
+        )
 
     if not expects_json:
         return res
@@ -285,3 +317,82 @@ def fetch_cloudflare(
     except ValueError:
         # If response was OK but not JSON (rare for CF API but possible)
         return res.text
+
+
+def fetch_cloudflare(
+    path: str,
+    method: str = "GET",
+    body: Any = None,
+    headers: Optional[Dict[str, str]] = None,
+    token: Optional[str] = None,
+    token_name: Optional[str] = None,
+    ignore_errors: Optional[List[int]] = None,
+    silent: bool = False,
+    env: Optional[Dict[str, Any]] = None,
+    expects_json: bool = True,
+    **kwargs,
+) -> Any:
+    """
+    Executes a request against the Cloudflare API with intelligent token selection.
+
+    Args:
+        path: API path (e.g., '/workers/scripts')
+        method: HTTP method (default GET)
+        body: Request body (dict for JSON, or raw bytes/files)
+        headers: Optional extra headers
+        token: Explicit token override
+        token_name: Explicit token name override
+        ignore_errors: List of status codes to suppress logging for
+        silent: If True, suppresses all logs
+        env: Optional config dictionary to override environment variables
+        expects_json: If True, returns config['result'], else returns the httpx.Response
+            (with stream=True the caller must close it)
+        **kwargs: Passed to httpx (e.g. files, params, timeout), plus stream=True
+    """
+    client = _get_client()
+    request, stream, token_name, masked_token = _prepare_request(
+        client, path, method, body, headers, token, token_name, silent, env, kwargs
+    )
+
+    # Execute Request
+    try:
+        res = client.send(request, stream=stream)
+    except Exception as e:
+        raise ConnectionError(f"Failed to connect to Cloudflare API: {str(e)}")
+
+    if stream and not res.is_success:
+        res.read()
+        res.close()
+
+    return _handle_response(res, ignore_errors, silent, token_name, masked_token, expects_json)
+
+
+async def afetch_cloudflare(
+    path: str,
+    method: str = "GET",
+    body: Any = None,
+    headers: Optional[Dict[str, str]] = None,
+    token: Optional[str] = None,
+    token_name: Optional[str] = None,
+    ignore_errors: Optional[List[int]] = None,
+    silent: bool = False,
+    env: Optional[Dict[str, Any]] = None,
+    expects_json: bool = True,
+    **kwargs,
+) -> Any:
+    """Async variant of fetch_cloudflare (same arguments and return shape) for asyncio.gather fan-out."""
+    client = _get_async_client()
+    request, stream, token_name, masked_token = _prepare_request(
+        client, path, method, body, headers, token, token_name, silent, env, kwargs
+    )
+
+    try:
+        res = await client.send(request, stream=stream)
+    except Exception as e:
+        raise ConnectionError(f"Failed to connect to Cloudflare API: {str(e)}")
+
+    if stream and not res.is_success:
+        await res.aread()
+        await res.aclose()
+
+    return _handle_response(res, ignore_errors, silent, token_name, masked_token, expects_json)
@@ -1,15 +1,43 @@
 import asyncio
-import base64
 import os
 import pickle
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 from typing import Dict, List, Optional, Tuple
 
+try:
+    import pybase64 as base64
+except ImportError:  # optional speedup (SIMD decoder); same urlsafe_b64decode API
+    import base64
+
+import google_auth_httplib2
+import httplib2
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
 
+# Sub-requests per batch HTTP call (API max is 100; Gmail rate-limits batches above 50)
+GMAIL_BATCH_SIZE = int(os.environ.get("GMAIL_BATCH_SIZE", 50))
+# Batch calls in flight at once; each runs on its own thread with its own connection.
+# A 50-message batch costs ~250 quota units, about Gmail's per-user budget per second,
+# so more than a couple in flight mostly buys 429s.
+GMAIL_FETCH_CONCURRENCY = int(os.environ.get("GMAIL_FETCH_CONCURRENCY", 2))
+# Rounds of re-batching for sub-requests that were rate-limited or hit a 5xx
+GMAIL_BATCH_RETRIES = int(os.environ.get("GMAIL_BATCH_RETRIES", 4))
+_GMAIL_POOL = ThreadPoolExecutor(max_workers=GMAIL_FETCH_CONCURRENCY, thread_name_prefix="gmail-fetch")
+
+# Partial-response masks: only the fields _parse_message / list_message_ids read
+_LIST_FIELDS = "messages/id,nextPageToken"
+_MESSAGE_FIELDS = (
+    "id,threadId,payload/headers,payload/mimeType,payload/body/data,"
+    "payload/parts(mimeType,body/data,parts)"
+)
+
+
 class GmailCollector:
     """
     Gmail Collector that supports both OAuth (User) and Service Account (Server-to-Server) auth.
@@ -20,6 +48,8 @@ class GmailCollector:
         self.logger = logger
         self.service = None
         self.creds = None
+        # httplib2.Http is not thread-safe: each fetch thread gets its own authorized connection
+        self._local = threading.local()
 
         # A. Try Service Account (Preferred for Automation)
         if service_account_json:
@@ -72,14 +102,18 @@ class GmailCollector:
             
         try:
             self._log(f"Listing messages for: {query}")
-            response = self.service.users().messages().list(userId='me', q=query, maxResults=500).execute()
+            response = self.service.users().messages().list(
+                userId='me', q=query, maxResults=500, fields=_LIST_FIELDS
+            ).execute()
             messages = []
             if 'messages' in response:
                 messages.extend(response['messages'])
 
             while 'nextPageToken' in response:
                 page_token = response['nextPageToken']
-                response = self.service.users().messages().list(userId='me', q=query, pageToken=page_token).execute()
+                response = self.service.users().messages().list(
+                    userId='me', q=query, pageToken=page_token, maxResults=500, fields=_LIST_FIELDS
+                ).execute()
                 if 'messages' in response:
                     messages.extend(response['messages'])
             
@@ -91,69 +125,121 @@ class GmailCollector:
     async def fetch_messages(self, message_ids: List[str]):
         """
         Async generator that yields parsed message details.
-        Uses run_in_executor to prevent blocking the FastAPI event loop.
+        Messages are fetched GMAIL_BATCH_SIZE at a time in one batch HTTP call, with up
+        to GMAIL_FETCH_CONCURRENCY batches in flight on a dedicated thread pool so the
+        FastAPI event loop never blocks. Batches are yielded as they complete
+        (message order within a batch is preserved).
         """
         loop = asyncio.get_running_loop()
+        sem = asyncio.Semaphore(GMAIL_FETCH_CONCURRENCY)
 
-        for msg_id in message_ids:
-            try:
-                # partial allows us to pass arguments to the synchronous function
-                func = partial(self._fetch_single_message_sync, msg_id)
-                # Run blocking API call in thread pool
-                email_data = await loop.run_in_executor(None, func)
-                
-                if email_data:
+        async def fetch_chunk(chunk):
+            async with sem:
+                try:
+                    # partial allows us to pass arguments to the synchronous function
+                    func = partial(self._fetch_batch_sync, chunk)
+                    results = await loop.run_in_executor(_GMAIL_POOL, func)
+                except Exception as e:
+                    # The batch call itself failed: fetch its messages one by one instead
+                    self._log(
+                        f"Error fetching batch of {len(chunk)} starting at {chunk[0]}: {e}; retrying individually",
+                        level="warning",
+                    )
+                    func = partial(self._fetch_singles_sync, chunk)
+                    results = await loop.run_in_executor(_GMAIL_POOL, func)
+            return [results[msg_id] for msg_id in chunk if results.get(msg_id)]
+
+        tasks = [
+            asyncio.ensure_future(fetch_chunk(message_ids[start:start + GMAIL_BATCH_SIZE]))
+            for start in range(0, len(message_ids), GMAIL_BATCH_SIZE)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                for email_data in await next_done:
                     yield email_data
-                    
+        finally:
+            # Consumer stopped early (or failed): don't leave batches queued
+            for task in tasks:
+                task.cancel()
+
+    def _thread_http(self):
+        http = getattr(self._local, "http", None)
+        if http is None:
+            http = self._local.http = google_auth_httplib2.AuthorizedHttp(self.creds, http=httplib2.Http())
+        return http
+
+    @staticmethod
+    def _is_retryable(exception) -> bool:
+        """429, 5xx, or a 403 rate-limit error: the sub-request can succeed if sent again."""
+        if not isinstance(exception, HttpError):
+            return False
+        status = exception.resp.status
+        if status == 429 or status >= 500:
+            return True
+        return status == 403 and "ratelimitexceeded" in str(exception.error_details).lower()
+
+    def _fetch_batch_sync(self, message_ids: List[str]) -> Dict[str, Dict]:
+        """
+        Synchronous helper: fetches up to GMAIL_BATCH_SIZE messages in one BatchHttpRequest.
+        Sub-requests that were rate-limited (or hit a 5xx) are re-batched with
+        exponential backoff, up to GMAIL_BATCH_RETRIES times.
+        """
+        results: Dict[str, Dict] = {}
+        if not self.service:
+            return results
+
+        retry: List[str] = []
+
+        def on_response(request_id, response, exception):
+            if exception is not None:
+                if self._is_retryable(exception):
+                    retry.append(request_id)
+                else:
+                    self._log(f"API Error fetching {request_id}: {exception}", level="error")
+                return
+            try:
+                results[request_id] = self._parse_message(response)
             except Exception as e:
-                self._log(f"Error fetching {msg_id}: {e}", level="error")
+                self._log(f"Parse Error fetching {request_id}: {e}", level="error")
+
+        pending = list(message_ids)
+        for attempt in range(GMAIL_BATCH_RETRIES + 1):
+            if attempt:
+                time.sleep(min(2 ** (attempt - 1), 16) + random.uniform(0, 1))
+            retry.clear()
+            batch = self.service.new_batch_http_request(callback=on_response)
+            for msg_id in pending:
+                batch.add(
+                    self.service.users().messages().get(userId='me', id=msg_id, format='full', fields=_MESSAGE_FIELDS),
+                    request_id=msg_id,
+                )
+            batch.execute(http=self._thread_http())
+            if not retry:
+                break
+            pending = list(retry)
+        else:
+            self._log(f"Giving up on {len(retry)} rate-limited messages, e.g. {retry[0]}", level="error")
+        return results
+
+    def _fetch_singles_sync(self, message_ids: List[str]) -> Dict[str, Dict]:
+        """Fallback for a failed batch call: one request per message, in order."""
+        results: Dict[str, Dict] = {}
+        for msg_id in message_ids:
+            email_data = self._fetch_single_message_sync(msg_id)
+            if email_data:
+                results[msg_id] = email_data
+        return results
 
     def _fetch_single_message_sync(self, message_id: str) -> Optional[Dict]:
         """Synchronous helper to fetch and parse a single message."""
         try:
             if not self.service:
                 return None
-            # Fetch full format to get snippet and payload headers
-            msg = self.service.users().messages().get(userId='me', id=message_id, format='full').execute()
-            
-            payload = msg.get('payload', {})
-            headers_list = payload.get('headers', [])
-            
-            # Helper to extract header value
-            def get_header(name):
-                return next((h['value'] for h in headers_list if h['name'].lower() == name.lower()), None)
-
-            # Simple Body Extraction (Best Effort)
-            body_plain = ""
-            body_html = ""
-            
-            if 'parts' in payload:
-                for part in payload['parts']:
-                    if part['mimeType'] == 'text/plain':
-                        data = part['body'].get('data')
-                        if data:
-                            body_plain = base64.urlsafe_b64decode(data).decode('utf-8', errors='ignore')
-                    elif part['mimeType'] == 'text/html':
-                        data = part['body'].get('data')
-                        if data:
-                            body_html = base64.urlsafe_b64decode(data).decode('utf-8', errors='ignore')
-            else:
-                # No parts, try body directly
-                data = payload.get('body', {}).get('data')
-                if data:
-                    body_plain = base64.urlsafe_b64decode(data).decode('utf-8', errors='ignore')
-
-            return {
-                "messageId": msg.get("id"),
-                "threadId": msg.get("threadId"),
-                "headers": {h['name']: h['value'] for h in headers_list},
-                "fromAddress": get_header("From"),
-                "toAddress": get_header("To"),
-                "subject": get_header("Subject"),
-                "sentDate": get_header("Date"),
-                "bodyPlain": body_plain,
-                "bodyHtml": body_html
-            }
+            # Fetch full format, trimmed to the headers/body fields we parse
+            msg = self.service.users().messages().get(
+                userId='me', id=message_id, format='full', fields=_MESSAGE_FIELDS
+            ).execute(http=self._thread_http(), num_retries=3)  # backs off on 429/5xx
+            return self._parse_message(msg)
         except HttpError as error:
             self._log(f"API Error fetching {message_id}: {error}", level="error")
             return None
@@ -161,13 +247,65 @@ class GmailCollector:
             self._log(f"Parse Error fetching {message_id}: {e}", level="error")
             return None
 
+    @staticmethod
+    def _parse_message(msg: Dict) -> Dict:
+        """Parses a format='full' Gmail message resource into our message dict."""
+        payload = msg.get('payload', {})
+        headers_list = payload.get('headers', [])
+        
+        # One pass over the headers: original-case map for storage, lowercase map for lookups
+        # (setdefault keeps the first occurrence, matching the old linear scan)
+        headers = {}
+        hmap = {}
+        for h in headers_list:
+            headers[h['name']] = h['value']
+            hmap.setdefault(h['name'].lower(), h['value'])
+
+        # Body Extraction: walk the whole MIME tree (replies nest multipart/alternative
+        # inside multipart/mixed) in document order, stopping once both bodies are found
+        plain = html = None
+        stack = [payload]
+        while stack and (plain is None or html is None):
+            part = stack.pop()
+            mime_type = part.get('mimeType', '')
+            if 'parts' in part:
+                stack.extend(reversed(part['parts']))
+            elif mime_type == 'text/plain' and plain is None:
+                data = part.get('body', {}).get('data')
+                if data:
+                    plain = base64.urlsafe_b64decode(data).decode('utf-8', errors='ignore')
+            elif mime_type == 'text/html' and html is None:
+                data = part.get('body', {}).get('data')
+                if data:
+                    html = base64.urlsafe_b64decode(data).decode('utf-8', errors='ignore')
+
+        if plain is None and html is None and 'parts' not in payload:
+            # Single-part message of another type: keep its body as plain text
+            data = payload.get('body', {}).get('data')
+            if data:
+                plain = base64.urlsafe_b64decode(data).decode('utf-8', errors='ignore')
+
+        body_plain, body_html = plain or "", html or ""
+
+        return {
+            "messageId": msg.get("id"),
+            "threadId": msg.get("threadId"),
+            "headers": headers,
+            "fromAddress": hmap.get("from"),
+            "toAddress": hmap.get("to"),
+            "subject": hmap.get("subject"),
+            "sentDate": hmap.get("date"),
+            "bodyPlain": body_plain,
+            "bodyHtml": body_html
+        }
+
     def fetch_raw_message(self, message_id: str) -> Optional[Tuple[bytes, Dict]]:
         """Fetches raw EML bytes."""
         if not self.service:
             return None
         try:
             message = self.service.users().messages().get(userId='me', id=message_id, format='raw').execute()
-            msg_str = base64.urlsafe_b64decode(message['raw'].encode('ASCII'))
+            msg_str = base64.urlsafe_b64decode(message['raw'])
             return msg_str, message
         except HttpError as error:
             self._log(f"Error fetching raw {message_id}: {error}", level="error")
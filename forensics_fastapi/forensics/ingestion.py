@@ -1,7 +1,43 @@
+import codecs
 import email
 import hashlib
 import os
-from email.policy import default
+import re
+from email.errors import HeaderParseError
+from email.header import decode_header, make_header
+
+# Folded header line breaks (same splitter email.policy.default unfolds on)
+_LINESEP = re.compile(r"\r\n|\r|\n")
+
+
+def _header_text(value):
+    """
+    Decodes RFC 2047 encoded-words and unfolds a raw (compat32) header value.
+    Malformed encoded-words (unknown charset, undecodable bytes) are common in
+    phishing mail: they are decoded leniently, and kept raw as a last resort,
+    rather than failing the parse.
+    """
+    if value is None:
+        return None
+    try:
+        parts = decode_header(value)
+        try:
+            text = str(make_header(parts))
+        except (LookupError, UnicodeError):
+            text = "".join(_lenient_decode(chunk, charset) for chunk, charset in parts)
+    except (LookupError, UnicodeError, HeaderParseError):
+        text = str(value)
+    return _LINESEP.sub("", text)
+
+
+def _lenient_decode(chunk, charset) -> str:
+    if isinstance(chunk, str):
+        return chunk
+    try:
+        codecs.lookup(charset or "ascii")
+    except LookupError:
+        charset = "ascii"
+    return chunk.decode(charset or "ascii", errors="replace")
 
 
 class ArtifactRegistry:
@@ -17,35 +53,35 @@ class ArtifactRegistry:
         return hashlib.sha256(content.encode("utf-8")).hexdigest()
 
     def _compute_hash(self, filepath):
-        sha256_hash = hashlib.sha256()
+        # file_digest feeds OpenSSL in large buffers with the GIL released
         with open(filepath, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
-        return sha256_hash.hexdigest()
+            return hashlib.file_digest(f, "sha256").hexdigest()
 
 
 class MimeExploder:
     def __init__(self):
         pass
 
+    # Parsed with the compat32 policy: policy=default builds structured header objects
+    # for every header it touches (~15x slower); we only decode the few we keep.
     def parse_eml(self, filepath):
         with open(filepath, "rb") as f:
-            msg = email.message_from_binary_file(f, policy=default)
+            msg = email.message_from_binary_file(f)
         return self._extract_from_msg(msg)
 
     def parse_eml_bytes(self, raw_bytes):
-        msg = email.message_from_bytes(raw_bytes, policy=default)
+        msg = email.message_from_bytes(raw_bytes)
         return self._extract_from_msg(msg)
 
     def _extract_from_msg(self, msg):
         # Extract headers
-        received_headers = msg.get_all("Received") or []
+        received_headers = [_header_text(v) for v in msg.get_all("Received") or []]
         headers = {
-            "Message-ID": msg.get("Message-ID"),
-            "From": msg.get("From"),
-            "To": msg.get("To"),
-            "Subject": msg.get("Subject"),
-            "Date": msg.get("Date"),
+            "Message-ID": _header_text(msg.get("Message-ID")),
+            "From": _header_text(msg.get("From")),
+            "To": _header_text(msg.get("To")),
+            "Subject": _header_text(msg.get("Subject")),
+            "Date": _header_text(msg.get("Date")),
             "Received": received_headers,
         }
 
@@ -1,9 +1,13 @@
-import json
+import atexit
 import os
+import queue
 import threading
+import time
+import traceback
 from datetime import datetime
 from typing import Optional
 
+import orjson
 import requests
 
 
@@ -33,17 +37,33 @@ class AsyncWebhookLogger:
         self.headers = {"Content-Type": "application/json"}
         if self.session_token:
             self.headers["X-Worker-Api-Key"] = self.session_token
+        # Full stack traces are only formatted when LOG_LEVEL=DEBUG
+        self.debug = os.environ.get("LOG_LEVEL", "").upper() == "DEBUG"
 
         if self.session_token:
             self.headers["X-Worker-Api-Key"] = self.session_token
 
+        # Webhook delivery: log() enqueues, one daemon thread drains over a keep-alive
+        # session. The queue is bounded; lines are dropped (console/file still have them)
+        # rather than blocking callers when the worker is slow or down.
+        self._q = queue.Queue(maxsize=10000)
+        self._session = requests.Session()
+        threading.Thread(target=self._drain, name="webhook-logger", daemon=True).start()
+        # The daemon drainer still runs during atexit; give it a moment to deliver
+        # what's queued (e.g. a crashing run's last error lines)
+        atexit.register(self.flush)
+
         # [NEW] File persistence for local retrieval/tailing
         # Use /tmp to ensure writability and consistent path for provider to read
         self.log_file = "/tmp/forensics.log"
+        # Kept open (line-buffered) for the process lifetime: one write() per line
+        # instead of open/write/close. The lock keeps concurrent lines whole.
+        self._fh_lock = threading.Lock()
+        self._log_fh = None
         try:
-            # Ensure file exists
-            with open(self.log_file, "a") as f:
-                f.write(f"[{datetime.now().isoformat()}] [SYSTEM] Logger initialized\n")
+            self._log_fh = open(self.log_file, "a", buffering=1)
+            self._log_fh.write(f"[{datetime.now().isoformat()}] [SYSTEM] Logger initialized\n")
+            atexit.register(self._log_fh.close)
         except Exception:
             pass  # Fail silently if FS not ready
 
@@ -53,16 +73,18 @@ class AsyncWebhookLogger:
         log_line = f"[{timestamp}] [{type}] [{step_name}] {message}"
         print(log_line)
         if metadata:
-            print(f"Metadata: {json.dumps(metadata)}")
+            # OPT_NON_STR_KEYS: json.dumps accepted int/enum keys in metadata, keep doing so
+            print(f"Metadata: {orjson.dumps(metadata, option=orjson.OPT_NON_STR_KEYS).decode()}")
 
         # Write to file for tailing
-        try:
-            with open(self.log_file, "a") as f:
-                f.write(log_line + "\n")
-        except Exception:
-            pass
-
-        # Send to Webhook in background thread to avoid blocking
+        if self._log_fh is not None:
+            try:
+                with self._fh_lock:
+                    self._log_fh.write(log_line + "\n")
+            except Exception:
+                pass
+
+        # Hand off to the webhook drainer thread to avoid blocking
         payload = {
             "type": type,
             "message": message,
@@ -74,14 +96,37 @@ class AsyncWebhookLogger:
             "engagementId": os.environ.get("ENGAGEMENT_ID"),
         }
 
-        threading.Thread(target=self._send_webhook, args=(payload,), daemon=True).start()
+        try:
+            self._q.put_nowait(payload)
+        except queue.Full:
+            pass
+
+    def _drain(self):
+        while True:
+            payload = self._q.get()
+            try:
+                self._send_webhook(payload)
+            finally:
+                self._q.task_done()
+
+    def flush(self, timeout: float = 3.0):
+        """Wait up to `timeout` seconds for the drainer to deliver queued lines."""
+        deadline = time.monotonic() + timeout
+        with self._q.all_tasks_done:
+            while self._q.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                self._q.all_tasks_done.wait(remaining)
 
     def _send_webhook(self, payload: dict):
         try:
             # Strip /internal if present in base URL to get root, or just trust WORKER_URL
             # The prompt asked for host worker to create path, so if WORKER_URL is the root,
             # appending /webhooks/container/logs is correct.
-            requests.post(self.webhook_url, json=payload, headers=self.headers, timeout=5)
+            # self.headers already carries Content-Type: application/json
+            body = orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+            self._session.post(self.webhook_url, data=body, headers=self.headers, timeout=5)
         except Exception:
             # print(f"Failed to send webhook log: {e}") # Avoid spamming stderr if worker is down
             pass
@@ -95,6 +140,12 @@ class AsyncWebhookLogger:
     def warning(self, message: str, step_name: str = "WARN", metadata: Optional[dict] = None):
         self.log("WARN", message, step_name, metadata)
 
+    def exception(self, message: str, step_name: str = "ERROR", metadata: Optional[dict] = None):
+        """Log the exception being handled; the stack trace is attached only in debug mode."""
+        if self.debug:
+            metadata = {**(metadata or {}), "stackTrace": traceback.format_exc()}
+        self.log("ERROR", message, step_name, metadata)
+
 
 # Global Accessor
 logger = AsyncWebhookLogger()
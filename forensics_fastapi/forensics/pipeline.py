@@ -1,3 +1,4 @@
+import asyncio
 import os
 import sys
 import traceback
@@ -7,10 +8,10 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")
 
 from typing import Dict, Optional
 
-from .atomizer import Atomizer
+from .atomizer import atomize_in_worker, get_atomize_pool
 from .attribution import AttributionEngine
 from .ingestion import ArtifactRegistry, MimeExploder
-from .remote_worker_api import RemoteWorkerClient, WorkerLogger
+from .remote_worker_api import WorkerLogger, get_remote_worker_client
 from .reporter import ForensicReporter
 from .verification import VerificationEngine
 
@@ -29,7 +30,6 @@ class ACREPipeline:
         """
         self.registry = ArtifactRegistry()
         self.exploder = MimeExploder()
-        self.atomizer = Atomizer()
         self.attributor = AttributionEngine()
         self.verifier = VerificationEngine()
         self.reporter = ForensicReporter()
@@ -38,8 +38,8 @@ class ACREPipeline:
         secrets = context_data.get("secrets", {}) if context_data else {}
 
         # Use secrets from payload if present, otherwise let RemoteWorkerClient use env vars
-        self.client = RemoteWorkerClient(
-            secret=secrets.get("WORKER_API_KEY"), worker_url=secrets.get("WORKER_URL")
+        self.client = get_remote_worker_client(
+            worker_url=secrets.get("WORKER_URL"), secret=secrets.get("WORKER_API_KEY")
         )
 
         # Fallback to Env Var for Service Account if not in payload
@@ -254,7 +254,9 @@ class ACREPipeline:
         # 2. Atomize
         self.logger.info("process_message", f"Atomizing {message_id}...")
         await self._emit("step_start", {"step": "Atomization", "log": "Extracting artifacts..."})
-        atoms = self.atomizer.atomize(message_id, body_html, body_plain, headers.get("From"))
+        atoms = await asyncio.get_running_loop().run_in_executor(
+            get_atomize_pool(), atomize_in_worker, message_id, body_html, body_plain, headers.get("From")
+        )
         await self._emit(
             "artifact_found", {"count": len(atoms), "log": f"Extracted {len(atoms)} atoms."}
         )
@@ -268,7 +270,7 @@ class ACREPipeline:
         try:
             # Prepare payload for classifier (needs id and content)
             classifier_input = [{"id": a["id"], "content": a["content"]} for a in attributed_atoms]
-            classification_results = self.classifier.classify_batch(classifier_input)
+            classification_results = await self.classifier.classify_batch(classifier_input)
             # Enrich atoms with labels
             for atom in attributed_atoms:
                 # Classification result is a dict: {id: [tags]}
@@ -1,10 +1,62 @@
+import functools
 import json
 import os
 import sys
+import time
 from typing import Any, Dict, List, Optional, Union, cast
 from urllib.parse import urlparse, urlunparse
 
-import requests
+import httpx
+
+# The Worker's /internal/logs/batch route is opt-in until it ships; if it
+# answers 404/405 batching is switched off and events go to /internal/log.
+_LOG_BATCH = os.environ.get("WORKER_LOG_BATCH", "").lower() in {"1", "true", "yes"}
+
+_RETRY_STATUSES = frozenset({429, 503})
+_MAX_RETRIES = 3
+_BACKOFF_FACTOR = 0.3
+
+
+class _RetryingClient(httpx.Client):
+    """
+    httpx.Client that backs off on 429/503 (honouring Retry-After) instead of
+    failing the call; neither status means the request was processed, so
+    POSTs are retried too.
+    """
+
+    def request(self, method, url, **kwargs) -> httpx.Response:
+        for attempt in range(_MAX_RETRIES + 1):
+            resp = super().request(method, url, **kwargs)
+            if resp.status_code not in _RETRY_STATUSES or attempt == _MAX_RETRIES:
+                return resp
+            delay = _BACKOFF_FACTOR * (2 ** attempt)
+            retry_after = resp.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                delay = max(delay, float(retry_after))
+            resp.close()
+            time.sleep(min(delay, 30.0))
+        return resp
+
+
+# Shared across all RemoteWorkerClient instances so agent wrappers reuse
+# keep-alive connections to the Worker instead of handshaking per call.
+# HTTP/2 lets parallel agent RPCs multiplex over one TLS connection instead
+# of queueing behind each other on HTTP/1.1 sockets.
+_SESSION = _RetryingClient(
+    http2=True,
+    timeout=60,
+    follow_redirects=True,
+    limits=httpx.Limits(max_keepalive_connections=10, max_connections=50, keepalive_expiry=60),
+)
+
+# Log posts skip the retry/backoff: WorkerLogger sends them synchronously from
+# print() (OutputDup), so a rate-limited log route must not stall the pipeline.
+_LOG_SESSION = httpx.Client(
+    http2=True,
+    timeout=5,
+    follow_redirects=True,
+    limits=httpx.Limits(max_keepalive_connections=4, max_connections=10, keepalive_expiry=60),
+)
 
 
 class OutputDup:
@@ -82,6 +134,8 @@ class RemoteWorkerClient:
         )
         parsed = urlparse(raw_url)
         self.base_url = urlunparse((parsed.scheme or "https", parsed.netloc, "", "", "", "")).rstrip("/")
+        self.session = _SESSION
+        self.log_session = _LOG_SESSION
 
         # 2. Load Secrets
         self.api_key = secret or os.environ.get("WORKER_API_KEY")
@@ -117,7 +171,7 @@ class RemoteWorkerClient:
         """Centralized request handler with auth error logging."""
         url = f"{self.base_url}{path}"
         try:
-            resp = requests.request(method, url, headers=self.headers, timeout=30, **kwargs)
+            resp = self.session.request(method, url, headers=self.headers, timeout=30, **kwargs)
             
             if resp.status_code in [401, 403]:
                 print(f"❌ API {method} Failed [{path}]: {resp.status_code} Unauthorized.")
@@ -126,9 +180,9 @@ class RemoteWorkerClient:
 
             resp.raise_for_status()
             return resp.json()
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             print(f"❌ API {method} Error [{path}]: {e}")
-            if hasattr(e, 'response') and e.response:
+            if isinstance(e, httpx.HTTPStatusError):
                 print(f"   Response: {e.response.text[:200]}")
             raise
 
@@ -184,10 +238,11 @@ class RemoteWorkerClient:
     # 3. LOGGING
     # ------------------------------------------------------------------
 
-    def log_event(self, type: str, workflow_id: str, step_name: str, message: str, 
-                  engagement_id: Optional[str] = None, action_type: Optional[str] = None, 
-                  error_type: Optional[str] = None, stack_trace: Optional[str] = None, 
-                  metadata: Optional[Dict] = None):
+    @staticmethod
+    def build_log_payload(type: str, workflow_id: str, step_name: str, message: str,
+                          engagement_id: Optional[str] = None, action_type: Optional[str] = None,
+                          error_type: Optional[str] = None, stack_trace: Optional[str] = None,
+                          metadata: Optional[Dict] = None) -> Dict:
         payload = {
             "type": type, "workflowId": workflow_id, "engagementId": engagement_id,
             "stepName": step_name, "message": message, "metadata": metadata,
@@ -197,13 +252,46 @@ class RemoteWorkerClient:
         elif type == "ERROR":
             payload["errorType"] = error_type
             payload["stackTrace"] = stack_trace
+        return payload
+
+    def log_event(self, type: str, workflow_id: str, step_name: str, message: str, 
+                  engagement_id: Optional[str] = None, action_type: Optional[str] = None, 
+                  error_type: Optional[str] = None, stack_trace: Optional[str] = None, 
+                  metadata: Optional[Dict] = None):
+        payload = self.build_log_payload(
+            type, workflow_id, step_name, message, engagement_id,
+            action_type=action_type, error_type=error_type, stack_trace=stack_trace, metadata=metadata,
+        )
 
         try:
             # Short timeout for logs to avoid blocking main flow
-            requests.post(f"{self.base_url}/internal/log", json=payload, headers=self.headers, timeout=5)
+            self.log_session.post(f"{self.base_url}/internal/log", json=payload, headers=self.headers, timeout=5)
         except Exception:
             pass
 
+    def log_events(self, events: List[Dict]):
+        """
+        Send several payloads from build_log_payload(): one batch request when
+        WORKER_LOG_BATCH is enabled, otherwise one /internal/log POST each.
+        """
+        global _LOG_BATCH
+        if not events:
+            return
+        if _LOG_BATCH:
+            try:
+                resp = self.log_session.post(f"{self.base_url}/internal/logs/batch", json={"events": events}, headers=self.headers, timeout=5)
+            except Exception:
+                return
+            if resp.status_code not in (404, 405):
+                return
+            # Worker doesn't serve the batch route: fall back for the rest of the process
+            _LOG_BATCH = False
+        for event in events:
+            try:
+                self.log_session.post(f"{self.base_url}/internal/log", json=event, headers=self.headers, timeout=5)
+            except Exception:
+                pass
+
     # ------------------------------------------------------------------
     # 4. INTERNAL OPS (Context, HIL, Transcript)
     # ------------------------------------------------------------------
@@ -281,4 +369,12 @@ class RemoteWorkerClient:
                 result = json.loads(result)
             except Exception:
                 return {}
-        return cast(Dict[str, List[str]], result) if isinstance(result, dict) else {}
\ No newline at end of file
+        return cast(Dict[str, List[str]], result) if isinstance(result, dict) else {}
+
+
+@functools.lru_cache(maxsize=8)
+def get_remote_worker_client(
+    worker_url: Optional[str] = None, secret: Optional[str] = None
+) -> RemoteWorkerClient:
+    """Shared RemoteWorkerClient per (worker_url, secret) pair."""
+    return RemoteWorkerClient(worker_url=worker_url, secret=secret)
@@ -3,7 +3,7 @@ import os
 from datetime import datetime
 from typing import Dict, Optional
 
-from .remote_worker_api import RemoteWorkerClient
+from .remote_worker_api import get_remote_worker_client
 
 OUTPUT_DIR = "src/reports/output_final"
 
@@ -11,7 +11,7 @@ OUTPUT_DIR = "src/reports/output_final"
 class ForensicReporter:
     def __init__(self, db_path="src/data/forensics.db"):
         self.db_path = db_path
-        self.client = RemoteWorkerClient()
+        self.client = get_remote_worker_client()
         os.makedirs(OUTPUT_DIR, exist_ok=True)
 
     def generate_json_timeline(
@@ -47,7 +47,7 @@ async def ws_cli_endpoint(websocket: WebSocket, method: str):
                     await websocket.send_json({"error": "Missing 'cmd' in payload for exec"})
                 else:
                     await websocket.send_json({"type": "exec_start", "cmd": cmd})
-                    result = execute_command(cmd)
+                    result = execute_command(cmd, use_shell=bool(data.get("shell")))
                     await websocket.send_json({"type": "exec_result", "data": result})
             
             elif method == "scan":
@@ -44,7 +44,7 @@ def process_table(table_name, id_col, text_cols):
         # Ensure no empty strings for API stability
         texts = [t if len(t) > 0 else " " for t in texts]
 
-        embeddings = ai.generate_embeddings(texts)
+        embeddings = ai.generate_embeddings_batched(texts)
 
         if embeddings:
             update_data = []
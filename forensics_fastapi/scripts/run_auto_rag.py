@@ -1,4 +1,5 @@
 import json
+import os
 import sys
 
 from src.config import RAG_NAME
@@ -7,6 +8,8 @@ from src.core.worker_ai import WorkerAI
 
 def main() -> None:
     ai = WorkerAI()
+    # Scopes the semantic RAG cache; left unset, queries aren't cached
+    engagement_id = os.environ.get("ENGAGEMENT_ID")
 
     questions_file = "questions.json"
     if len(sys.argv) > 1 and sys.argv[1].endswith(".json"):
@@ -30,7 +33,7 @@ def main() -> None:
             print(f"Query: {q}")
             query_text = q["query"] if isinstance(q, dict) and "query" in q else str(q)
 
-            resp = ai.rag_search(RAG_NAME, query_text)
+            resp = ai.rag_search(RAG_NAME, query_text, engagement_id=engagement_id)
 
             if resp:
                 results["ai_search"].append({"original_query": q, "response": resp})
@@ -47,7 +50,7 @@ def main() -> None:
             print(f"Query: {q}")
             query_text = q["query"] if isinstance(q, dict) and "query" in q else str(q)
 
-            resp = ai.rag_search_only(RAG_NAME, query_text)
+            resp = ai.rag_search_only(RAG_NAME, query_text, engagement_id=engagement_id)
 
             if resp:
                 results["regular_search"].append({"original_query": q, "response": resp})
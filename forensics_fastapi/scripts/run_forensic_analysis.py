@@ -1,4 +1,5 @@
 import json
+import os
 
 import psycopg2
 from src.config import DB_CONFIG, RAG_NAME
@@ -83,7 +84,9 @@ def analyze_question(ai, conn, question_obj):
 
     # 1. AutoRAG Search (Cloudflare)
     print(" - Searching AutoRAG...")
-    rag_response = ai.rag_search_only(CLOUDFLARE_RAG_NAME, query, max_results=5)
+    rag_response = ai.rag_search_only(
+        CLOUDFLARE_RAG_NAME, query, max_results=5, engagement_id=os.environ.get("ENGAGEMENT_ID")
+    )
     rag_context = []
     if rag_response and "results" in rag_response:
         for r in rag_response["results"]:
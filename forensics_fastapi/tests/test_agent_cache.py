@@ -0,0 +1,92 @@
+from forensics_fastapi.agents import _cache
+from forensics_fastapi.agents._cache import TTLCache, canonical_key
+
+
+def test_canonical_key_ignores_key_order_and_rewrapping():
+    """Re-wrapped template text and reordered dict keys share one cache key."""
+    wrapped = {"context": "x", "content": "Pay the lien\n\tby Friday  "}
+    flat = {"content": "Pay the lien by Friday", "context": "x"}
+    assert canonical_key("forensic", "analyzeContent", wrapped) == canonical_key(
+        "forensic", "analyzeContent", flat
+    )
+    assert canonical_key("forensic", "analyzeContent", flat) != canonical_key(
+        "forensic", "draftReply", flat
+    )
+
+
+def test_ttl_cache_namespaces_and_invalidate():
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set("eng-a", "k", 1)
+    cache.set("eng-b", "k", 2)
+    assert cache.get("eng-a", "k") == 1
+    assert cache.get("eng-b", "k") == 2
+
+    cache.invalidate("eng-a")
+    assert cache.get("eng-a", "k") is None
+    assert cache.get("eng-b", "k") == 2
+
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("n", "a", 1)
+    cache.set("n", "b", 2)
+    cache.get("n", "a")  # "b" is now the oldest
+    cache.set("n", "c", 3)
+    assert cache.get("n", "b") is None
+    assert cache.get("n", "a") == 1
+    assert cache.get("n", "c") == 3
+
+
+def test_ttl_cache_expires_entries(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(_cache.time, "monotonic", lambda: now[0])
+    cache = TTLCache(maxsize=10, ttl=5)
+    cache.set("n", "k", "v")
+    now[0] += 4
+    assert cache.get("n", "k") == "v"
+    now[0] += 2
+    assert cache.get("n", "k") is None
+    assert len(cache) == 0
+
+
+def test_invoke_reuses_near_duplicate_content(monkeypatch):
+    """analyzeContent with re-worded content is served by embedding similarity."""
+    import asyncio
+
+    from forensics_fastapi.agents import base
+    from forensics_fastapi.agents.forensic import ForensicAnalystAgent
+
+    vectors = {
+        "Please pay invoice 12 by Friday.": [1.0, 0.0, 0.1],
+        "Kindly pay invoice 12 by Friday.": [1.0, 0.0, 0.12],
+        "The roof leaks over the garage.": [0.0, 1.0, 0.0],
+    }
+    monkeypatch.setattr(base._EMBEDDER, "generate_embeddings", lambda texts: [vectors[t] for t in texts])
+    monkeypatch.setattr(base, "_RESPONSE_CACHE", TTLCache())
+    monkeypatch.setattr(base, "_SEMANTIC_CACHE", base.SemanticCache())
+    monkeypatch.setattr(base.BaseAgentClient, "_buffer_event", lambda self, **fields: None)
+
+    calls = []
+
+    def run_agent(agent_name, action, payload, agent_id):
+        calls.append((agent_id, payload["content"]))
+        return {"n": len(calls)}
+
+    async def scenario():
+        a, b = ForensicAnalystAgent("eng-a"), ForensicAnalystAgent("eng-b")
+        for agent in (a, b):
+            monkeypatch.setattr(agent.client, "run_agent", run_agent)
+        first = await a.analyze_content("Please pay invoice 12 by Friday.")
+        again = await a.analyze_content("Kindly pay invoice 12 by Friday.")
+        other_context = await a.analyze_content("Kindly pay invoice 12 by Friday.", context="x")
+        unrelated = await a.analyze_content("The roof leaks over the garage.")
+        other_engagement = await b.analyze_content("Kindly pay invoice 12 by Friday.")
+        return first, again, other_context, unrelated, other_engagement
+
+    first, again, other_context, unrelated, other_engagement = asyncio.run(scenario())
+    assert again == first
+    assert len({str(r) for r in (first, other_context, unrelated, other_engagement)}) == 4
+    assert len(calls) == 4
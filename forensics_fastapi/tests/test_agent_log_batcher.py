@@ -0,0 +1,55 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from forensics_fastapi.fast_api_agents import base
+from forensics_fastapi.fast_api_agents.base import _LogBatcher
+
+
+class RecordingClient:
+    def __init__(self):
+        self.batches = []
+        self.threads = []
+
+    def log_events(self, events):
+        self.batches.append(list(events))
+        self.threads.append(threading.current_thread().name)
+
+
+def test_flush_groups_events_per_client_on_log_pool():
+    batcher = _LogBatcher(delay=60, max_size=3)
+    first, second = RecordingClient(), RecordingClient()
+    batcher.add(first, {"n": 1})
+    batcher.add(second, {"n": 2})
+    batcher.add(first, {"n": 3})  # max_size reached: flushes without waiting for the timer
+
+    base.flush_background_logs()
+    assert first.batches == [[{"n": 1}, {"n": 3}]]
+    assert second.batches == [[{"n": 2}]]
+    assert first.threads[0].startswith("agent-log")
+    assert batcher._timer is None
+
+
+def test_flush_now_drains_on_calling_thread_and_cancels_timer():
+    batcher = _LogBatcher(delay=60, max_size=10)
+    client = RecordingClient()
+    batcher.add(client, {"n": 1})
+    timer = batcher._timer
+    assert timer is not None
+
+    batcher.flush_now()
+    assert client.batches == [[{"n": 1}]]
+    assert client.threads == [threading.current_thread().name]
+    assert batcher._timer is None
+    assert timer.finished.is_set()
+
+
+def test_flush_after_pool_shutdown_posts_synchronously(monkeypatch):
+    pool = ThreadPoolExecutor(max_workers=1)
+    pool.shutdown()
+    monkeypatch.setattr(base, "_LOG_POOL", pool)
+
+    batcher = _LogBatcher(delay=60, max_size=10)
+    client = RecordingClient()
+    batcher.add(client, {"n": 1})
+    batcher.flush()
+    assert client.batches == [[{"n": 1}]]
@@ -44,3 +44,25 @@ def test_ingestion_module_import():
         assert True
     except ImportError as e:
         pytest.fail(f"Failed to import src.forensics.ingestion: {e}")
+
+
+def test_lifespan_builds_gmail_service(monkeypatch):
+    """The shared collector authenticates even without impersonation."""
+    from fastapi.testclient import TestClient
+    from google.oauth2.credentials import Credentials
+
+    from forensics_fastapi.forensics import gmail_collector
+    from forensics_fastapi.forensics.api import app
+
+    monkeypatch.setenv("GCP_SERVICE_ACCOUNT", '{"type": "service_account"}')
+    monkeypatch.delenv("GMAIL_IMPERSONATE_USER", raising=False)
+    monkeypatch.setattr(
+        gmail_collector.service_account.Credentials,
+        "from_service_account_info",
+        lambda info, scopes: Credentials(token="test"),
+    )
+
+    with TestClient(app) as c:
+        assert app.state.gmail_error is None
+        assert app.state.gmail.service is not None
+        assert c.get("/health").json()["google"]["status"] == "connected"
@@ -0,0 +1,79 @@
+import base64
+
+from forensics_fastapi.forensics.gmail_collector import GmailCollector
+
+
+def _data(text: str) -> str:
+    return base64.urlsafe_b64encode(text.encode()).decode()
+
+
+def test_parse_message_header_lookup():
+    msg = {
+        "id": "m1",
+        "threadId": "t1",
+        "payload": {
+            "mimeType": "text/plain",
+            "headers": [
+                {"name": "From", "value": "a@x.com"},
+                {"name": "SUBJECT", "value": "Re: invoice"},
+                {"name": "from", "value": "ignored@x.com"},
+            ],
+            "body": {"data": _data("body")},
+        },
+    }
+    parsed = GmailCollector._parse_message(msg)
+
+    assert parsed["messageId"] == "m1"
+    assert parsed["threadId"] == "t1"
+    # First occurrence wins for lookups; stored headers keep original case
+    assert parsed["fromAddress"] == "a@x.com"
+    assert parsed["subject"] == "Re: invoice"
+    assert parsed["headers"]["SUBJECT"] == "Re: invoice"
+
+
+def test_parse_message_walks_nested_multipart():
+    msg = {
+        "payload": {
+            "mimeType": "multipart/mixed",
+            "parts": [
+                {
+                    "mimeType": "multipart/alternative",
+                    "parts": [
+                        {"mimeType": "text/plain", "body": {"data": _data("plain body")}},
+                        {"mimeType": "text/html", "body": {"data": _data("<p>html body</p>")}},
+                    ],
+                },
+                # Attachment parts carry an attachmentId instead of inline data
+                {"mimeType": "text/plain", "filename": "a.txt", "body": {"attachmentId": "att"}},
+            ],
+        },
+    }
+    parsed = GmailCollector._parse_message(msg)
+
+    assert parsed["bodyPlain"] == "plain body"
+    assert parsed["bodyHtml"] == "<p>html body</p>"
+
+
+def test_parse_message_keeps_first_part_of_each_type_in_document_order():
+    msg = {
+        "payload": {
+            "mimeType": "multipart/mixed",
+            "parts": [
+                {"mimeType": "text/plain", "body": {"data": _data("first")}},
+                {"mimeType": "text/plain", "body": {"data": _data("second")}},
+            ],
+        }
+    }
+    parsed = GmailCollector._parse_message(msg)
+    assert parsed["bodyPlain"] == "first"
+    assert parsed["bodyHtml"] == ""
+
+
+def test_parse_message_single_part_bodies():
+    html_only = {"payload": {"mimeType": "text/html", "body": {"data": _data("<b>x</b>")}}}
+    parsed = GmailCollector._parse_message(html_only)
+    assert parsed["bodyPlain"] == ""
+    assert parsed["bodyHtml"] == "<b>x</b>"
+
+    untyped = {"payload": {"body": {"data": _data("raw")}}}
+    assert GmailCollector._parse_message(untyped)["bodyPlain"] == "raw"
@@ -0,0 +1,50 @@
+from forensics_fastapi.forensics.ingestion import MimeExploder
+
+
+def _parse(raw: bytes):
+    return MimeExploder().parse_eml_bytes(raw)
+
+
+def test_headers_are_decoded_and_unfolded():
+    raw = (
+        b"Received: from a.example by b.example;\r\n Mon, 1 Jan 2024 00:00:00 +0000\r\n"
+        b"Received: from c.example by a.example; Mon, 1 Jan 2024 00:00:00 +0000\r\n"
+        b"Message-ID: <x@y>\r\n"
+        b"From: =?utf-8?q?J=C3=B6rg?= <j@x.com>\r\n"
+        b"To: a@b.com,\r\n c@d.com\r\n"
+        b"Subject: =?utf-8?b?SGVsbG8gd8O2cmxk?= and more\r\n"
+        b"Content-Type: multipart/alternative; boundary=XX\r\n\r\n"
+        b"--XX\r\nContent-Type: text/plain\r\n\r\nhi\r\n--XX--\r\n"
+    )
+    headers, ingress, msg = _parse(raw)
+
+    assert headers["Message-ID"] == "<x@y>"
+    assert headers["From"] == "Jörg <j@x.com>"
+    assert headers["To"] == "a@b.com, c@d.com"
+    assert headers["Subject"] == "Hello wörld and more"
+    assert headers["Date"] is None
+    assert headers["Received"][0] == "from a.example by b.example; Mon, 1 Jan 2024 00:00:00 +0000"
+    assert ingress == headers["Received"][0]
+    # The returned Message still supports the MIME walk pipeline.py relies on
+    assert [part.get_content_type() for part in msg.walk()] == ["multipart/alternative", "text/plain"]
+
+
+def test_malformed_encoded_words_do_not_abort_parsing():
+    raw = (
+        b"From: =?x-bogus?Q?Eve?= <e@x.com>\r\n"
+        b"Subject: =?utf-8?B?/w==?= invoice\r\n"
+        b"To: victim@example.com\r\n\r\n"
+        b"Pay me."
+    )
+    headers, ingress, _ = _parse(raw)
+
+    assert headers["From"] == "Eve <e@x.com>"
+    assert headers["Subject"] == "� invoice"
+    assert headers["To"] == "victim@example.com"
+    assert ingress == "Unknown"
+
+
+def test_raw_8bit_header_is_kept():
+    raw = "Subject: caf\xe9 ok\r\n\r\nbody".encode("latin-1")
+    headers, _, _ = _parse(raw)
+    assert headers["Subject"].endswith(" ok")
@@ -0,0 +1,66 @@
+import asyncio
+from types import SimpleNamespace
+
+import orjson
+
+from forensics_fastapi.forensics.api import PipelineMonitor
+
+
+class FakeSocket:
+    def __init__(self, maxsize=PipelineMonitor.OUTBOX_SIZE):
+        self.state = SimpleNamespace(outbox=asyncio.Queue(maxsize=maxsize))
+
+
+def _drain(outbox):
+    frames = []
+    while not outbox.empty():
+        frames.append(orjson.loads(outbox.get_nowait()))
+    return frames
+
+
+def test_events_within_window_are_sent_as_one_batch_frame():
+    async def scenario():
+        monitor = PipelineMonitor()
+        socket = FakeSocket()
+        monitor.active_connections.add(socket)
+
+        await monitor.broadcast({"type": "step_start", "step": "Ingest"})
+        await monitor.broadcast({"type": "ingest_start", "count": 3, "log": "queued 3"})
+        await asyncio.sleep(monitor.BATCH_WINDOW * 4)
+        return monitor, _drain(socket.state.outbox)
+
+    monitor, frames = asyncio.run(scenario())
+    assert frames == [
+        {
+            "type": "BATCH",
+            "events": [
+                {"type": "step_start", "step": "Ingest"},
+                {"type": "ingest_start", "count": 3, "log": "queued 3"},
+            ],
+        }
+    ]
+    assert monitor.stats["queued"] == 3
+    assert monitor.stats["in_process"] == 1
+
+
+def test_single_event_is_sent_unwrapped():
+    async def scenario():
+        monitor = PipelineMonitor()
+        socket = FakeSocket()
+        monitor.active_connections.add(socket)
+        await monitor.broadcast({"type": "step_start"})
+        await asyncio.sleep(monitor.BATCH_WINDOW * 4)
+        return _drain(socket.state.outbox)
+
+    assert asyncio.run(scenario()) == [{"type": "step_start"}]
+
+
+def test_full_outbox_drops_oldest_frame():
+    async def scenario():
+        socket = FakeSocket(maxsize=2)
+        for frame in ('"a"', '"b"', '"c"', "pong"):
+            PipelineMonitor.enqueue(socket, frame)
+        outbox = socket.state.outbox
+        return [outbox.get_nowait() for _ in range(outbox.qsize())]
+
+    assert asyncio.run(scenario()) == ['"c"', "pong"]
@@ -0,0 +1,75 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from forensics_fastapi.core import worker_ai
+from forensics_fastapi.core.worker_ai import StreamInterruptedError, WorkerAI
+from forensics_fastapi.forensics.api import app
+from forensics_fastapi.forensics.cloudflare_ops import CloudflareAPIError
+
+SCHEMA = {"type": "object"}
+
+
+@pytest.fixture
+def ai():
+    return WorkerAI(account_id="acct", api_token="token")
+
+
+def _interrupted():
+    yield "partial "
+    raise StreamInterruptedError("connection reset")
+
+
+def test_stream_endpoint_returns_502_when_request_fails(monkeypatch):
+    def fail(self, prompt, model):
+        raise CloudflareAPIError("busy", status_code=503)
+
+    monkeypatch.setattr(WorkerAI, "stream_reasoning_text", fail)
+    response = TestClient(app).post("/ai/reasoning/stream", json={"prompt": "p"})
+    assert response.status_code == 502
+
+
+def test_stream_endpoint_marks_done_and_error(monkeypatch):
+    monkeypatch.setattr(WorkerAI, "stream_reasoning_text", lambda self, prompt, model: iter(["a", "b"]))
+    body = TestClient(app).post("/ai/reasoning/stream", json={"prompt": "p"}).text
+    assert body == 'data: {"delta":"a"}\n\ndata: {"delta":"b"}\n\nevent: done\ndata: {}\n\n'
+
+    monkeypatch.setattr(WorkerAI, "stream_reasoning_text", lambda self, prompt, model: _interrupted())
+    body = TestClient(app).post("/ai/reasoning/stream", json={"prompt": "p"}).text
+    assert body.startswith('data: {"delta":"partial "}\n\n')
+    assert body.endswith('event: error\ndata: {"error":"connection reset"}\n\n')
+
+
+def test_invalid_json_is_restructured_without_regenerating(ai, monkeypatch):
+    monkeypatch.setattr(ai, "_run_schema_reasoning", lambda *a: (None, "the answer is 42"))
+    monkeypatch.setattr(ai, "stream_reasoning_text", lambda *a, **k: pytest.fail("regenerated"))
+    prompts = []
+    monkeypatch.setattr(ai, "run_structured_llama", lambda prompt, **k: prompts.append(prompt) or {"ok": 1})
+
+    assert ai.run_structured_reasoning("q", SCHEMA) == {"ok": 1}
+    assert "the answer is 42" in prompts[0]
+
+
+def test_failed_request_is_not_sent_again(ai, monkeypatch):
+    calls = []
+
+    def busy(*args, **kwargs):
+        calls.append(kwargs.get("stream", False))
+        raise CloudflareAPIError("busy", status_code=503)
+
+    monkeypatch.setattr(worker_ai, "fetch_cloudflare", busy)
+    monkeypatch.setattr(worker_ai, "_retry_cf", lambda fn, *a, **k: fn(*a, **k))
+    monkeypatch.setitem(worker_ai._REASONING_MODELS_WITH_SCHEMA, "@cf/openai/gpt-oss-120b", False)
+
+    assert ai.run_structured_reasoning("q", SCHEMA) is None
+    assert calls == [True]  # the stream request only; no unstreamed retry
+
+
+def test_interrupted_stream_falls_back_to_unstreamed_call(ai, monkeypatch):
+    monkeypatch.setitem(worker_ai._REASONING_MODELS_WITH_SCHEMA, "@cf/openai/gpt-oss-120b", False)
+    monkeypatch.setattr(ai, "stream_reasoning_text", lambda *a, **k: _interrupted())
+    monkeypatch.setattr(ai, "run_reasoning_oss120b", lambda prompt, model: {"response": "full answer"})
+    prompts = []
+    monkeypatch.setattr(ai, "run_structured_llama", lambda prompt, **k: prompts.append(prompt) or {"ok": 1})
+
+    assert ai.run_structured_reasoning("q", SCHEMA) == {"ok": 1}
+    assert "full answer" in prompts[0] and "partial" not in prompts[0]
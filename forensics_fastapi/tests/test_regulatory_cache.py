@@ -0,0 +1,26 @@
+from forensics_fastapi.agents.regulatory import RegulatoryAgentBase, SfRegsAgent
+
+
+class CountingClient:
+    def __init__(self):
+        self.calls = []
+
+    def run_agent(self, agent_name, action, payload, agent_id):
+        self.calls.append(agent_id)
+        return f"{agent_id}:{payload['query']}"
+
+
+def test_tool_cache_is_per_engagement(monkeypatch):
+    monkeypatch.setattr(RegulatoryAgentBase, "_tool_caches", {})
+    client = CountingClient()
+    a, b = SfRegsAgent(client, "eng-a"), SfRegsAgent(client, "eng-b")
+
+    assert a.search_sf_code("egress") == "eng-a:egress"
+    assert b.search_sf_code("egress") == "eng-b:egress"
+    assert a.search_sf_code("egress") == "eng-a:egress"
+    assert client.calls == ["eng-a", "eng-b"]
+
+    RegulatoryAgentBase.engagement_refresh("eng-a")
+    a.search_sf_code("egress")
+    b.search_sf_code("egress")
+    assert client.calls == ["eng-a", "eng-b", "eng-a"]
@@ -0,0 +1,40 @@
+import pytest
+
+from forensics_fastapi.core.worker_ai import WorkerAI
+
+
+@pytest.fixture
+def ai(monkeypatch):
+    worker = WorkerAI()
+    calls = []
+
+    def fake_embeddings(texts, model=None):
+        calls.append(list(texts))
+        return [[0.1, 0.25, 1 / 3] for _ in texts]
+
+    monkeypatch.setattr(worker, "generate_embeddings_batched", fake_embeddings)
+    worker.calls = calls
+    return worker
+
+
+def test_search_sql_returns_placeholders_and_params(ai):
+    sql, params = ai.search_sql("roof leak'; DROP TABLE messages; --", "messages", limit=7)
+
+    assert "%(embedding)s::vector" in sql
+    assert "LIMIT %(limit)s" in sql
+    assert "DROP TABLE" not in sql
+    assert params == {"embedding": "[0.1,0.25,0.3333333333333333]", "limit": 7}
+
+
+def test_search_sql_batches_several_queries(ai):
+    statements = ai.search_sql(["a", "b"], "threads")
+
+    assert ai.calls == [["a", "b"]]
+    assert len(statements) == 2
+    assert all("FROM threads" in sql for sql, _ in statements)
+
+
+def test_search_sql_rejects_unsafe_table_name(ai):
+    with pytest.raises(ValueError):
+        ai.search_sql("q", "messages; DROP TABLE x")
+    assert ai.calls == []
@@ -0,0 +1,31 @@
+import threading
+import time
+
+from forensics_fastapi.forensics.logger import logger
+
+
+def test_flush_waits_for_queued_lines(monkeypatch):
+    sent = []
+
+    def slow_send(payload):
+        time.sleep(0.01)
+        sent.append(payload["message"])
+
+    monkeypatch.setattr(logger, "_send_webhook", slow_send)
+    for n in range(5):
+        logger.error(f"line {n}")
+
+    logger.flush(timeout=5)
+    assert sent == [f"line {n}" for n in range(5)]
+
+
+def test_flush_gives_up_at_the_deadline(monkeypatch):
+    release = threading.Event()
+    monkeypatch.setattr(logger, "_send_webhook", lambda payload: release.wait(5))
+    logger.info("stuck")
+
+    started = time.monotonic()
+    logger.flush(timeout=0.05)
+    assert time.monotonic() - started < 1
+    release.set()
+    logger.flush(timeout=5)
@@ -0,0 +1,78 @@
+import time
+
+import httpx
+import pytest
+
+from forensics_fastapi.core import worker_ai
+from forensics_fastapi.core.worker_ai import CircuitOpenError, _CircuitBreaker, _is_retryable, _retry_cf
+from forensics_fastapi.forensics.cloudflare_ops import CloudflareAPIError
+
+
+@pytest.fixture(autouse=True)
+def fresh_breaker(monkeypatch):
+    monkeypatch.setattr(worker_ai, "_CF_BREAKER", _CircuitBreaker())
+
+
+def _wrapped(exc):
+    """A ConnectionError the way fetch_cloudflare raises it."""
+    try:
+        try:
+            raise exc
+        except Exception as e:
+            raise ConnectionError(f"Failed to connect to Cloudflare API: {e}")
+    except ConnectionError as wrapped:
+        return wrapped
+
+
+def test_only_connect_phase_errors_are_retried():
+    assert _is_retryable(_wrapped(httpx.ConnectError("refused")))
+    assert _is_retryable(_wrapped(httpx.ConnectTimeout("slow connect")))
+    assert not _is_retryable(_wrapped(httpx.ReadTimeout("slow answer")))
+    assert _is_retryable(CloudflareAPIError("busy", status_code=503))
+    assert not _is_retryable(CloudflareAPIError("bad", status_code=400))
+
+
+def test_read_timeout_is_not_resent():
+    calls = []
+
+    def post():
+        calls.append(1)
+        raise _wrapped(httpx.ReadTimeout("slow answer"))
+
+    with pytest.raises(ConnectionError):
+        _retry_cf(post)
+    assert len(calls) == 1
+
+
+def test_long_retry_after_is_raised_instead_of_slept():
+    calls = []
+
+    def post():
+        calls.append(1)
+        raise CloudflareAPIError("429", status_code=429, retry_after=3600)
+
+    with pytest.raises(CloudflareAPIError):
+        _retry_cf(post)
+    assert len(calls) == 1
+
+
+def test_half_open_admits_a_single_trial_call():
+    breaker = _CircuitBreaker(fail_max=1, reset_timeout=0.01)
+    breaker.record(ok=False)
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    time.sleep(0.02)
+
+    breaker.before_call()  # the trial call
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.record(ok=False)  # trial failed: open again
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    time.sleep(0.02)
+
+    breaker.before_call()
+    breaker.record(ok=True)  # trial succeeded: closed
+    breaker.before_call()
+    breaker.before_call()
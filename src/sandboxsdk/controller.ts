@@ -601,7 +601,7 @@ export class ForensicsContainer {
 
         console.log(`[Sandbox:${this.name}] Starting FastAPI on port ${this.HTTP_PORT}...`);
         const server = await this.startProcess(
-            `python -m uvicorn ${this.API_MODULE} --host 0.0.0.0 --port ${this.HTTP_PORT}`,
+            `python -m uvicorn ${this.API_MODULE} --host 0.0.0.0 --port ${this.HTTP_PORT} --ws-ping-interval 20 --ws-ping-timeout 20`,
             {
                 cwd: this.WORK_DIR,
                 env: { "PORT": this.HTTP_PORT.toString() }